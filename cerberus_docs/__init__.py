@@ -2,10 +2,16 @@ __version__ = '0.1.0'
 
 import logging
 
-from .utils.generator import extract_schemas, import_module, generate_docs
+from .utils.generator import (
+    extract_schemas, extract_module_schemas, extract_schemas_by_name, import_module, generate_docs, render_document
+)
 from .classes.exceptions import CerberusDocsException
 from .classes.markdown_file import MarkDownFile
 from .classes.markdown_utils import MarkDownUtils
+from .classes.example_generator import ExampleGenerator
+from .classes.allowed_appendix import AllowedAppendix
 from .classes.cerberus_schema import CerberusSchema
+from .classes.schema_cache import SchemaCache
+from .classes.docs_builder import DocsBuilder
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
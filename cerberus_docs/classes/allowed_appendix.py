@@ -0,0 +1,88 @@
+import hashlib
+import threading
+from typing import Any, List, Sequence, Set, Tuple
+
+ALLOWED_APPENDIX_PREFIX: str = 'allowed-values-'
+
+
+def is_appendix_document(file_name: str) -> bool:
+    """
+    Returns if a document is an allowed values appendix. Appendices are named after a hash of their content,
+    so two builds that generate an appendix with the same name generate the same document.
+
+    Args:
+        file_name (str): File name of the document.
+    """
+    return file_name.startswith(ALLOWED_APPENDIX_PREFIX)
+
+
+class AllowedAppendix:
+    """
+    Collects allowed value lists that are too long to render inline. Every list is rendered once into its own
+    appendix document, named after a hash of the values, and every attribute that allows the same values links to it.
+    """
+    def __init__(self, threshold: int) -> None:
+        """
+        AllowedAppendix constructor
+
+        Args:
+            threshold (int): Allowed value lists with more values than the threshold are moved to an appendix.
+        """
+        self.threshold: int = threshold
+        self.documents: Set[str] = set()
+        self._pending: List[Tuple[str, str]] = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def document_name(allowed_values: Sequence[Any]) -> str:
+        """
+        Returns the file name of the appendix document of an allowed value list.
+
+        Args:
+            allowed_values (Sequence[Any]): The allowed values.
+        """
+        digest = hashlib.sha256(repr(list(allowed_values)).encode()).hexdigest()[:16]
+        return f'{ALLOWED_APPENDIX_PREFIX}{digest}.md'
+
+    @staticmethod
+    def render(allowed_values: Sequence[Any]) -> str:
+        """
+        Returns the content of the appendix document of an allowed value list.
+
+        Args:
+            allowed_values (Sequence[Any]): The allowed values.
+        """
+        values = ''.join(f'  - {value}\n' for value in allowed_values)
+        return f'\n## Allowed values\n\n{len(allowed_values)} values:\n\n{values}'
+
+    def is_collapsed(self, allowed_values: Sequence[Any]) -> bool:
+        """
+        Returns if an allowed value list is long enough to be moved to an appendix.
+
+        Args:
+            allowed_values (Sequence[Any]): The allowed values.
+        """
+        return len(allowed_values) > self.threshold
+
+    def add(self, allowed_values: Sequence[Any]) -> str:
+        """
+        Adds an allowed value list to the appendix and returns the file name of its appendix document.
+        The document is only rendered the first time the list is added.
+
+        Args:
+            allowed_values (Sequence[Any]): The allowed values.
+        """
+        file_name = self.document_name(allowed_values)
+        with self._lock:
+            if file_name not in self.documents:
+                self.documents.add(file_name)
+                self._pending.append((file_name, self.render(allowed_values)))
+        return file_name
+
+    def take_pending(self) -> List[Tuple[str, str]]:
+        """
+        Returns the file name and content of every appendix document added since the last call.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        return pending
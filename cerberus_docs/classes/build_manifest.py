@@ -0,0 +1,156 @@
+import os
+import json
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .exceptions import CerberusDocsException
+
+MANIFEST_FILE_NAME: str = 'cerberus-docs-manifest.json'
+MANIFEST_FORMAT_VERSION: int = 1
+
+
+class BuildManifest:
+    """
+    Record of a documentation build: which documents were generated from which source files.
+    Source paths are stored relative to the source directory with '/' separators,
+    so manifests from builds on different machines can be compared and merged.
+
+    The manifest also stores the dependency graph of the sources: the files of the source directory every source and
+    every file it imports import, and the hash of each of those files. The next build uses it to find the sources that
+    depend on a changed file, see :func:`.dependents`.
+    """
+    def __init__(self, shard: Optional[Tuple[int, int]] = None) -> None:
+        """
+        BuildManifest constructor
+
+        Args:
+            shard (Optional[Tuple[int, int]]): Index and count of the shard the build covered, or None for a full build.
+        """
+        self.shard: Optional[Tuple[int, int]] = shard
+        self.sources: Dict[str, Dict[str, Any]] = {}
+        self.dependencies: Dict[str, List[str]] = {}
+        self.file_hashes: Dict[str, str] = {}
+
+    @property
+    def documents(self) -> List[str]:
+        """
+        Sorted file names of every document in the build.
+        """
+        return sorted({document for source in self.sources.values() for document in source['documents']})
+
+    def add_source(self, source_path: str, classes: List[str], documents: List[str]) -> None:
+        """
+        Records the classes found in a source file and the documents generated from them.
+
+        Args:
+            source_path (str): Path of the source file relative to the source directory.
+            classes (List[str]): Names of the classes with schemas in the source file.
+            documents (List[str]): File names of the documents generated from the source file.
+        """
+        self.sources[source_path.replace(os.sep, '/')] = {'classes': sorted(classes), 'documents': sorted(documents)}
+
+    def set_dependencies(self, dependencies: Mapping[str, Iterable[str]], file_hashes: Mapping[str, str]) -> None:
+        """
+        Records the dependency graph of the sources.
+
+        Args:
+            dependencies (Mapping[str, Iterable[str]]): The files every file imports directly, by path relative to the
+                source directory.
+            file_hashes (Mapping[str, str]): Hash of every file in the graph.
+        """
+        self.dependencies = {file_path: sorted(imported) for file_path, imported in dependencies.items()}
+        self.file_hashes = dict(file_hashes)
+
+    def update(self, other: 'BuildManifest') -> None:
+        """
+        Adds the sources and dependency graph of another manifest, e.g. of another shard.
+
+        Args:
+            other (BuildManifest): The manifest to add.
+        """
+        self.sources.update(other.sources)
+        self.dependencies.update(other.dependencies)
+        self.file_hashes.update(other.file_hashes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns the manifest as a JSON serializable dict.
+        """
+        return {
+            'version': MANIFEST_FORMAT_VERSION,
+            'shard': {'index': self.shard[0], 'count': self.shard[1]} if self.shard else None,
+            'sources': {source_path: self.sources[source_path] for source_path in sorted(self.sources)},
+            'dependencies': {file_path: self.dependencies[file_path] for file_path in sorted(self.dependencies)},
+            'file_hashes': {file_path: self.file_hashes[file_path] for file_path in sorted(self.file_hashes)},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'BuildManifest':
+        """
+        Creates a BuildManifest from a dict returned by :meth:`to_dict`.
+
+        Args:
+            data (Dict[str, Any]): The manifest dict.
+
+        Raises:
+            :class:`.CerberusDocsException`: Unsupported manifest version
+        """
+        if data.get('version') != MANIFEST_FORMAT_VERSION:
+            raise CerberusDocsException(f'Unsupported manifest version {data.get("version")}')
+        shard = data.get('shard')
+        manifest = cls((shard['index'], shard['count']) if shard else None)
+        manifest.sources = data['sources']
+        manifest.dependencies = data.get('dependencies', {})
+        manifest.file_hashes = data.get('file_hashes', {})
+        return manifest
+
+    def to_json(self) -> str:
+        """
+        Returns the manifest as the JSON written to the manifest file.
+        """
+        return json.dumps(self.to_dict(), indent=2) + '\n'
+
+    def write(self, build_dir: str) -> str:
+        """
+        Writes the manifest to the build directory.
+
+        Args:
+            build_dir (str): The build directory.
+
+        Returns:
+            Path of the written manifest.
+        """
+        manifest_path = os.path.join(build_dir, MANIFEST_FILE_NAME)
+        with open(manifest_path, 'w', encoding='utf-8') as manifest_file:
+            manifest_file.write(self.to_json())
+        return manifest_path
+
+    @classmethod
+    def read_if_exists(cls, build_dir: str) -> Optional['BuildManifest']:
+        """
+        Reads the manifest of a build directory, or returns None if there is no readable manifest of the current
+        version.
+
+        Args:
+            build_dir (str): The build directory.
+        """
+        try:
+            return cls.read(build_dir)
+        except (CerberusDocsException, OSError, ValueError, KeyError):
+            return None
+
+    @classmethod
+    def read(cls, build_dir: str) -> 'BuildManifest':
+        """
+        Reads the manifest of a build directory.
+
+        Args:
+            build_dir (str): The build directory.
+
+        Raises:
+            :class:`.CerberusDocsException`: No manifest found in build directory
+        """
+        manifest_path = os.path.join(build_dir, MANIFEST_FILE_NAME)
+        if not os.path.isfile(manifest_path):
+            raise CerberusDocsException(f'No manifest found in {build_dir}')
+        with open(manifest_path, 'r', encoding='utf-8') as manifest_file:
+            return cls.from_dict(json.load(manifest_file))
@@ -0,0 +1,264 @@
+import os
+import time
+import bisect
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+from .exceptions import CerberusDocsException
+
+METRICS_PREFIX: str = 'cerberus_docs'
+COUNTERS: Dict[str, str] = {
+    'files_scanned': 'Python modules found in the source directory or package.',
+    'files_imported': 'Python modules imported to extract their schemas.',
+    'files_cached': 'Python modules whose schemas were read from a cache instead of importing the module.',
+    'schemas_rendered': 'Schemas rendered into documents.',
+    'documents_written': 'Documents written to the build directory or archive.',
+    'written_bytes': 'Size of the written documents in bytes.',
+    'failures': 'Sources that failed to import, render or write.',
+}
+METRICS_FORMATS: Tuple[str, ...] = ('openmetrics', 'prometheus')
+PHASES: Tuple[str, ...] = ('discover', 'extract', 'render', 'write', 'finish')
+HISTOGRAMS: Dict[str, Tuple[str, Tuple[float, ...]]] = {
+    'import_seconds': (
+        'Time to import a python module and extract its schemas.',
+        (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    ),
+    'document_bytes': (
+        'Size of a written document in bytes.',
+        (256.0, 1024.0, 4096.0, 16384.0, 65536.0, 262144.0, 1048576.0)
+    ),
+}
+
+T = TypeVar('T')
+
+
+def _format_value(value: float) -> str:
+    return str(value) if isinstance(value, int) else repr(float(value))
+
+
+class Histogram:
+    """
+    Cumulative histogram with fixed upper bounds, like an OpenMetrics histogram.
+    """
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        """
+        Histogram constructor
+
+        Args:
+            buckets (Tuple[float, ...]): Sorted upper bounds of the buckets, without +Inf.
+        """
+        self.buckets: Tuple[float, ...] = buckets
+        self.counts: List[int] = [0] * (len(buckets) + 1)
+        self.sum: float = 0.0
+        self.count: int = 0
+
+    def observe(self, value: float) -> None:
+        """
+        Adds a value to the bucket of the lowest upper bound that is not less than the value.
+
+        Args:
+            value (float): The observed value.
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative_buckets(self) -> List[Tuple[str, int]]:
+        """
+        Returns the upper bound of every bucket, ending with +Inf, and the number of values up to that bound.
+        """
+        bounds = [repr(float(bucket)) for bucket in self.buckets] + ['+Inf']
+        cumulative: List[Tuple[str, int]] = []
+        total = 0
+        for bound, count in zip(bounds, self.counts):
+            total += count
+            cumulative.append((bound, total))
+        return cumulative
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns the cumulative buckets, sum and count as a dict.
+        """
+        return {'buckets': dict(self.cumulative_buckets()), 'sum': self.sum, 'count': self.count}
+
+
+class BuildMetrics:
+    """
+    Counters, per-phase seconds and histograms of one build, to follow trends such as the cache hit rate or the import
+    time of a source tree over many builds. The metrics are available as a dict, or as OpenMetrics text that can be
+    written to the directory of a node-exporter textfile collector.
+
+    The seconds of a phase are summed over every thread, so in a pipelined build the phases overlap and can add up to
+    more than the duration of the build. Metrics can be recorded from several threads.
+    """
+    def __init__(self) -> None:
+        """
+        BuildMetrics constructor. The duration of the build is measured from here until :meth:`stop`.
+        """
+        self.counters: Dict[str, int] = dict.fromkeys(COUNTERS, 0)
+        self.phase_seconds: Dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self.histograms: Dict[str, Histogram] = {name: Histogram(buckets) for name, (_, buckets) in HISTOGRAMS.items()}
+        self._start: float = time.perf_counter()
+        self.duration_seconds: Optional[float] = None
+        self.timestamp: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def count(self, name: str, value: int = 1) -> None:
+        """
+        Increments a counter.
+
+        Args:
+            name (str): One of COUNTERS.
+            value (int): Amount to add.
+        """
+        with self._lock:
+            self.counters[name] += value
+
+    def observe(self, name: str, value: float) -> None:
+        """
+        Adds a value to a histogram.
+
+        Args:
+            name (str): One of HISTOGRAMS.
+            value (float): The observed value.
+        """
+        with self._lock:
+            self.histograms[name].observe(value)
+
+    def add_seconds(self, phase: str, seconds: float) -> None:
+        """
+        Adds time spent in a phase.
+
+        Args:
+            phase (str): One of PHASES.
+            seconds (float): The time spent.
+        """
+        with self._lock:
+            self.phase_seconds[phase] += seconds
+
+    @contextmanager
+    def phase(self, phase: str) -> Iterator[None]:
+        """
+        Context manager that adds the time spent in its block to a phase.
+
+        Args:
+            phase (str): One of PHASES.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_seconds(phase, time.perf_counter() - start)
+
+    def timed(self, phase: str, items: Iterable[T]) -> Iterator[T]:
+        """
+        Yields the items of an iterable, adding the time spent producing every item to a phase. The time spent by the
+        consumer between items is not included, so lazily generated items can be timed while they are consumed.
+
+        Args:
+            phase (str): One of PHASES.
+            items (Iterable[T]): The items, e.g. a generator.
+        """
+        iterator = iter(items)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.add_seconds(phase, time.perf_counter() - start)
+                return
+            self.add_seconds(phase, time.perf_counter() - start)
+            yield item
+
+    def stop(self) -> None:
+        """
+        Records the duration and the end time of the build.
+        """
+        self.duration_seconds = time.perf_counter() - self._start
+        self.timestamp = time.time()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns every metric as a dict with the keys counters, phase_seconds, histograms, duration_seconds and
+        timestamp. The duration and timestamp are None until the build is stopped.
+        """
+        with self._lock:
+            return {
+                'counters': dict(self.counters),
+                'phase_seconds': dict(self.phase_seconds),
+                'histograms': {name: histogram.to_dict() for name, histogram in self.histograms.items()},
+                'duration_seconds': self.duration_seconds,
+                'timestamp': self.timestamp,
+            }
+
+    def to_openmetrics(self) -> str:
+        """
+        Returns every metric in the OpenMetrics text format, ending with the # EOF marker.
+        """
+        return self._to_text(openmetrics=True)
+
+    def to_prometheus(self) -> str:
+        """
+        Returns every metric in the Prometheus text format 0.0.4, which the textfile collector of the Prometheus node
+        exporter reads. Unlike OpenMetrics, the counter families are named with their _total suffix.
+        """
+        return self._to_text(openmetrics=False)
+
+    def _to_text(self, openmetrics: bool) -> str:
+        metrics = self.to_dict()
+        lines: List[str] = []
+
+        def family(name: str, metric_type: str, description: str) -> str:
+            # OpenMetrics names a counter family without the _total suffix of its sample, format 0.0.4 with it.
+            if metric_type == 'counter' and not openmetrics:
+                name = f'{name}_total'
+            lines.append(f'# TYPE {METRICS_PREFIX}_{name} {metric_type}\n')
+            lines.append(f'# HELP {METRICS_PREFIX}_{name} {description}\n')
+            return f'{METRICS_PREFIX}_{name}'
+
+        def counter(name: str, description: str) -> str:
+            metric = family(name, 'counter', description)
+            return f'{metric}_total' if openmetrics else metric
+
+        for name, description in COUNTERS.items():
+            lines.append(f'{counter(name, description)} {metrics["counters"][name]}\n')
+        metric = counter('phase_seconds', 'Time spent in every phase of the build, summed over threads.')
+        for phase, seconds in metrics['phase_seconds'].items():
+            lines.append(f'{metric}{{phase="{phase}"}} {_format_value(seconds)}\n')
+        for name, (description, _) in HISTOGRAMS.items():
+            metric = family(name, 'histogram', description)
+            histogram = metrics['histograms'][name]
+            for bound, count in histogram['buckets'].items():
+                lines.append(f'{metric}_bucket{{le="{bound}"}} {count}\n')
+            lines.append(f'{metric}_sum {_format_value(histogram["sum"])}\n')
+            lines.append(f'{metric}_count {histogram["count"]}\n')
+        if metrics['duration_seconds'] is not None:
+            metric = family('build_duration_seconds', 'gauge', 'Duration of the build.')
+            lines.append(f'{metric} {_format_value(metrics["duration_seconds"])}\n')
+            metric = family('build_timestamp_seconds', 'gauge', 'Unix time at which the build finished.')
+            lines.append(f'{metric} {_format_value(metrics["timestamp"])}\n')
+        if openmetrics:
+            lines.append('# EOF\n')
+        return ''.join(lines)
+
+    def write(self, path: str, metrics_format: str = 'openmetrics') -> None:
+        """
+        Writes the metrics as OpenMetrics text, or in the Prometheus text format 0.0.4. The file is replaced in one
+        step, so a textfile collector never reads a partly written file.
+
+        Args:
+            path (str): Path of the metrics file, e.g. a .prom file in the directory of the textfile collector.
+            metrics_format (str): One of METRICS_FORMATS. The textfile collector of the node exporter reads the
+                'prometheus' format.
+
+        Raises:
+            :class:`.CerberusDocsException`: The metrics file cannot be written
+        """
+        temporary_path = f'{path}.{os.getpid()}.tmp'
+        try:
+            with open(temporary_path, 'w', encoding='utf-8') as metrics_file:
+                metrics_file.write(self.to_openmetrics() if metrics_format == 'openmetrics' else self.to_prometheus())
+            os.replace(temporary_path, path)
+        except OSError as e:
+            raise CerberusDocsException(f'Metrics file {path} cannot be written: {e}')
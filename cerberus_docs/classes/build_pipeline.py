@@ -0,0 +1,309 @@
+import time
+import queue
+import threading
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from .exceptions import CerberusDocsException
+from .types import SchemaMap
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .docs_builder import DocsBuilder
+
+_DONE = object()
+STOP_POLL_SECONDS: float = 0.1
+
+
+class StageMetrics:
+    """
+    Counters of one pipeline stage: how many items it handled, how deep its output queue was, how long it was
+    blocked on a full output queue and how long it sat idle waiting for input.
+    """
+    def __init__(self, name: str, queue_size: int) -> None:
+        """
+        StageMetrics constructor
+
+        Args:
+            name (str): Name of the stage.
+            queue_size (int): Maximum size of the output queue of the stage.
+        """
+        self.name: str = name
+        self.queue_size: int = queue_size
+        self.items: int = 0
+        self.max_depth: int = 0
+        self.total_depth: int = 0
+        self.blocked_seconds: float = 0.0
+        self.idle_seconds: float = 0.0
+        self._lock = threading.Lock()
+
+    def record_put(self, depth: int, blocked_seconds: float) -> None:
+        """
+        Records an item put on the output queue of the stage.
+
+        Args:
+            depth (int): Depth of the output queue right after the put.
+            blocked_seconds (float): Time spent waiting for room in the output queue.
+        """
+        with self._lock:
+            self.items += 1
+            self.max_depth = max(self.max_depth, depth)
+            self.total_depth += depth
+            self.blocked_seconds += blocked_seconds
+
+    def record_get(self, idle_seconds: float) -> None:
+        """
+        Records time the stage spent waiting for an item on its input queue.
+
+        Args:
+            idle_seconds (float): Time spent waiting for input.
+        """
+        with self._lock:
+            self.idle_seconds += idle_seconds
+
+    def record_item(self) -> None:
+        """
+        Records an item handled by a stage without an output queue.
+        """
+        with self._lock:
+            self.items += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns the metrics as a dict.
+        """
+        return {
+            'items': self.items,
+            'queue_size': self.queue_size,
+            'max_depth': self.max_depth,
+            'mean_depth': self.total_depth / self.items if self.items else 0.0,
+            'blocked_seconds': self.blocked_seconds,
+            'idle_seconds': self.idle_seconds,
+        }
+
+
+class _PendingSource:
+    """
+    A rendered source whose documents are not all written yet. It is recorded in the build manifest once every
+    document was written, and dropped if a write failed.
+    """
+    def __init__(self, schema_map: SchemaMap) -> None:
+        self.schema_map: SchemaMap = schema_map
+        self.documents: List[str] = []
+        self.writes: int = 0
+        self.rendered: bool = False
+        self.failed: bool = False
+
+
+class BuildPipeline:
+    """
+    Runs a build as three overlapping stages connected by bounded queues:
+
+    * discovery: a thread that yields python modules as os.scandir finds them,
+    * render: the calling thread imports every module and renders its documents,
+    * write: a pool of threads that writes the rendered documents to the build directory.
+
+    A full queue blocks the stage that feeds it, so memory stays bounded when a later stage is the bottleneck.
+    The time a stage spends blocked on its output queue and the depth of that queue show which stage limits the build.
+    A source is recorded in the build manifest once all of its documents were written.
+    """
+    def __init__(self,
+                 builder: 'DocsBuilder',
+                 queue_size: int = 64,
+                 write_queue_size: int = 64,
+                 writers: int = 4
+                 ) -> None:
+        """
+        BuildPipeline constructor
+
+        Args:
+            builder (DocsBuilder): The builder whose source directory, cache and manifest are used.
+            queue_size (int): Maximum number of discovered modules waiting to be rendered.
+            write_queue_size (int): Maximum number of rendered documents waiting to be written.
+            writers (int): Number of writer threads.
+        """
+        self.builder: 'DocsBuilder' = builder
+        self.writers: int = max(writers, 1)
+        self.paths: queue.Queue = queue.Queue(max(queue_size, 1))
+        self.documents: queue.Queue = queue.Queue(max(write_queue_size, 1))
+        self.metrics: Dict[str, StageMetrics] = {
+            'discover': StageMetrics('discover', self.paths.maxsize),
+            'render': StageMetrics('render', self.documents.maxsize),
+            'write': StageMetrics('write', 0),
+        }
+        self.errors: List[Tuple[str, Exception]] = []
+        self._errors_lock = threading.Lock()
+        self._pending: Dict[str, _PendingSource] = {}
+        self._written: List[Tuple[str, _PendingSource]] = []
+        self._pending_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._discover_error: Optional[Exception] = None
+
+    def _offer(self, target: queue.Queue, item: Any) -> bool:
+        """
+        Puts an item on a queue, waiting for room until the pipeline is stopped, e.g. because the render stage was
+        interrupted and no longer consumes the queue.
+
+        Returns:
+            Whether the item was put on the queue.
+        """
+        while True:
+            try:
+                target.put(item, timeout=STOP_POLL_SECONDS)
+                return True
+            except queue.Full:
+                if self._stopped.is_set():
+                    return False
+
+    def _put(self, stage: str, target: queue.Queue, item: Any) -> bool:
+        """
+        Puts an item on a queue and records it in the metrics of the stage that produced it.
+
+        Returns:
+            Whether the item was put on the queue, see :meth:`_offer`.
+        """
+        start = time.perf_counter()
+        if not self._offer(target, item):
+            return False
+        self.metrics[stage].record_put(target.qsize(), time.perf_counter() - start)
+        return True
+
+    def _get(self, stage: str, source: queue.Queue) -> Any:
+        """
+        Gets an item from a queue and records the wait in the metrics of the stage that consumes it.
+        """
+        start = time.perf_counter()
+        item = source.get()
+        self.metrics[stage].record_get(time.perf_counter() - start)
+        return item
+
+    def _discover(self) -> None:
+        """
+        Discovery stage: puts every python module of the source directory on the paths queue. An error, e.g. a
+        directory that cannot be scanned, stops the pipeline and is raised by :meth:`run`.
+        """
+        try:
+            for file_path in self.builder.metrics.timed('discover', self.builder._iter_source_files()):
+                if not self._put('discover', self.paths, file_path):
+                    return
+        except Exception as e:
+            self._discover_error = e
+            self._stopped.set()
+        finally:
+            self._offer(self.paths, _DONE)
+
+    def _render(self) -> None:
+        """
+        Render stage: imports every discovered module and puts its rendered documents on the documents queue, until
+        discovery is done or the pipeline is stopped.
+        """
+        while True:
+            file_path = self._get('render', self.paths)
+            if file_path is _DONE or self._stopped.is_set():
+                break
+            try:
+                schema_map: SchemaMap = self.builder._extract(file_path)
+                self.builder._claim_documents(self.builder._source_name(file_path), schema_map)
+                pending = _PendingSource(schema_map)
+                with self._pending_lock:
+                    self._pending[file_path] = pending
+                for file_name, content in self.builder._render_docs(schema_map):
+                    with self._pending_lock:
+                        pending.documents.append(file_name)
+                        pending.writes += 1
+                    if not self._put('render', self.documents, (file_path, file_name, content)):
+                        with self._pending_lock:
+                            self._pending.pop(file_path, None)
+                        return
+                with self._pending_lock:
+                    pending.rendered = True
+                    self._complete(file_path, pending)
+            except Exception as e:
+                with self._pending_lock:
+                    self._pending.pop(file_path, None)
+                self._record_error(file_path, e)
+            self._record_written()
+
+    def _write(self) -> None:
+        """
+        Write stage: writes documents from the documents queue to the output of the builder until it receives the
+        end marker.
+        """
+        while True:
+            item = self._get('write', self.documents)
+            if item is _DONE:
+                break
+            file_path, file_name, content = item
+            error: Optional[Exception] = None
+            try:
+                self.builder._write_document(file_name, content)
+                self.metrics['write'].record_item()
+            except Exception as e:
+                error = e
+                self._record_error(file_path, e)
+            with self._pending_lock:
+                pending = self._pending.get(file_path)
+                if pending is not None:
+                    pending.writes -= 1
+                    pending.failed = pending.failed or error is not None
+                    self._complete(file_path, pending)
+
+    def _complete(self, file_path: str, pending: _PendingSource) -> None:
+        """
+        Moves a source whose documents were all rendered and written to the written sources, or drops it if a write
+        failed. Must be called with the pending lock held.
+        """
+        if not pending.rendered or pending.writes:
+            return
+        del self._pending[file_path]
+        if not pending.failed:
+            self._written.append((file_path, pending))
+
+    def _record_written(self) -> None:
+        """
+        Records the sources whose documents were all written in the build manifest. Runs in the render thread, so
+        the manifest, snapshot and search index are only updated from one thread.
+        """
+        with self._pending_lock:
+            written, self._written = self._written, []
+        for file_path, pending in written:
+            try:
+                self.builder._record(file_path, pending.schema_map, pending.documents)
+            except Exception as e:
+                self._record_error(file_path, e)
+
+    def _record_error(self, file_path: str, error: Exception) -> None:
+        with self._errors_lock:
+            self.errors.append((file_path, error))
+
+    def run(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Runs the pipeline until every module has been rendered and every document written.
+
+        Returns:
+            The metrics of every stage.
+
+        Raises:
+            :class:`.CerberusDocsException`: The source directory cannot be scanned
+        """
+        threads: List[threading.Thread] = [threading.Thread(target=self._discover, daemon=True)]
+        threads.extend(threading.Thread(target=self._write, daemon=True) for _ in range(self.writers))
+        for thread in threads:
+            thread.start()
+        try:
+            self._render()
+        finally:
+            # Unblocks the discovery thread if the render stage stopped early, e.g. on a KeyboardInterrupt.
+            self._stopped.set()
+            for _ in range(self.writers):
+                self.documents.put(_DONE)
+            for thread in threads:
+                thread.join()
+        if self._discover_error is not None:
+            raise CerberusDocsException(f'Source files cannot be discovered: {self._discover_error}')
+        self._record_written()
+        return self.get_metrics()
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the metrics of every stage, see :class:`StageMetrics`.
+        """
+        return {name: metrics.to_dict() for name, metrics in self.metrics.items()}
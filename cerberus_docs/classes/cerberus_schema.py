@@ -1,21 +1,91 @@
+import json
+from typing import Any, Callable, Dict, Hashable, Tuple, TypeVar
+
+from .frozen_schema import FrozenDict, freeze
+from .markdown_utils import MarkDownUtils
+from .schema_snapshot import SubtreeHasher, _json_default
 from .types import Schema
 
+T = TypeVar('T')
+
+_md_utils = MarkDownUtils('')
+
 
 class CerberusSchema:
     """
     A class to wrap a cerberus schema to make it possible for Cerberus-docs to find schemas with instance checking.
+
+    A frozen schema is deep frozen at construction, see :class:`.FrozenDict`, so values derived from it are computed
+    once and reused by every later call, and by every renderer the schema is passed to, e.g. in a long running process
+    that documents, validates with or serves the same schema many times.
     """
-    def __init__(self, schema: Schema) -> None:
+    def __init__(self, schema: Schema, frozen: bool = False) -> None:
         """
         CerberusSchema constructor
 
         Args:
             schema (Schema): Cerberus schema that should be recognizeable by cerberus-docs.
+            frozen (bool): Store an immutable deep copy of the schema instead of the schema itself.
+        """
+        self.schema: Schema = freeze(schema) if frozen else schema
+
+    @property
+    def frozen(self) -> bool:
+        """
+        Whether the schema is frozen.
         """
-        self.schema: Schema = schema
+        return isinstance(self.schema, FrozenDict)
 
     def to_schema(self) -> Schema:
         """
         Return the schema wrapped by the class.
         """
         return self.schema
+
+    def _derived(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """
+        Returns a value derived from the schema, computed once if the schema is frozen and on every call otherwise.
+        """
+        if isinstance(self.schema, FrozenDict):
+            return self.schema.derived(key, compute)
+        return compute()
+
+    def fingerprint(self) -> str:
+        """
+        Returns a structural hash of the schema, the same for every schema with the same attributes and rules
+        regardless of their order.
+        """
+        return self._derived('fingerprint', lambda: SubtreeHasher().hash(
+            json.loads(json.dumps(self.schema, default=_json_default))
+        ).hex())
+
+    def example(self) -> Dict[str, Any]:
+        """
+        Returns an example of valid input for the schema, frozen if the schema is frozen.
+
+        Raises:
+            :class:`.CerberusDocsException`: Type in schema not supported
+        """
+        if not self.frozen:
+            return _md_utils.example_dict(self.schema)
+        return self._derived('example_dict', lambda: freeze(_md_utils.example_dict(self.schema)))
+
+    def attributes_markdown(self, class_name: str) -> str:
+        """
+        Returns the MarkDown of every attribute of the schema, as rendered in the document of a class.
+
+        Args:
+            class_name (str): Name of the class the schema belongs to.
+        """
+        return _md_utils.render_attributes(class_name, self.schema)
+
+    def nested_sections(self, class_name: str) -> Tuple[str, ...]:
+        """
+        Returns the titles of the nested schema sections of the schema, as rendered in the document of a class.
+
+        Args:
+            class_name (str): Name of the class the schema belongs to.
+        """
+        # Imported here, as the link index imports the generator, which imports this module.
+        from .link_index import nested_sections
+        return tuple(nested_sections(class_name, self.schema))
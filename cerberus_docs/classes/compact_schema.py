@@ -0,0 +1,224 @@
+import sys
+from collections.abc import Mapping
+from typing import Any, Dict, Hashable, Iterator, Optional, Tuple, Union
+
+from .frozen_schema import FrozenDict
+from .markdown_utils import VALIDATION_RULE_PRIORITY_LIST
+from .types import Attribute, Schema, SchemaMap
+
+_RULE_RANK: Dict[str, int] = {rule: i for i, rule in enumerate(VALIDATION_RULE_PRIORITY_LIST)}
+_RULE_NAME_TUPLES: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+def _shared_rule_names(rule_names: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    Returns a shared tuple of interned rule names, so that attributes with the same set of validation rules
+    reference the same tuple object.
+
+    Args:
+        rule_names (Tuple[str, ...]): Rule names in display order.
+    """
+    interned = tuple(sys.intern(rule) for rule in rule_names)
+    return _RULE_NAME_TUPLES.setdefault(interned, interned)
+
+
+class CompactAttribute(Mapping):
+    """
+    Read-only, slotted representation of a schema attribute.
+
+    The validation rules are stored as two tuples in the display order of
+    :data:`.markdown_utils.VALIDATION_RULE_PRIORITY_LIST`, with unknown rules last in their original order, so
+    renderers do not have to sort them. Rule names are interned and the tuple of names is shared between every
+    attribute with the same rules.
+    """
+    __slots__ = ('name', 'rule_names', 'rule_values')
+
+    def __init__(self, name: str, rule_names: Tuple[str, ...], rule_values: Tuple[Any, ...]) -> None:
+        """
+        CompactAttribute constructor
+
+        Args:
+            name (str): Name of the attribute.
+            rule_names (Tuple[str, ...]): Validation rule names, already in display order.
+            rule_values (Tuple[Any, ...]): Validation rule values, in the same order as rule_names.
+        """
+        self.name: str = name
+        self.rule_names: Tuple[str, ...] = rule_names
+        self.rule_values: Tuple[Any, ...] = rule_values
+
+    @classmethod
+    def from_attribute(cls, name: str, attribute: Attribute, memo: Optional[Dict[Hashable, Any]] = None
+                       ) -> 'CompactAttribute':
+        """
+        Creates a CompactAttribute from an attribute dict. Nested schemas are converted recursively, and a nested
+        schema that is shared by several attributes is converted once, so the converted attributes share it as well.
+
+        Args:
+            name (str): Name of the attribute.
+            attribute (Attribute): The attribute to convert.
+            memo (Optional[Dict[Hashable, Any]]): Nested schemas converted so far, by id of the nested schema.
+        """
+        if memo is None:
+            memo = {}
+        unknown_rank = len(VALIDATION_RULE_PRIORITY_LIST)
+        rules = sorted(attribute.items(), key=lambda rule: _RULE_RANK.get(rule[0], unknown_rank))
+        is_list = attribute.get('type') == 'list'
+        values = []
+        for rule, value in rules:
+            if rule == 'schema' and isinstance(value, Mapping) and not isinstance(value, (CompactSchema, cls)):
+                key = (id(value), is_list)
+                if key not in memo:
+                    memo[key] = (
+                        cls.from_attribute('', value, memo) if is_list else CompactSchema.from_schema(value, memo)
+                    )
+                value = memo[key]
+            values.append(value)
+        return cls(sys.intern(name), _shared_rule_names(tuple(rule for rule, _ in rules)), tuple(values))
+
+    def __getitem__(self, rule: str) -> Any:
+        try:
+            return self.rule_values[self.rule_names.index(rule)]
+        except ValueError:
+            raise KeyError(rule)
+
+    def __contains__(self, rule: object) -> bool:
+        return rule in self.rule_names
+
+    def get(self, rule: str, default: Any = None) -> Any:
+        # Renderers look up rules most attributes do not have, which raises a KeyError in Mapping.get.
+        return self.rule_values[self.rule_names.index(rule)] if rule in self.rule_names else default
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.rule_names)
+
+    def __len__(self) -> int:
+        return len(self.rule_names)
+
+    def __repr__(self) -> str:
+        return f'CompactAttribute({self.name!r}, {dict(self.items())!r})'
+
+    def to_attribute(self, memo: Optional[Dict[int, Any]] = None) -> Attribute:
+        """
+        Returns the attribute as a plain dict, converting nested schemas back as well. A shared nested schema is
+        converted once.
+
+        Args:
+            memo (Optional[Dict[int, Any]]): Nested schemas converted so far, by id of the compact nested schema.
+        """
+        if memo is None:
+            memo = {}
+        return {rule: _thaw(value, memo) for rule, value in zip(self.rule_names, self.rule_values)}
+
+
+class CompactSchema(Mapping):
+    """
+    Read-only, slotted representation of a schema as a tuple of :class:`CompactAttribute`, with an index of the
+    attributes by name. It can be passed to :class:`.MarkDownUtils` wherever a schema dict is expected.
+    """
+    __slots__ = ('attributes', '_index')
+
+    def __init__(self, attributes: Tuple[CompactAttribute, ...]) -> None:
+        """
+        CompactSchema constructor
+
+        Args:
+            attributes (Tuple[CompactAttribute, ...]): The attributes of the schema in their original order.
+        """
+        self.attributes: Tuple[CompactAttribute, ...] = attributes
+        self._index: Dict[str, CompactAttribute] = {attribute.name: attribute for attribute in attributes}
+
+    @classmethod
+    def from_schema(cls, schema: Schema, memo: Optional[Dict[Hashable, Any]] = None) -> 'CompactSchema':
+        """
+        Creates a CompactSchema from a schema dict.
+
+        Args:
+            schema (Schema): The schema to convert.
+            memo (Optional[Dict[Hashable, Any]]): Nested schemas converted so far, see
+                :meth:`CompactAttribute.from_attribute`.
+        """
+        if memo is None:
+            memo = {}
+        return cls(tuple(
+            CompactAttribute.from_attribute(name, attribute, memo) for name, attribute in schema.items()
+        ))
+
+    def __getitem__(self, name: str) -> CompactAttribute:
+        return self._index[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return (attribute.name for attribute in self.attributes)
+
+    def __len__(self) -> int:
+        return len(self.attributes)
+
+    def items(self) -> Iterator[Tuple[str, CompactAttribute]]:
+        return ((attribute.name, attribute) for attribute in self.attributes)
+
+    def __repr__(self) -> str:
+        return f'CompactSchema({self.to_schema()!r})'
+
+    def to_schema(self, memo: Optional[Dict[int, Any]] = None) -> Schema:
+        """
+        Returns the schema as a plain dict.
+
+        Args:
+            memo (Optional[Dict[int, Any]]): Nested schemas converted so far, see :meth:`CompactAttribute.to_attribute`.
+        """
+        if memo is None:
+            memo = {}
+        return {attribute.name: attribute.to_attribute(memo) for attribute in self.attributes}
+
+
+def _thaw(value: Any, memo: Dict[int, Any]) -> Any:
+    """
+    Converts compact nested schemas back to plain dicts and returns any other value unchanged.
+
+    Args:
+        value (Any): A validation rule value.
+        memo (Dict[int, Any]): Nested schemas converted so far, by id of the compact nested schema.
+    """
+    if not isinstance(value, (CompactSchema, CompactAttribute)):
+        return value
+    if id(value) not in memo:
+        memo[id(value)] = value.to_schema(memo) if isinstance(value, CompactSchema) else value.to_attribute(memo)
+    return memo[id(value)]
+
+
+# Compact schemas, or frozen schemas, grouped by the parent class name as key.
+CompactSchemaMap = Dict[str, Tuple[Union[CompactSchema, FrozenDict], ...]]
+
+
+def compact_schema_map(schema_map: SchemaMap) -> CompactSchemaMap:
+    """
+    Converts every schema of a SchemaMap to a CompactSchema. Frozen schemas are kept as they are, since they cannot
+    change and keep their derived values, see :class:`.FrozenDict`.
+
+    Args:
+        schema_map (SchemaMap): A dict which contains schemas grouped by the parent class name as key.
+    """
+    memo: Dict[Hashable, Any] = {}
+    return {
+        sys.intern(class_name): tuple(
+            schema if isinstance(schema, FrozenDict) else CompactSchema.from_schema(schema, memo) for schema in schemas
+        )
+        for class_name, schemas in schema_map.items()
+    }
+
+
+def thaw_schema_map(compact_map: CompactSchemaMap) -> SchemaMap:
+    """
+    Converts every schema of a map returned by :func:`compact_schema_map` back to a plain schema dict. Nested schemas
+    that were shared are shared again, and frozen schemas are returned as they are.
+
+    Args:
+        compact_map (CompactSchemaMap): The compact schemas grouped by class name.
+    """
+    memo: Dict[int, Any] = {}
+    return {
+        class_name: [schema.to_schema(memo) if isinstance(schema, CompactSchema) else schema for schema in schemas]
+        for class_name, schemas in compact_map.items()
+    }
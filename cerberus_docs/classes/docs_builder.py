@@ -0,0 +1,643 @@
+import os
+import time
+from contextlib import contextmanager, nullcontext
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from .allowed_appendix import AllowedAppendix
+from .build_metrics import BuildMetrics
+from .build_manifest import BuildManifest, MANIFEST_FILE_NAME
+from .build_pipeline import BuildPipeline
+from .example_generator import ExampleGenerator
+from .exceptions import CerberusDocsException
+from .link_index import INDEX_DATA_FILE_NAME, INDEX_FILE_NAME, LinkIndex, module_name as source_module_name
+from .output_sink import OutputSink, open_output
+from .schema_cache import MemorySchemaCache, SchemaCache
+from .schema_snapshot import SNAPSHOT_FILE_NAME, SchemaSnapshot
+from .search_index import SearchIndex
+from .schema_stats import SchemaStats
+from .types import SchemaMap
+from ..utils.dependencies import DependencyRecorder, changed_files, dependents, file_hash, reachable
+from ..utils.generator import (
+    document_name, extract_schemas, extract_schemas_by_name, generate_docs, iter_package_modules, render_docs
+)
+from ..utils.memory import evicting_modules
+from ..utils.shards import shard_index
+
+
+class DocsBuilder:
+    """
+    Class that finds every python module in a source directory and generates documentation for its CerberusSchemas.
+    The counters and timings of every build are collected in :attr:`metrics`, see :class:`.BuildMetrics`.
+
+    The files of the source directory that every source imports are recorded in the build manifest. With a cache, the
+    next build in the same build directory extracts the schemas of every source that imports a changed file again,
+    directly or through other files, instead of using its cached schemas.
+    """
+    def __init__(self,
+                 source_dir: str,
+                 build_dir: str,
+                 cache_dir: Optional[str] = None,
+                 shard: Optional[Tuple[int, int]] = None,
+                 stream: bool = False,
+                 example_generator: Optional[ExampleGenerator] = None,
+                 evict_modules: bool = False,
+                 keep_modules: Sequence[str] = (),
+                 allowed_threshold: Optional[int] = None,
+                 snapshot: bool = False,
+                 archive: Optional[str] = None,
+                 precompress: bool = False,
+                 memory_cache: Optional[MemorySchemaCache] = None,
+                 stub_imports: Optional[Sequence[str]] = None,
+                 stats: Optional[SchemaStats] = None,
+                 index: bool = False,
+                 search_db: Optional[str] = None
+                 ) -> None:
+        """
+        DocsBuilder constructor
+
+        Args:
+            source_dir (str): The directory with the source code.
+            build_dir (str): The directory where the generated docs should be saved.
+            cache_dir (Optional[str]): Directory of the persistent schema cache. Caching is disabled if omitted.
+            shard (Optional[Tuple[int, int]]): Index and count of the shard to build. Only the source files assigned
+                to the shard are processed. Every source file is processed if omitted.
+            stream (bool): Write documents as they are generated instead of building them in memory first.
+            example_generator (Optional[ExampleGenerator]): Generator of the schema input examples.
+            evict_modules (bool): Remove every module in the source directory imported while extracting the schemas
+                of a source file from sys.modules once its schemas are extracted, so memory stays flat over large
+                source trees. Third-party and extension modules stay loaded.
+            keep_modules (Sequence[str]): Modules and packages in the source directory that are never evicted.
+            allowed_threshold (Optional[int]): Allowed value lists with more values than the threshold are rendered
+                once into a shared appendix document and linked to. Every list is rendered inline if omitted.
+            snapshot (bool): Write the extracted schemas to a snapshot in the build directory, which can be compared
+                with the snapshot of another build, see :func:`.diff_snapshots`.
+            archive (Optional[str]): Write every document, the manifest and the snapshot into a .zip, .tar, .tar.gz
+                or .tgz archive at this path instead of into the build directory.
+            precompress (bool): Also write a gzip compressed .gz sibling of every document in the build directory.
+            memory_cache (Optional[MemorySchemaCache]): In-memory schema cache shared by the builds of a long running
+                process, checked before the schema cache.
+            stub_imports (Optional[Sequence[str]]): Import source files with placeholder modules for these top-level
+                packages, or for every third-party package if empty, and retry with real imports if that fails, see
+                :func:`.extract_schemas`. Imports are not stubbed if omitted.
+            stats (Optional[SchemaStats]): Collects the cost counters of every rendered schema.
+            index (bool): Extract every source before rendering, name the documents of classes that share a name
+                after their module, and write an index page of every class and nested schema section, see
+                :class:`.LinkIndex`.
+            search_db (Optional[str]): Path of an SQLite database to store every attribute in, with a full-text
+                index, see :class:`.SearchIndex`. Only the rows of changed sources are updated.
+
+        Raises:
+            :class:`.CerberusDocsException`: Invalid combination of output options, unsupported archive type, or
+                search database that cannot be opened
+        """
+        if stream and (archive or precompress):
+            raise CerberusDocsException('Streaming cannot be combined with an archive or precompression')
+        if stream and (stats or index):
+            raise CerberusDocsException('Streaming cannot be combined with stats or an index')
+        if shard and index:
+            raise CerberusDocsException('An index cannot be built for a shard')
+        self.source_dir: str = source_dir
+        self.build_dir: str = build_dir
+        self.schema_cache: Optional[SchemaCache] = SchemaCache(cache_dir) if cache_dir else None
+        self.memory_cache: Optional[MemorySchemaCache] = memory_cache
+        self.shard: Optional[Tuple[int, int]] = shard
+        self.stream: bool = stream
+        self.md_utils_options: Dict[str, Any] = {
+            'example_generator': example_generator,
+            'allowed_appendix': AllowedAppendix(allowed_threshold) if allowed_threshold is not None else None,
+            'stats': stats,
+        }
+        self.evict_modules: bool = evict_modules
+        self.keep_modules: Sequence[str] = keep_modules
+        self.stub_imports: Optional[Sequence[str]] = stub_imports
+        self.manifest: BuildManifest = BuildManifest(shard)
+        self.snapshot: Optional[SchemaSnapshot] = SchemaSnapshot() if snapshot else None
+        self.archive: Optional[str] = archive
+        self.output: OutputSink = open_output(build_dir, archive, precompress)
+        self.link_index: Optional[LinkIndex] = None
+        if index:
+            self.link_index = LinkIndex(None if archive else LinkIndex.read(build_dir))
+        self.search_index: Optional[SearchIndex] = SearchIndex(search_db) if search_db else None
+        self.metrics: BuildMetrics = BuildMetrics()
+        previous = None if archive else BuildManifest.read_if_exists(build_dir)
+        self._previous_dependencies: Dict[str, List[str]] = previous.dependencies if previous else {}
+        self._previous_hashes: Dict[str, str] = previous.file_hashes if previous else {}
+        self.dependencies: Dict[str, Set[str]] = {
+            file_path: set(imported) for file_path, imported in self._previous_dependencies.items()
+        }
+        self._recorded: Set[str] = set()
+        self._document_sources: Dict[str, str] = {}
+        self._carried_sources: Set[str] = set()
+        self.invalidated_sources: Set[str] = set()
+        if previous and (self.schema_cache or self.memory_cache is not None):
+            changed = changed_files(previous.file_hashes, source_dir)
+            self.invalidated_sources = dependents(previous.dependencies, changed)
+
+    def _relative_path(self, file_path: str) -> str:
+        """
+        Returns the path of a source file relative to the source directory.
+
+        Args:
+            file_path (str): Path of the source file.
+        """
+        return os.path.relpath(file_path, self.source_dir)
+
+    def _source_name(self, file_path: str) -> str:
+        """
+        Returns the path of a source file relative to the source directory with '/' separators, as recorded in the
+        manifest and the dependency graph.
+
+        Args:
+            file_path (str): Path of the source file.
+        """
+        return self._relative_path(file_path).replace(os.sep, '/')
+
+    def _in_shard(self, file_path: str) -> bool:
+        """
+        Returns if a source file is assigned to the shard of this build.
+
+        Args:
+            file_path (str): Path of the source file.
+        """
+        return self._source_in_shard(self._relative_path(file_path))
+
+    def _source_in_shard(self, source_name: str) -> bool:
+        """
+        Returns if a source, given as a path relative to the source directory or a module name, is assigned to the
+        shard of this build.
+
+        Args:
+            source_name (str): The relative path or module name of the source.
+        """
+        if not self.shard:
+            return True
+        index, count = self.shard
+        return shard_index(source_name, count) == index
+
+    def _iter_source_files(self, directory: Optional[str] = None) -> Iterator[str]:
+        """
+        Yields the path of every python module in the source directory as soon as it is found.
+
+        Args:
+            directory (Optional[str]): The directory to scan. Defaults to the source directory.
+        """
+        subdirectories: List[str] = []
+        with os.scandir(directory or self.source_dir) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirectories.append(entry.path)
+                elif entry.name.endswith('.py') and self._in_shard(entry.path):
+                    self.metrics.count('files_scanned')
+                    yield entry.path
+        for subdirectory in subdirectories:
+            yield from self._iter_source_files(subdirectory)
+
+    def _extract(self, file_path: str) -> SchemaMap:
+        """
+        Returns the schemas of a python module, from the memory cache or the schema cache if it holds an entry for
+        the current source and the current content of the files it imports.
+
+        Args:
+            file_path (str): Path of the python module.
+        """
+        with self.metrics.phase('extract'):
+            schema_map: Optional[SchemaMap] = None
+            dependencies: List[str] = []
+            invalidated = self._source_name(file_path) in self.invalidated_sources
+            if not invalidated and self.memory_cache is not None:
+                schema_map = self.memory_cache.get(file_path)
+                if schema_map is not None:
+                    self.metrics.count('files_cached')
+                    return schema_map
+            cached = self.schema_cache.lookup(file_path) if not invalidated and self.schema_cache else None
+            if cached is None:
+                with evicting_modules(self.keep_modules, self.source_dir) if self.evict_modules else nullcontext():
+                    schema_map = self._import_source(file_path)
+                dependencies = self._dependency_paths(file_path)
+                if self.schema_cache:
+                    self.schema_cache.put(file_path, schema_map, dependencies)
+            else:
+                schema_map, dependencies = cached
+                self.metrics.count('files_cached')
+            # Hits of the memory cache returned above, so entries are only compacted and copied once.
+            if self.memory_cache is not None:
+                self.memory_cache.put(file_path, schema_map, dependencies)
+            return schema_map
+
+    def _dependency_paths(self, file_path: str) -> List[str]:
+        """
+        Returns the paths of the files of the source directory a source file imports, directly or through other
+        files, as recorded in the dependency graph.
+
+        Args:
+            file_path (str): Path of the source file.
+        """
+        source_name = self._source_name(file_path)
+        return [
+            os.path.join(self.source_dir, *dependency.split('/'))
+            for dependency in sorted(reachable(self.dependencies, [source_name]) - {source_name})
+        ]
+
+    def _import_source(self, file_path: str) -> SchemaMap:
+        """
+        Imports a python module to extract its schemas and records the files of the source directory it imports in
+        the dependency graph, replacing the dependencies recorded by a previous build.
+
+        Args:
+            file_path (str): Path of the python module.
+        """
+        source_name = self._source_name(file_path)
+        self.dependencies[source_name] = set()
+        self._recorded.add(source_name)
+        recorder = DependencyRecorder(self.source_dir)
+        try:
+            with recorder:
+                return self._import(
+                    partial(extract_schemas, os.path.basename(file_path), file_path, self.stub_imports, self.source_dir)
+                )
+        finally:
+            for importer, imported in recorder.dependencies.items():
+                # Files imported for the first time in this build were executed, so their imports were recorded.
+                if importer not in self._recorded:
+                    self.dependencies[importer] = set()
+                    self._recorded.add(importer)
+                self.dependencies[importer].update(imported)
+
+    def _extract_module(self, module_name: str) -> SchemaMap:
+        """
+        Returns the schemas of an importable module.
+
+        Args:
+            module_name (str): Dotted name of the module.
+        """
+        with self.metrics.phase('extract'):
+            return self._import(partial(extract_schemas_by_name, module_name))
+
+    def _import(self, extract: Callable[[], SchemaMap]) -> SchemaMap:
+        """
+        Imports a module to extract its schemas and records the import in the metrics, also if it fails.
+
+        Args:
+            extract (Callable[[], SchemaMap]): Function that imports the module and returns its schemas.
+        """
+        start = time.perf_counter()
+        try:
+            return extract()
+        finally:
+            self.metrics.count('files_imported')
+            self.metrics.observe('import_seconds', time.perf_counter() - start)
+
+    def _generate(self, file_path: str, schema_map: SchemaMap) -> None:
+        """
+        Generates the documentation of a SchemaMap and records it in the build manifest.
+
+        Args:
+            file_path (str): Path of the source file the schemas were extracted from.
+            schema_map (SchemaMap): The schemas to generate documentation for.
+        """
+        self._claim_documents(self._source_name(file_path), schema_map)
+        self._record(file_path, schema_map, self._write_docs(schema_map))
+
+    def _claim_documents(self, source_name: str, schema_map: SchemaMap,
+                         document_names: Optional[Dict[str, str]] = None) -> None:
+        """
+        Claims the document of every class of a source before it is rendered, so a class with the same name in
+        another source fails instead of overwriting the document. Without an index, documents are named after the
+        bare class name, see :class:`.LinkIndex` for qualified names.
+
+        Args:
+            source_name (str): The relative path or module name of the source.
+            schema_map (SchemaMap): The schemas extracted from the source.
+            document_names (Optional[Dict[str, str]]): File name of the document of every class.
+
+        Raises:
+            :class:`.CerberusDocsException`: Another source of the build generates a document with the same name
+        """
+        claimed: Dict[str, str] = {}
+        for class_name in schema_map:
+            file_name = document_names[class_name] if document_names else document_name(class_name)
+            owner = self._document_sources.get(file_name, source_name)
+            if owner != source_name:
+                raise CerberusDocsException(
+                    f'{file_name} is already generated by {owner}, '
+                    'build with --index to name the documents of both after their module'
+                )
+            claimed[file_name] = source_name
+        self._document_sources.update(claimed)
+
+    def _write_docs(self, schema_map: SchemaMap, document_names: Optional[Dict[str, str]] = None) -> List[str]:
+        """
+        Generates the documentation of a SchemaMap and writes it to the output of the build.
+
+        Args:
+            schema_map (SchemaMap): The schemas to generate documentation for.
+            document_names (Optional[Dict[str, str]]): File name of the document of every class.
+
+        Returns:
+            The file names of the generated documents.
+        """
+        if self.stream:
+            with self.metrics.phase('render'):
+                documents = generate_docs(schema_map, self.build_dir, stream=True, **self.md_utils_options)
+            # Counted once every schema was rendered and written, so a failed render is not counted.
+            self.metrics.count('schemas_rendered', sum(len(schemas) for schemas in schema_map.values()))
+            for file_name in documents:
+                self._count_document(os.path.getsize(os.path.join(self.build_dir, file_name)))
+            return documents
+        documents = []
+        for file_name, content in self._render_docs(schema_map, document_names):
+            self._write_document(file_name, content)
+            documents.append(file_name)
+        return documents
+
+    def _render_docs(self, schema_map: SchemaMap, document_names: Optional[Dict[str, str]] = None
+                     ) -> Iterator[Tuple[str, str]]:
+        """
+        Yields the file name and content of every document of a SchemaMap as it is rendered, see :func:`.render_docs`.
+        The schemas of a class are counted as rendered once its document is rendered.
+
+        Args:
+            schema_map (SchemaMap): The schemas to generate documentation for.
+            document_names (Optional[Dict[str, str]]): File name of the document of every class.
+        """
+        schema_counts = {
+            document_names[class_name] if document_names else document_name(class_name): len(schemas)
+            for class_name, schemas in schema_map.items()
+        }
+        for file_name, content in self.metrics.timed(
+                'render', render_docs(schema_map, document_names, **self.md_utils_options)):
+            # Appendix documents of allowed values have no schemas of their own.
+            self.metrics.count('schemas_rendered', schema_counts.pop(file_name, 0))
+            yield file_name, content
+
+    def _write_document(self, file_name: str, content: str) -> None:
+        """
+        Writes a document to the output of the build.
+
+        Args:
+            file_name (str): File name of the document.
+            content (str): Content of the document.
+        """
+        with self.metrics.phase('write'):
+            self.output.write(file_name, content)
+        self._count_document(len(content.encode('utf-8')))
+
+    def _count_document(self, size: int) -> None:
+        self.metrics.count('documents_written')
+        self.metrics.count('written_bytes', size)
+        self.metrics.observe('document_bytes', size)
+
+    def _failed(self, source_name: str, error: Exception) -> None:
+        """
+        Reports a source that failed to build and counts it in the metrics.
+
+        Args:
+            source_name (str): Path or module name of the source.
+            error (Exception): The error.
+        """
+        self.metrics.count('failures')
+        self._carry_over(source_name)
+        print(f'{source_name} failed: {error}')
+
+    def _carry_over(self, source_name: str) -> None:
+        """
+        Keeps the dependencies and file hashes the previous build recorded for a source that was skipped or failed,
+        so it stays invalidated until it is built again.
+
+        Args:
+            source_name (str): Path, relative path or module name of the source.
+        """
+        if os.path.isabs(source_name):
+            source_name = self._source_name(source_name)
+        self._carried_sources.add(source_name.replace(os.sep, '/'))
+
+    def _record(self, file_path: str, schema_map: SchemaMap, documents: List[str]) -> None:
+        """
+        Records the documents generated from a source file in the build manifest.
+
+        Args:
+            file_path (str): Path of the source file the schemas were extracted from.
+            schema_map (SchemaMap): The schemas extracted from the source file.
+            documents (List[str]): File names of the generated documents.
+        """
+        self._record_source(self._relative_path(file_path), schema_map, documents)
+
+    def _record_source(self, source_name: str, schema_map: SchemaMap, documents: List[str]) -> None:
+        """
+        Records the documents generated from a source in the build manifest and its schemas in the snapshot.
+
+        Args:
+            source_name (str): The relative path or module name of the source.
+            schema_map (SchemaMap): The schemas extracted from the source.
+            documents (List[str]): File names of the generated documents.
+        """
+        if schema_map:
+            self.manifest.add_source(source_name, list(schema_map), documents)
+            if self.snapshot:
+                self.snapshot.add(schema_map, source_module_name(source_name))
+            if self.search_index:
+                document_names = self.link_index.document_names(source_name) if self.link_index else {
+                    class_name: document_name(class_name) for class_name in schema_map
+                }
+                self.search_index.add(source_name, schema_map, document_names)
+
+    def _finish(self) -> None:
+        """
+        Writes the build manifest, and the snapshot and index if enabled, to the build directory or archive, commits
+        the search database, closes the output and stops the metrics.
+        """
+        with self.metrics.phase('finish'):
+            self._record_dependencies()
+            self._write_build_files()
+        self.metrics.stop()
+
+    def _record_dependencies(self) -> None:
+        """
+        Records the dependency graph of the sources in the manifest, with the hash of every file in it. Files that are
+        no longer imported by any source are left out. The files imported by a skipped or failed source keep the
+        edges and hashes of the previous build, so a change that invalidated the source still does in the next build.
+        """
+        carried = reachable(self._previous_dependencies, self._carried_sources)
+        for file_path in carried:
+            self.dependencies.setdefault(file_path, set()).update(self._previous_dependencies.get(file_path, ()))
+        file_hashes: Dict[str, str] = {}
+        for file_path in reachable(self.dependencies, set(self.manifest.sources) | self._carried_sources):
+            source_hash = self._previous_hashes.get(file_path) if file_path in carried else None
+            if source_hash is None:
+                source_hash = file_hash(os.path.join(self.source_dir, *file_path.split('/')))
+            if source_hash is not None:
+                file_hashes[file_path] = source_hash
+        self.manifest.set_dependencies(
+            {file_path: self.dependencies.get(file_path, set()) for file_path in file_hashes}, file_hashes
+        )
+
+    def _write_build_files(self) -> None:
+        if self.link_index:
+            self.output.write(INDEX_FILE_NAME, self.link_index.render())
+        if self.archive:
+            self.output.write(MANIFEST_FILE_NAME, self.manifest.to_json())
+            if self.snapshot:
+                self.output.write(SNAPSHOT_FILE_NAME, ''.join(self.snapshot.iter_lines()))
+        else:
+            self.manifest.write(self.build_dir)
+            if self.snapshot:
+                self.snapshot.write(self.build_dir)
+            if self.link_index:
+                with open(os.path.join(self.build_dir, INDEX_DATA_FILE_NAME), 'w', encoding='utf-8') as index_file:
+                    index_file.write(self.link_index.to_json())
+        if self.search_index:
+            # A shard only adds its own sources, so the rows of the other shards are kept.
+            self.search_index.close(remove_unseen=self.shard is None)
+        self.output.close()
+
+    @contextmanager
+    def _rolling_back(self) -> Iterator[None]:
+        """
+        Rolls back the search database if the build fails, so it keeps the rows of the previous build.
+        """
+        try:
+            yield
+        except BaseException:
+            if self.search_index:
+                self.search_index.abort()
+            raise
+
+    def _build_indexed(self, sources: Iterator[Tuple[str, Callable[[], SchemaMap]]]) -> None:
+        """
+        Extracts the schemas of every source first, adds them to the link index in one pass and then generates the
+        documentation with the document names assigned by the index.
+
+        Args:
+            sources (Iterator[Tuple[str, Callable[[], SchemaMap]]]): The relative path or module name of every source
+                and a function that extracts its schemas.
+        """
+        schema_maps: Dict[str, SchemaMap] = {}
+        for source_name, extract in sources:
+            try:
+                schema_maps[source_name] = extract()
+            except Exception as e:
+                self._failed(source_name, e)
+        self.link_index.add_sources(schema_maps)
+        for source_name, schema_map in schema_maps.items():
+            try:
+                document_names = self.link_index.document_names(source_name)
+                self._claim_documents(source_name, schema_map, document_names)
+                documents = self._write_docs(schema_map, document_names)
+                self._record_source(source_name, schema_map, documents)
+            except Exception as e:
+                self._failed(source_name, e)
+        self._finish()
+
+    def build(self) -> None:
+        """
+        Extracts the schemas of every python module in the source directory and generates their documentation.
+        """
+        with self._rolling_back():
+            if self.link_index:
+                self._build_indexed(
+                    (self._relative_path(file_path), partial(self._extract, file_path))
+                    for file_path in self.metrics.timed('discover', self._iter_source_files())
+                )
+                return
+            for file_path in self.metrics.timed('discover', self._iter_source_files()):
+                try:
+                    schema_map: SchemaMap = self._extract(file_path)
+                    self._generate(file_path, schema_map)
+                except Exception as e:
+                    self._failed(file_path, e)
+            self._finish()
+
+    def build_package(self, package_name: str) -> None:
+        """
+        Like build, but finds the modules of an importable package by name instead of in the source directory,
+        so packages installed as wheels or zip files can be documented. Modules that are already imported are reused,
+        and only classes defined in a module are documented, not classes it imports. Sources are recorded in the
+        manifest by module name. The schema cache and module eviction are not used. Subpackages that fail to import
+        are reported as failed sources.
+
+        Args:
+            package_name (str): Dotted name of the package.
+
+        Raises:
+            :class:`.CerberusDocsException`: The package cannot be imported
+        """
+        with self._rolling_back():
+            import_errors: Dict[str, Exception] = {}
+            try:
+                with self.metrics.phase('discover'):
+                    module_names = list(iter_package_modules(package_name, import_errors))
+            except ImportError as e:
+                raise CerberusDocsException(f'Package {package_name} cannot be imported: {e}')
+            for module_name, error in import_errors.items():
+                if self._source_in_shard(module_name):
+                    self.metrics.count('files_scanned')
+                    self._failed(module_name, error)
+            if self.link_index:
+                self.metrics.count('files_scanned', len(module_names))
+                self._build_indexed(
+                    (module_name, partial(self._extract_module, module_name)) for module_name in module_names
+                )
+                return
+            for module_name in module_names:
+                if not self._source_in_shard(module_name):
+                    continue
+                self.metrics.count('files_scanned')
+                try:
+                    schema_map: SchemaMap = self._extract_module(module_name)
+                    self._claim_documents(module_name, schema_map)
+                    self._record_source(module_name, schema_map, self._write_docs(schema_map))
+                except Exception as e:
+                    self._failed(module_name, e)
+            self._finish()
+
+    def build_pipelined(self, queue_size: int = 64, write_queue_size: int = 64, writers: int = 4
+                        ) -> Dict[str, Dict[str, Any]]:
+        """
+        Like build, but overlaps discovery, import and rendering, and writing, see :class:`.BuildPipeline`.
+
+        Args:
+            queue_size (int): Maximum number of discovered modules waiting to be rendered.
+            write_queue_size (int): Maximum number of rendered documents waiting to be written.
+            writers (int): Number of writer threads.
+
+        Returns:
+            The queue-depth and timing metrics of every stage.
+        """
+        with self._rolling_back():
+            pipeline = BuildPipeline(self, queue_size=queue_size, write_queue_size=write_queue_size, writers=writers)
+            metrics = pipeline.run()
+            for file_path, error in pipeline.errors:
+                self._failed(file_path, error)
+            self._finish()
+            return metrics
+
+    def build_from_cache(self) -> None:
+        """
+        Generates documentation straight from the schema cache without importing any module.
+        Entries whose source file has changed since it was cached, or that belong to another shard, are skipped, and
+        so are entries of source files that are deleted or outside the source directory.
+
+        Raises:
+            :class:`.CerberusDocsException`: No cache directory provided to DocsBuilder
+        """
+        with self._rolling_back():
+            if not self.schema_cache:
+                raise CerberusDocsException('No cache directory provided to DocsBuilder')
+            for source_path, schema_map in self.schema_cache.entries(self.source_dir):
+                if not self._in_shard(source_path):
+                    continue
+                if schema_map is None:
+                    print(f'{source_path} skipped: cache entry is out of date')
+                    self._carry_over(source_path)
+                    continue
+                if self._source_name(source_path) in self.invalidated_sources:
+                    print(f'{source_path} skipped: an imported module changed')
+                    self._carry_over(source_path)
+                    continue
+                self.metrics.count('files_cached')
+                try:
+                    self._generate(source_path, schema_map)
+                except Exception as e:
+                    self._failed(source_path, e)
+            self._finish()
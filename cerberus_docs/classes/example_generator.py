@@ -0,0 +1,431 @@
+import re
+import math
+import base64
+import random
+import string
+import datetime
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from .exceptions import CerberusDocsException
+from .types import Attribute, Schema
+
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:  # pragma: no cover
+    import sre_parse
+
+DEFAULT_VALUE_TYPE_MAP: Dict[str, Any] = {
+    'string': 'str',
+    'boolean': True,
+    'binary': base64.b64encode(b'example binary').decode(),
+    'date': datetime.date(2022, 1, 1),
+    'datetime': datetime.datetime(2022, 1, 1),
+    'float': 1.2345,
+    'integer': 12345,
+    'number': 12345,
+}
+NUMBER_TYPES: Tuple[str, ...] = ('float', 'integer', 'number')
+REGEX_SAMPLE_ATTEMPTS: int = 20
+CONSTRAINED_REGEX_SAMPLE_ATTEMPTS: int = 200
+MAX_EXTRA_REPEATS: int = 3
+MAX_CONSTRAINED_EXTRA_REPEATS: int = 128
+VALIDATOR_CACHE_SIZE: int = 64
+
+_PRINTABLE: str = string.ascii_letters + string.digits
+_CATEGORY_CHARACTERS: Dict[Any, str] = {
+    sre_parse.CATEGORY_DIGIT: string.digits,
+    sre_parse.CATEGORY_NOT_DIGIT: string.ascii_letters,
+    sre_parse.CATEGORY_SPACE: ' ',
+    sre_parse.CATEGORY_NOT_SPACE: _PRINTABLE,
+    sre_parse.CATEGORY_WORD: _PRINTABLE + '_',
+    sre_parse.CATEGORY_NOT_WORD: ' -.',
+}
+
+
+def _character_set(items: List[Tuple[Any, Any]]) -> str:
+    """
+    Returns the characters a regex character class ([...]) matches, limited to printable ASCII.
+
+    Args:
+        items (List[Tuple[Any, Any]]): The parsed items of the character class.
+    """
+    characters: str = ''
+    negate = False
+    for opcode, argument in items:
+        if opcode == sre_parse.NEGATE:
+            negate = True
+        elif opcode == sre_parse.LITERAL:
+            characters += chr(argument)
+        elif opcode == sre_parse.RANGE:
+            characters += ''.join(chr(code) for code in range(argument[0], min(argument[1], argument[0] + 255) + 1))
+        elif opcode == sre_parse.CATEGORY:
+            characters += _CATEGORY_CHARACTERS.get(argument, '')
+    if negate:
+        return ''.join(character for character in _PRINTABLE if character not in characters)
+    return characters or 'a'
+
+
+class _SampleRandom(random.Random):
+    """
+    Source of the random choices of a regex sample, which also limits how many repetitions a repeat adds to its
+    minimum.
+    """
+    def __new__(cls, seed: str, extra_repeats: int = MAX_EXTRA_REPEATS) -> '_SampleRandom':
+        # random.Random takes the seed in __new__ and rejects extra arguments before Python 3.11
+        return super().__new__(cls, seed)
+
+    def __init__(self, seed: str, extra_repeats: int = MAX_EXTRA_REPEATS) -> None:
+        super().__init__(seed)
+        self.extra_repeats: int = extra_repeats
+
+
+def _sample_subpattern(argument: Any, rng: _SampleRandom, groups: Dict[int, str]) -> str:
+    text = _sample_regex(argument[-1], rng, groups)
+    if argument[0] is not None:
+        groups[argument[0]] = text
+    return text
+
+
+def _sample_repeat(argument: Any, rng: _SampleRandom, groups: Dict[int, str]) -> str:
+    minimum, maximum, item = argument
+    count = rng.randint(minimum, min(maximum, minimum + rng.extra_repeats))
+    return ''.join(_sample_regex(item, rng, groups) for _ in range(count))
+
+
+_SAMPLERS: Dict[Any, Callable[[Any, _SampleRandom, Dict[int, str]], str]] = {
+    sre_parse.LITERAL: lambda argument, rng, groups: chr(argument),
+    sre_parse.NOT_LITERAL: lambda argument, rng, groups: rng.choice(
+        [character for character in _PRINTABLE if ord(character) != argument]
+    ),
+    sre_parse.ANY: lambda argument, rng, groups: rng.choice(_PRINTABLE),
+    sre_parse.IN: lambda argument, rng, groups: rng.choice(_character_set(argument)),
+    sre_parse.BRANCH: lambda argument, rng, groups: _sample_regex(rng.choice(argument[1]), rng, groups),
+    sre_parse.SUBPATTERN: _sample_subpattern,
+    sre_parse.MAX_REPEAT: _sample_repeat,
+    sre_parse.MIN_REPEAT: _sample_repeat,
+    sre_parse.GROUPREF: lambda argument, rng, groups: groups.get(argument, ''),
+}
+if hasattr(sre_parse, 'POSSESSIVE_REPEAT'):  # Python 3.11+
+    _SAMPLERS[sre_parse.POSSESSIVE_REPEAT] = _sample_repeat
+    _SAMPLERS[sre_parse.ATOMIC_GROUP] = lambda argument, rng, groups: _sample_regex(argument, rng, groups)
+
+
+def _sample_regex(pattern: Any, rng: _SampleRandom, groups: Dict[int, str]) -> str:
+    """
+    Returns a random string matching a parsed regex. Anchors and lookarounds produce no text.
+
+    Args:
+        pattern (Any): The parsed regex, as returned by sre_parse.parse.
+        rng (_SampleRandom): Source of randomness.
+        groups (Dict[int, str]): Text matched by every group so far, for back references.
+    """
+    return ''.join(
+        _SAMPLERS[opcode](argument, rng, groups) for opcode, argument in pattern if opcode in _SAMPLERS
+    )
+
+
+def _kind(value: Any) -> type:
+    """
+    Returns the kind of value a min or max rule compares: str, datetime.date or float for any other value.
+    """
+    for kind in (str, datetime.date):
+        if isinstance(value, kind):
+            return kind
+    return float
+
+
+def _comparable_bound(bound: Any, value: Any) -> Any:
+    """
+    Returns a min or max rule in a form that can be compared with an example value, or None if they cannot be
+    compared. A date bound of a datetime value is the start of that day, and a datetime bound of a date value is
+    its date.
+
+    Args:
+        bound (Any): The value of the min or max rule.
+        value (Any): The example value.
+    """
+    if bound is None or _kind(bound) is not _kind(value):
+        return None
+    if isinstance(value, datetime.datetime) and not isinstance(bound, datetime.datetime):
+        return datetime.datetime.combine(bound, datetime.time())
+    if not isinstance(value, datetime.datetime) and isinstance(bound, datetime.datetime):
+        return bound.date()
+    return bound
+
+
+def _displayed(value: Any) -> Any:
+    """
+    Returns an example value the way it is shown in the documentation: dates and datetimes in ISO format, also inside
+    dicts and lists.
+
+    Args:
+        value (Any): The example value, as validated.
+    """
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return {key: _displayed(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_displayed(item) for item in value]
+    return value
+
+
+class ExampleGenerator:
+    """
+    Generates examples of valid input for schemas.
+
+    Examples are deterministic for a given seed and honor the type, default, allowed, regex, min, max, minlength,
+    maxlength and nullable rules. A nullable attribute gets a value of its type, and only None if it has no supported
+    type. Date and datetime values are validated as objects and shown in ISO format. Every
+    regex is parsed once into a cached sample generator, and when validation is enabled one cerberus Validator is
+    reused per schema and thread, for the last VALIDATOR_CACHE_SIZE schemas. An ExampleGenerator can be shared by
+    threads.
+    """
+    def __init__(self, seed: int = 0, validate: bool = False) -> None:
+        """
+        ExampleGenerator constructor
+
+        Args:
+            seed (int): Seed of the random choices made for regex samples.
+            validate (bool): Validate every generated example against its schema with cerberus.Validator.
+                Requires cerberus to be installed.
+        """
+        self.seed: int = seed
+        self.validate: bool = validate
+        self._regex_samplers: Dict[str, Callable[[_SampleRandom], str]] = {}
+        self._regex_samples: Dict[Hashable, str] = {}
+        # cerberus Validators keep the state of the current validation, so every thread has its own.
+        self._local = threading.local()
+
+    def _regex_sampler(self, regex: str) -> Callable[[_SampleRandom], str]:
+        """
+        Returns the cached sample generator of a regex, parsing the regex the first time.
+
+        Args:
+            regex (str): The regex to generate samples for.
+        """
+        sampler = self._regex_samplers.get(regex)
+        if sampler is None:
+            parsed = sre_parse.parse(regex)
+            sampler = self._regex_samplers.setdefault(regex, lambda rng: _sample_regex(parsed, rng, {}))
+        return sampler
+
+    def sample_regex(self, regex: str) -> str:
+        """
+        Returns a deterministic string that fully matches a regex. Lookarounds are not generated, so the first sample
+        that fully matches out of a few attempts is returned.
+
+        Args:
+            regex (str): The regex to generate a sample for.
+        """
+        sample = self._regex_samples.get(regex)
+        if sample is None:
+            sampler = self._regex_sampler(regex)
+            rng = _SampleRandom(f'{self.seed}:{regex}')
+            compiled = re.compile(regex)
+            for _ in range(REGEX_SAMPLE_ATTEMPTS):
+                sample = sampler(rng)
+                if compiled.fullmatch(sample):
+                    break
+            self._regex_samples[regex] = sample
+        return sample
+
+    def _sample_constrained_regex(self, regex: str, attribute: Attribute) -> str:
+        """
+        Returns a deterministic string that fully matches the regex of an attribute and satisfies its minlength,
+        maxlength, min and max rules. Samples are drawn until one satisfies every rule, and the first sample that
+        matches the regex is returned if none does.
+
+        Args:
+            regex (str): The regex of the attribute.
+            attribute (Attribute): The attribute to generate a sample for.
+        """
+        bounds = tuple(attribute.get(rule) for rule in ('minlength', 'maxlength', 'min', 'max'))
+        if bounds == (None, None, None, None):
+            return self.sample_regex(regex)
+        key = (regex, repr(bounds))
+        sample = self._regex_samples.get(key)
+        if sample is None:
+            sampler = self._regex_sampler(regex)
+            # A repeat may add enough repetitions to reach the minimum length.
+            extra_repeats = min(max(MAX_EXTRA_REPEATS, bounds[0] or 0), MAX_CONSTRAINED_EXTRA_REPEATS)
+            rng = _SampleRandom(f'{self.seed}:{key[1]}:{regex}', extra_repeats)
+            compiled = re.compile(regex)
+            matching: Optional[str] = None
+            for _ in range(CONSTRAINED_REGEX_SAMPLE_ATTEMPTS):
+                sample = sampler(rng)
+                if not compiled.fullmatch(sample):
+                    continue
+                if self._satisfies_bounds(sample, attribute):
+                    break
+                matching = sample if matching is None else matching
+            else:
+                sample = matching if matching is not None else self.sample_regex(regex)
+            self._regex_samples[key] = sample
+        return sample
+
+    def _satisfies_bounds(self, value: str, attribute: Attribute) -> bool:
+        return self._constrain_length(value, attribute) == value and self._constrain_range(value, attribute) == value
+
+    def _constrain_range(self, value: Any, attribute: Attribute) -> Any:
+        minimum = _comparable_bound(attribute.get('min'), value)
+        maximum = _comparable_bound(attribute.get('max'), value)
+        if maximum is not None and value > maximum:
+            value = maximum
+        if minimum is not None and value < minimum:
+            value = minimum
+        type_ = attribute.get('type')
+        if type_ == 'integer' and isinstance(value, float):
+            # The value was clamped to a float bound, so it is rounded towards the inside of the range.
+            value = math.ceil(value) if value == minimum else math.floor(value)
+        elif type_ == 'float' and isinstance(value, int) and not isinstance(value, bool):
+            value = float(value)
+        return value
+
+    def _constrain_length(self, value: str, attribute: Attribute) -> str:
+        minimum_length = attribute.get('minlength')
+        maximum_length = attribute.get('maxlength')
+        if minimum_length is not None and len(value) < minimum_length:
+            value = ((value or 'x') * minimum_length)[:minimum_length]
+        if maximum_length is not None and len(value) > maximum_length:
+            value = value[:maximum_length]
+        return value
+
+    def value(self, attribute: Attribute) -> Any:
+        """
+        Returns an example value for an attribute that is neither a dict nor a list, as shown in the documentation.
+
+        Args:
+            attribute (Attribute): The attribute to generate an example value for.
+
+        Raises:
+            :class:`.CerberusDocsException`: Type in schema not supported
+        """
+        return _displayed(self._value(attribute))
+
+    def _value(self, attribute: Attribute) -> Any:
+        default_value = attribute.get('default')
+        if default_value:
+            return default_value
+        allowed = attribute.get('allowed')
+        if allowed:
+            return allowed[0]
+        type_ = attribute.get('type')
+        regex = attribute.get('regex')
+        if regex and type_ in (None, 'string'):
+            return self._sample_constrained_regex(regex, attribute)
+        try:
+            value = DEFAULT_VALUE_TYPE_MAP[type_]
+        except (KeyError, TypeError):
+            if attribute.get('nullable'):
+                return None
+            raise CerberusDocsException(f'Type {type_} not supported')
+        value = self._constrain_range(value, attribute)
+        if type_ == 'string':
+            return self._constrain_length(value, attribute)
+        return value
+
+    def item_count(self, attribute: Attribute) -> int:
+        """
+        Returns the number of items of the example of a list attribute.
+
+        Args:
+            attribute (Attribute): The list attribute.
+        """
+        return max(attribute.get('minlength') or 1, 1)
+
+    def example(self, schema: Schema) -> Dict:
+        """
+        Generates and returns a dict which serves as an example of valid input for the schema.
+
+        Args:
+            schema (Schema): The schema to generate an example for.
+
+        Raises:
+            :class:`.CerberusDocsException`: Type in schema not supported, or the example is not valid for the schema
+                when validation is enabled.
+        """
+        result = self._example(schema)
+        if self.validate:
+            errors = self.validation_errors(schema, result)
+            if errors:
+                raise CerberusDocsException(f'Generated example is not valid: {errors}')
+        return _displayed(result)
+
+    def attribute_example(self, attribute: Attribute) -> Any:
+        """
+        Returns an example value for any attribute, as shown in the documentation. A dict without a schema is empty,
+        and a list has item_count examples of its schema, or is empty without a schema.
+
+        Args:
+            attribute (Attribute): The attribute to generate an example value for.
+
+        Raises:
+            :class:`.CerberusDocsException`: Type in schema not supported
+        """
+        return _displayed(self._attribute_example(attribute))
+
+    def _attribute_example(self, attribute: Attribute) -> Any:
+        attribute_type = attribute.get('type')
+        attribute_schema = attribute.get('schema')
+        if attribute_type == 'dict':
+            return self._example(attribute_schema) if attribute_schema else {}
+        if attribute_type == 'list':
+            if not attribute_schema:
+                return []
+            return [self._attribute_example(attribute_schema) for _ in range(self.item_count(attribute))]
+        return self._value(attribute)
+
+    def _example(self, schema: Schema) -> Dict:
+        return {
+            attribute_name: self._attribute_example(attribute) for attribute_name, attribute in schema.items()
+        }
+
+    def _validator(self, schema: Schema) -> Any:
+        """
+        Returns the cerberus Validator of a schema for the current thread, creating it the first time. Every thread
+        keeps the Validators of its last VALIDATOR_CACHE_SIZE schemas.
+
+        Args:
+            schema (Schema): The schema to validate against.
+
+        Raises:
+            :class:`.CerberusDocsException`: cerberus is not installed
+        """
+        validators: 'OrderedDict[int, Tuple[Schema, Any]]' = self._local.__dict__.setdefault(
+            'validators', OrderedDict()
+        )
+        cached = validators.get(id(schema))
+        if cached is not None and cached[0] is schema:
+            validators.move_to_end(id(schema))
+            return cached[1]
+        try:
+            from cerberus import Validator
+        except ImportError:
+            raise CerberusDocsException('cerberus must be installed to validate examples')
+        validator = Validator(schema)
+        # The schema is kept with its Validator, so its id is not reused while it is cached.
+        validators[id(schema)] = (schema, validator)
+        validators.move_to_end(id(schema))
+        if len(validators) > VALIDATOR_CACHE_SIZE:
+            validators.popitem(last=False)
+        return validator
+
+    def validation_errors(self, schema: Schema, example: Dict) -> Optional[Dict]:
+        """
+        Validates an example against its schema and returns the validation errors, or None if it is valid.
+
+        Args:
+            schema (Schema): The schema to validate against.
+            example (Dict): The example to validate.
+
+        Raises:
+            :class:`.CerberusDocsException`: cerberus is not installed
+        """
+        validator = self._validator(schema)
+        return None if validator.validate(example) else validator.errors
+
+
+default_example_generator: ExampleGenerator = ExampleGenerator()
@@ -0,0 +1,128 @@
+import threading
+from typing import Any, Callable, Dict, Hashable, NoReturn, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+def _immutable(self: Any, *args: Any, **kwargs: Any) -> NoReturn:
+    raise TypeError(f'{type(self).__name__} is immutable')
+
+
+class FrozenList(list):
+    """
+    Immutable list of a frozen schema, e.g. the allowed values of an attribute. It is still a list, so code that
+    checks for lists, serializes them to JSON or validates with them works unchanged.
+    """
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+    append = extend = insert = pop = remove = clear = sort = reverse = _immutable
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        return hash(tuple(self))
+
+    def __copy__(self) -> 'FrozenList':
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'FrozenList':
+        return self
+
+    def __reduce__(self) -> Any:
+        return type(self), (list(self),)
+
+
+class FrozenDict(dict):
+    """
+    Immutable dict of a frozen schema. It is still a dict, so it can be passed wherever a schema dict is expected.
+
+    Because it cannot change, values derived from it can be computed once and kept with it, see :meth:`derived`.
+    Copies of a frozen dict are the dict itself, so they share the derived values.
+    """
+    __slots__ = ('_derived', '_lock')
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        dict.__init__(self, *args, **kwargs)
+        self._derived: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        return hash(frozenset(self.items()))
+
+    def __copy__(self) -> 'FrozenDict':
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'FrozenDict':
+        return self
+
+    def __reduce__(self) -> Any:
+        return type(self), (dict(self),)
+
+    def derived(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """
+        Returns a value derived from the dict, computing it on the first call for the key. Concurrent first calls for
+        the same key compute the value once.
+
+        Args:
+            key (Hashable): Name of the derived value and the options it depends on.
+            compute (Callable[[], T]): Computes the value from the dict.
+        """
+        try:
+            return self._derived[key]
+        except KeyError:
+            pass
+        with self._lock:
+            if key not in self._derived:
+                self._derived[key] = compute()
+            return self._derived[key]
+
+
+def freeze(value: Any, memo: Optional[Dict[int, Any]] = None) -> Any:
+    """
+    Returns a deep frozen copy of a schema value: dicts become a :class:`FrozenDict`, lists a :class:`FrozenList` and
+    sets a frozenset. Other values are returned as is. Like copy.deepcopy, a dict or list that is referenced several
+    times is frozen once, so the copy shares it in the same places as the value, e.g. a nested schema used by several
+    attributes.
+
+    Args:
+        value (Any): A schema, attribute or validation rule value.
+        memo (Optional[Dict[int, Any]]): Frozen copy of every container frozen so far, by id of the container.
+    """
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value
+    if not isinstance(value, (dict, list, tuple, set)):
+        return value
+    if memo is None:
+        memo = {}
+    try:
+        return memo[id(value)]
+    except KeyError:
+        pass
+    if isinstance(value, dict):
+        frozen: Any = FrozenDict((key, freeze(item, memo)) for key, item in value.items())
+    elif isinstance(value, list):
+        frozen = FrozenList(freeze(item, memo) for item in value)
+    elif isinstance(value, tuple):
+        frozen = tuple(freeze(item, memo) for item in value)
+    else:
+        frozen = frozenset(freeze(item, memo) for item in value)
+    memo[id(value)] = frozen
+    return frozen
+
+
+def thaw(value: Any) -> Any:
+    """
+    Returns a mutable deep copy of a frozen schema value, with plain dicts and lists.
+
+    Args:
+        value (Any): A frozen schema, attribute or validation rule value.
+    """
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(thaw(item) for item in value)
+    return value
@@ -0,0 +1,168 @@
+import os
+import json
+from collections import Counter
+from typing import Any, Dict, Iterator, List, Mapping, Optional
+
+from .frozen_schema import FrozenDict
+from .markdown_utils import MarkDownUtils, anchor
+from .types import Schema, SchemaMap
+from ..utils.generator import document_name
+
+INDEX_FILE_NAME: str = 'index.md'
+INDEX_DATA_FILE_NAME: str = 'cerberus-docs-index.json'
+INDEX_FORMAT_VERSION: int = 1
+
+_md_utils = MarkDownUtils('')
+
+
+def module_name(source_name: str) -> str:
+    """
+    Returns the dotted module name of a source, e.g. 'models.user' for 'models/user.py'. Sources that are already
+    recorded by module name are returned as is.
+
+    Args:
+        source_name (str): Relative path or module name of the source.
+    """
+    if source_name.endswith('.py'):
+        source_name = source_name[:-3]
+    return source_name.replace('\\', '/').replace('/', '.')
+
+
+def nested_sections(class_name: str, schema: Schema, sections: Optional[Dict[int, str]] = None) -> Iterator[str]:
+    """
+    Yields the titles of the nested schema sections of a schema, in the order MarkDownUtils renders them.
+    Like MarkDownUtils, a nested schema shared by several attributes is only yielded once. The titles of a frozen
+    schema are only computed once per class name.
+
+    Args:
+        class_name (str): Name of the class or section the schema belongs to.
+        schema (Schema): The schema.
+        sections (Optional[Dict[int, str]]): Section name of every nested schema rule already yielded, by id of the
+            rule.
+    """
+    if sections is None:
+        if isinstance(schema, FrozenDict):
+            yield from schema.derived(
+                ('nested_sections', class_name), lambda: tuple(nested_sections(class_name, schema, {}))
+            )
+            return
+        sections = {}
+    additional_schemas: Dict[str, Schema] = {}
+    for attribute_name, attribute in schema.items():
+        additional_schema = _md_utils.nested_schema(attribute)
+        if additional_schema and id(attribute['schema']) not in sections:
+            sections[id(attribute['schema'])] = f'{class_name}{attribute_name.capitalize()}'
+            additional_schemas[f'{class_name}{attribute_name.capitalize()}'] = additional_schema
+    for schema_name, additional_schema in additional_schemas.items():
+        yield schema_name
+        yield from nested_sections(schema_name, additional_schema, sections)
+
+
+class LinkIndex:
+    """
+    Symbol table of every documented class and nested schema section of a build, by qualified name
+    ('module.Class' and 'module.Class.Section'). It assigns every class a document name without collisions: classes
+    keep the bare name of their class unless another module has a class with the same name, in which case both are
+    named after their qualified name.
+
+    The index renders an index page with a section per module. The symbol table and the section of every module are
+    stored next to the page, and the section of a module is only rendered again if its symbols changed.
+    """
+    def __init__(self, previous: Optional['LinkIndex'] = None) -> None:
+        """
+        LinkIndex constructor
+
+        Args:
+            previous (Optional[LinkIndex]): The index of the previous build, whose module sections are reused if the
+                symbols of the module did not change.
+        """
+        self.sources: Dict[str, Dict[str, Any]] = {}
+        self._previous: Dict[str, Dict[str, Any]] = previous.sources if previous else {}
+        self.rendered_sections: int = 0
+
+    def add_sources(self, schema_maps: Mapping[str, SchemaMap]) -> None:
+        """
+        Adds the schemas of every source of a build in one pass, replacing the sources of the previous build.
+
+        Args:
+            schema_maps (Mapping[str, SchemaMap]): The schemas extracted from every source, by relative path or
+                module name of the source.
+        """
+        class_counts = Counter(class_name for schema_map in schema_maps.values() for class_name in schema_map)
+        self.sources = {}
+        for source_name in sorted(schema_maps):
+            module = module_name(source_name)
+            classes: Dict[str, Dict[str, Any]] = {}
+            for class_name, schemas in schema_maps[source_name].items():
+                qualified_name = f'{module}.{class_name}'
+                sections = [section for schema in schemas for section in nested_sections(class_name, schema)]
+                classes[class_name] = {
+                    'qualified_name': qualified_name,
+                    'document': document_name(qualified_name if class_counts[class_name] > 1 else class_name),
+                    'sections': list(dict.fromkeys(sections)),
+                }
+            if classes:
+                self._add_source(source_name, module, classes)
+
+    def _add_source(self, source_name: str, module: str, classes: Dict[str, Dict[str, Any]]) -> None:
+        previous = self._previous.get(source_name)
+        if previous is not None and previous['classes'] == classes:
+            markdown = previous['markdown']
+        else:
+            markdown = self._render_source(module, classes)
+            self.rendered_sections += 1
+        self.sources[source_name] = {'module': module, 'classes': classes, 'markdown': markdown}
+
+    @staticmethod
+    def _render_source(module: str, classes: Dict[str, Dict[str, Any]]) -> str:
+        lines: List[str] = [f'\n## {module}\n\n']
+        for class_name in sorted(classes):
+            document = classes[class_name]['document']
+            lines.append(f'- [{class_name}]({document}#{anchor(class_name)})\n')
+            for section in classes[class_name]['sections']:
+                lines.append(f'  - [{section}]({document}#{anchor(section)})\n')
+        return ''.join(lines)
+
+    def document_names(self, source_name: str) -> Dict[str, str]:
+        """
+        Returns the document name of every class of a source.
+
+        Args:
+            source_name (str): Relative path or module name of the source.
+        """
+        classes = self.sources.get(source_name, {}).get('classes', {})
+        return {class_name: entry['document'] for class_name, entry in classes.items()}
+
+    def render(self) -> str:
+        """
+        Returns the index page, with a section per module that lists its classes and nested schema sections.
+        """
+        return '# Schema index\n' + ''.join(self.sources[source_name]['markdown'] for source_name in sorted(
+            self.sources, key=lambda source_name: self.sources[source_name]['module']
+        ))
+
+    def to_json(self) -> str:
+        """
+        Returns the symbol table and the rendered module sections as JSON.
+        """
+        return json.dumps({'version': INDEX_FORMAT_VERSION, 'sources': self.sources}, indent=2, sort_keys=True)
+
+    @classmethod
+    def read(cls, build_dir: str) -> Optional['LinkIndex']:
+        """
+        Reads the index of a previous build from the build directory, or returns None if there is no readable
+        index of the current version.
+
+        Args:
+            build_dir (str): The build directory.
+        """
+        try:
+            with open(os.path.join(build_dir, INDEX_DATA_FILE_NAME), 'r', encoding='utf-8') as index_file:
+                data = json.load(index_file)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get('version') != INDEX_FORMAT_VERSION:
+            return None
+        index = cls()
+        index.sources = data['sources']
+        return index
@@ -40,5 +40,5 @@ class MarkDownFile:
         Args:
             data (str): Content that should be written to the file.
         """
-        with open(self.file_path, self.file_mode, encoding='utf-8') as self.file:
-            self.file.write(data)
+        with open(self.file_path, self.file_mode, encoding='utf-8') as file:
+            file.write(data)
@@ -1,22 +1,87 @@
+import io
+import time
 import yaml
-import base64
-import datetime
-from collections import OrderedDict
-from typing import Optional, Dict, Any, List, Union
+from itertools import takewhile
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Hashable, List, Mapping, Union, Iterator, TextIO, Tuple
 
+from .allowed_appendix import AllowedAppendix
+from .example_generator import ExampleGenerator, default_example_generator
+from .frozen_schema import FrozenDict
 from .markdown_file import MarkDownFile
-from .types import Schema, Attribute, SortedAttribute, FormattedAttribute
-from .exceptions import CerberusDocsException
+from .schema_stats import SchemaCounters, SchemaStats
+from .types import Schema, Attribute
+
+VALIDATION_RULE_PRIORITY_LIST: Tuple[str, ...] = (
+    'required',
+    'type',
+    'regex',
+    'default',
+    'schema',
+    'allowed',
+    'meta'
+)
+_PRIORITY_RULES: frozenset = frozenset(VALIDATION_RULE_PRIORITY_LIST)
+VALIDATION_RULE_SEPARATORS: Mapping[str, str] = MappingProxyType({
+    'type': ', ',
+    'regex': ', ',
+    'default': ', '
+})
+
+MAPPING_TAG: str = 'tag:yaml.org,2002:map'
+SEQUENCE_TAG: str = 'tag:yaml.org,2002:seq'
+
+
+def anchor(title: str) -> str:
+    """
+    Returns the anchor of a MarkDown heading, as generated by GitHub and most MarkDown renderers.
+
+    Args:
+        title (str): Title of the heading.
+    """
+    return ''.join(char for char in title.lower().replace(' ', '-') if char.isalnum() or char in '-_')
+
+
+def _emit_value(dumper: yaml.Dumper, value: Any) -> None:
+    """
+    Emits the yaml events of a value the way yaml.dump represents it, without aliases to earlier values.
+    """
+    node = dumper.represent_data(value)
+    dumper.anchor_node(node)
+    dumper.serialize_node(node, None, None)
+    # The same state yaml.dump resets after every document.
+    dumper.represented_objects = {}
+    dumper.object_keeper = []
+    dumper.alias_key = None
+    dumper.anchors = {}
+    dumper.serialized_nodes = {}
+
+
+def _drain(stream: io.StringIO) -> str:
+    """
+    Returns the text written to a stream and empties it.
+    """
+    text = stream.getvalue()
+    stream.seek(0)
+    stream.truncate()
+    return text
 
 
 class MarkDownUtils:
     """
     Class that helps generate documentation for cerberus in Markdown format.
+
+    The methods that return or yield MarkDown (render, iter_document, stream_to and the methods they call) only read
+    the instance, so one instance can be shared by many threads. The methods that append to self.content
+    (generate_header, generate_attributes, generate_schema_example) and create_md_file are not thread-safe.
     """
     def __init__(self,
                  file_name: str,
                  file_mode: Optional[str] = 'w+',
-                 file_path: Optional[str] = None
+                 file_path: Optional[str] = None,
+                 example_generator: Optional[ExampleGenerator] = None,
+                 allowed_appendix: Optional[AllowedAppendix] = None,
+                 stats: Optional[SchemaStats] = None
                  ) -> None:
         """
         MarkDownUtils constructor
@@ -35,11 +100,19 @@ class MarkDownUtils:
             file_name (str): Name of the file.
             file_mode (Optional[str]): Modes described here: https://docs.python.org/3/library/functions.html#open
             file_path (Optional[str]): File path to save the file at.
+            example_generator (Optional[ExampleGenerator]): Generator of the schema input examples.
+                Defaults to a generator shared by every MarkDownUtils.
+            allowed_appendix (Optional[AllowedAppendix]): Appendix that long allowed value lists are moved to.
+                Allowed values are always rendered inline if omitted.
+            stats (Optional[SchemaStats]): Collects the cost counters of every schema rendered with render.
         """
         self.file_name: str = file_name
         self.file_path: str = file_path
         self.file_mode: str = file_mode
-        self.content: str = ''
+        self._content_chunks: List[str] = []
+        self.example_generator: ExampleGenerator = example_generator or default_example_generator
+        self.allowed_appendix: Optional[AllowedAppendix] = allowed_appendix
+        self.stats: Optional[SchemaStats] = stats
         self.generator_map: Dict[str, Any] = {
             'required': self._generate_required,
             'type': self._generate_type,
@@ -49,30 +122,22 @@ class MarkDownUtils:
             'schema': self._generate_schema,
             'meta': self._generate_description
         }
-        self.validation_rule_priority_list: List[str] = [
-            'required',
-            'type',
-            'regex',
-            'default',
-            'schema',
-            'allowed',
-            'meta'
-        ]
-        self.validation_rule_separators: Dict[str, str] = {
-            'type': ', ',
-            'regex': ', ',
-            'default': ', '
-        }
+        self.validation_rule_priority_list: List[str] = list(VALIDATION_RULE_PRIORITY_LIST)
+        self.validation_rule_separators: Dict[str, str] = dict(VALIDATION_RULE_SEPARATORS)
 
-    def _is_last_item(self, index: int, iterable: List) -> bool:
+    @property
+    def content(self) -> str:
         """
-        Returns if the input index is the last entry in the list or not
-
-        Args:
-             index (int): index to check
-             iterable (List): List to compare the index with
+        The MarkDown appended so far. Appended chunks are kept in a list and only joined when the content is read,
+        so building a document takes time linear in its size.
         """
-        return index == len(iterable) - 1
+        if len(self._content_chunks) > 1:
+            self._content_chunks = [''.join(self._content_chunks)]
+        return self._content_chunks[0] if self._content_chunks else ''
+
+    @content.setter
+    def content(self, content: str) -> None:
+        self._content_chunks = [content] if content else []
 
     def _append_to_content(self, data: str) -> None:
         """
@@ -81,7 +146,7 @@ class MarkDownUtils:
         Args:
             data (str): String value to append.
         """
-        self.content += data
+        self._content_chunks.append(data)
 
     def _generate_name(self, name: str) -> str:
         """
@@ -121,7 +186,8 @@ class MarkDownUtils:
 
     def _generate_allowed(self, allowed_values: List[Union[str, int]]) -> str:
         """
-        Generate the validation rule 'allowed' in MarkDown format.
+        Generate the validation rule 'allowed' in MarkDown format. Lists longer than the threshold of the allowed
+        appendix are replaced by the number of values and a link to their appendix document.
 
         Args:
              allowed_values (List[Union[str, int]]): List of values that should be displayed in a MarkDown list.
@@ -131,12 +197,10 @@ class MarkDownUtils:
         """
         if not allowed_values:
             return ''
-        result: str = 'one of;\n'
-        for i, value in enumerate(allowed_values):
-            result += f'  - {value}'
-            if not self._is_last_item(i, allowed_values):
-                result += '\n'
-        return result
+        if self.allowed_appendix and self.allowed_appendix.is_collapsed(allowed_values):
+            file_name = self.allowed_appendix.add(allowed_values)
+            return f'one of {len(allowed_values)} [allowed values]({file_name})'
+        return 'one of;\n' + '\n'.join(f'  - {value}' for value in allowed_values)
 
     def _generate_regex(self, regex: str) -> str:
         """
@@ -164,7 +228,7 @@ class MarkDownUtils:
 
     def _generate_schema(self, class_name: str) -> str:
         """
-        Generate the validation rule 'schema' in MarkDown format.
+        Generate the validation rule 'schema' in MarkDown format, a link to the heading of the nested schema section.
 
         Args:
              class_name (str): Class name to generate MarkDown formatted string from
@@ -172,7 +236,7 @@ class MarkDownUtils:
         Returns:
             MarkDown formatted string.
         """
-        return f'[{class_name}](#{class_name})'
+        return f'[{class_name}](#{anchor(class_name)})'
 
     def _generate_description(self, meta_object) -> Optional[str]:
         """
@@ -188,48 +252,57 @@ class MarkDownUtils:
         description = meta_object.get('description')
         return f'\n\n\n    {description}' if description else None
 
-    def _sort_attribute_fields_order(self, attribute: FormattedAttribute) -> SortedAttribute:
+    def rule_separator(self, validation_rule: str) -> str:
         """
-        Sorts the attribute keys by the order in the priority list.
-        This will also filter out any validation rule that is not supported (is in the priority list)
+        Returns the correct separator for the input validation rule. Defaults to a space if no explicit rule is found.
 
         Args:
-             attribute (Attribute) Attribute to sort
-
-        Returns:
-            OrderedDict of the attributes keys ordered by the priority list
+             validation_rule (str) The validation rule to get the separator for
         """
-        return OrderedDict(
-            [(rule, attribute[rule]) for rule in self.validation_rule_priority_list if attribute.get(rule) is not None]
-        )
+        return self.validation_rule_separators.get(validation_rule, ' ')
 
-    def _get_validation_rule_separator(self, validation_rule: str) -> str:
+    def attribute_rules(self, attribute: Attribute) -> Iterator[Tuple[str, Any]]:
         """
-        Returns the correct separator for the input validation rule. Defaults to a space if no explicit rule is found.
+        Yields the validation rules of an attribute that are in the priority list as (rule, value) pairs, in the
+        order of the priority list. The values are not formatted, so renderers of other formats, e.g. the Sphinx
+        extension, document the same rules in the same order. A :class:`.CompactAttribute` already stores its rules
+        in the default order, so they are read as stored.
 
         Args:
-             validation_rule (str) The validation rule to get the separator for
+            attribute (Attribute): The attribute to read the rules of.
         """
-        return self.validation_rule_separators.get(validation_rule, ' ')
+        rule_names = getattr(attribute, 'rule_names', None)
+        if rule_names is not None and tuple(self.validation_rule_priority_list) == VALIDATION_RULE_PRIORITY_LIST:
+            # Unknown rules are stored last, after the rules of the priority list.
+            return takewhile(lambda rule: rule[0] in _PRIORITY_RULES, zip(rule_names, attribute.rule_values))
+        return ((rule, attribute[rule]) for rule in self.validation_rule_priority_list if rule in attribute)
 
-    def _attribute_to_string(self, attribute: FormattedAttribute) -> str:
+    def _format_attribute(self, attribute: Attribute, schema_name: str) -> str:
         """
-        Takes an attribute and converts it to a string with separators between every validation rule.
+        Formats every validation rule of an attribute and returns them in the order of the priority list, with
+        separators between every validation rule. Rules that are not in the priority list are left out.
+        The rules are formatted straight from the attribute, without building a formatted and a sorted copy of it.
 
         Args:
-            attribute (Attribute): The attribute to convert to a string
+            attribute (Attribute): The attribute to format.
+            schema_name (str): Section name of the nested schema of the attribute.
 
         Returns:
             String representation of attribute
         """
-        result: str = ''
-        for i, key in enumerate(attribute.keys()):
-            result += attribute[key]
-            result += self._get_validation_rule_separator(key)
-        result += '\n\n'
-        return result
+        chunks: List[str] = []
+        for validation_rule, value in self.attribute_rules(attribute):
+            if validation_rule == 'schema':
+                formatted = self._generate_schema(schema_name)
+            else:
+                formatted = self.generator_map.get(validation_rule, lambda *args: None)(value)
+            if formatted is not None:
+                chunks.append(formatted)
+                chunks.append(self.rule_separator(validation_rule))
+        chunks.append('\n\n')
+        return ''.join(chunks)
 
-    def _generate_schema_example_dict(self, schema: Schema) -> Dict:
+    def example_dict(self, schema: Schema) -> Dict:
         """
         Generates and returns a dict which serves as an example of valid input for the schema.
 
@@ -239,81 +312,119 @@ class MarkDownUtils:
         Raises:
             :class:`.CerberusDocsException`: Type in schema not supported
         """
-        def _get_default_value_by_type(type_: str) -> Union[str, bool, datetime.datetime, datetime.date, float, int]:
-            default_value_type_map = {
-                'string': 'str',
-                'boolean': True,
-                'binary': base64.b64encode(b'example binary').decode(),
-                'date': datetime.datetime(2022, 1, 1).date().isoformat(),
-                'datetime': datetime.datetime(2022, 1, 1).isoformat(),
-                'float': 1.2345,
-                'integer': 12345,
-                'number': 12345,
-            }
-            try:
-                return default_value_type_map[type_]
-            except KeyError:
-                raise CerberusDocsException(f'Type {type_} not supported')
-
-        result = {}
-        for attribute_name, attribute_value in schema.items():
-            attribute_type = attribute_value.get('type')
-            default_value = attribute_value.get('default')
-            allowed = attribute_value.get('allowed')
-            allowed = allowed[0] if allowed else None
-            attribute_schema = attribute_value.get('schema', {})
-            nested_schema = attribute_schema.get('schema')
-            if attribute_type == 'dict':
-                result[attribute_name] = (
-                    self._generate_schema_example_dict(attribute_schema)
-                    if attribute_schema
-                    else None
-                )
-            elif attribute_type == 'list':
-                result[attribute_name] = (
-                    [self._generate_schema_example_dict(nested_schema)]
-                    if attribute_schema and nested_schema and attribute_schema.get('type') == 'dict'
-                    else None
-                )
-            else:
-                result[attribute_name] = default_value or allowed or _get_default_value_by_type(attribute_type)
-        return result
+        return self.example_generator.example(schema)
+
+    def _iter_schema_example_yaml(self, schema: Schema) -> Iterator[str]:
+        """
+        Yields the yaml of the example of valid input for the schema, one attribute at a time.
+        The output is the same as dumping the dict from example_dict, as the yaml emitter of
+        yaml.dump writes it, but only the attributes on the path to the current attribute are held in memory.
+
+        Args:
+             schema (Schema): The schema to generate an example for
+
+        Raises:
+            :class:`.CerberusDocsException`: Type in schema not supported
+        """
+        stream = io.StringIO()
+        dumper = yaml.Dumper(stream)
+        dumper.open()
+        dumper.emit(yaml.DocumentStartEvent())
+        for _ in self._emit_schema_example(dumper, schema):
+            if stream.tell():
+                yield _drain(stream)
+        dumper.emit(yaml.DocumentEndEvent())
+        dumper.close()
+        yield _drain(stream)
 
-    def _format_validation_rule(self, validation_rule: str, attribute: Attribute, schema_name: str) -> Optional[str]:
+    def _emit_schema_example(self, dumper: yaml.Dumper, schema: Schema) -> Iterator[None]:
         """
-        Takes a validation rule and returns the generated markdown string value of that rule.
+        Emits the yaml events of the example of valid input for the schema, and yields after every attribute.
 
         Args:
-            validation_rule (str): The validation rule to generate a markdown string from.
-            attribute: (Attribute): The attribute which the validation rule belongs to.
-            schema_name (str): The schema name
+             dumper (yaml.Dumper): The dumper to emit to.
+             schema (Schema): The schema to generate an example for
 
+        Raises:
+            :class:`.CerberusDocsException`: Type in schema not supported
         """
-        if validation_rule == 'schema':
-            return self._generate_schema(schema_name)
-        return self.generator_map.get(validation_rule, lambda *args: None)(attribute[validation_rule])  # noqa: E501
+        dumper.emit(yaml.MappingStartEvent(None, MAPPING_TAG, True, flow_style=False))
+        for attribute_name in sorted(schema.keys()):
+            attribute_value: Attribute = schema[attribute_name]
+            attribute_type = attribute_value.get('type')
+            attribute_schema = attribute_value.get('schema', {})
+            nested_schema = attribute_schema.get('schema')
+            is_list_of_dicts = attribute_type == 'list' and nested_schema and attribute_schema.get('type') == 'dict'
+            _emit_value(dumper, attribute_name)
+            if attribute_type == 'dict' and attribute_schema:
+                yield from self._emit_schema_example(dumper, attribute_schema)
+            elif is_list_of_dicts:
+                dumper.emit(yaml.SequenceStartEvent(None, SEQUENCE_TAG, True, flow_style=False))
+                for _ in range(self.example_generator.item_count(attribute_value)):
+                    yield from self._emit_schema_example(dumper, nested_schema)
+                dumper.emit(yaml.SequenceEndEvent())
+            else:
+                _emit_value(dumper, self.example_generator.attribute_example(attribute_value))
+            yield
+        dumper.emit(yaml.MappingEndEvent())
 
-    def _get_schema(self, validation_rule: str, attribute: Attribute) -> Optional[Schema]:
+    def nested_schema(self, attribute: Attribute) -> Optional[Schema]:
         """
-        Returns a schema from an attribute depending on the attribute type.
+        Returns the nested schema of an attribute that is documented in its own section, depending on the attribute
+        type, or None if the attribute has none. The items of a list of values are documented as the attribute '_'.
         Used when saving schemas for later use, in order to recursively generate attributes with nested schemas.
 
         Args:
-            validation_rule (str): A validation rule
-            attribute (Attribute): The attribute which the validation rule belongs to.
-        """
-        rule_is_schema = validation_rule == 'schema'
-        attribute_is_dict = attribute.get('type') == 'dict'
-        attribute_is_list = attribute.get('type') == 'list'
-        if rule_is_schema and attribute_is_dict:
-            return attribute[validation_rule]
-        elif rule_is_schema and attribute_is_list:
-            if attribute[validation_rule].get('type') == 'dict':
-                return attribute[validation_rule].get('schema', {})
+            attribute (Attribute): The attribute to get the nested schema of.
+        """
+        if 'schema' not in attribute:
+            return None
+        if attribute.get('type') == 'dict':
+            return attribute['schema']
+        elif attribute.get('type') == 'list':
+            if attribute['schema'].get('type') == 'dict':
+                return attribute['schema'].get('schema', {})
             else:
-                return {'_': attribute[validation_rule]}
+                return {'_': attribute['schema']}
         return None
 
+    def iter_attributes(self, class_name: str, schema: Schema, counters: Optional[SchemaCounters] = None,
+                        depth: int = 1, sections: Optional[Dict[int, str]] = None) -> Iterator[str]:
+        """
+        Takes a schema and yields MarkDown strings for every attribute -> validation rule. If the attribute contains
+        a schema validation rule, the method will recursively yield MarkDown strings through the whole Schema.
+        A nested schema that is shared by several attributes is only rendered once, and every attribute links to it.
+
+        Args:
+             class_name (str): The class name of the class the schema sent in was found.
+             schema (Schema): The schema that the function should generate documentation from.
+             counters (Optional[SchemaCounters]): Counts the attributes and nested sections as they are yielded.
+             depth (int): Nesting level of the schema.
+             sections (Optional[Dict[int, str]]): Section name of every nested schema rule of the document that is
+                 already rendered, by id of the rule.
+        """
+        if sections is None:
+            sections = {}
+        additional_schemas: Dict[str, Schema] = {}
+        for attribute_name, attribute in schema.items():
+            if counters is not None:
+                counters.count_attribute(attribute, depth)
+            yield self._generate_name(attribute_name)
+            schema_name: str = sections.get(id(attribute.get('schema')), f'{class_name}{attribute_name.capitalize()}')
+            if 'schema' in attribute:
+                additional_schema = self.nested_schema(attribute)
+                if additional_schema and id(attribute['schema']) not in sections:
+                    sections[id(attribute['schema'])] = schema_name
+                    additional_schemas[schema_name] = additional_schema
+            yield self._format_attribute(attribute, schema_name)
+        for additional_schema_name in additional_schemas.keys():
+            if counters is not None:
+                counters.nested_sections += 1
+            yield self._format_header(level=2, title=additional_schema_name)
+            yield from self.iter_attributes(
+                additional_schema_name, additional_schemas[additional_schema_name], counters, depth + 1, sections
+            )
+
     def generate_attributes(self, class_name: str, schema: Schema) -> None:
         """
         Takes a schema, generates MarkDown strings for every attribute -> validation rule and appends it to
@@ -324,22 +435,19 @@ class MarkDownUtils:
              class_name (str): The class name of the class the schema sent in was found.
              schema (Schema): The schema that the function should generate documentation from.
         """
-        additional_schemas: Dict[str, Schema] = {}
-        for attribute_name in schema.keys():
-            self._append_to_content(self._generate_name(attribute_name))
-            attribute: Attribute = schema[attribute_name]
-            formatted_attribute: FormattedAttribute = {}
-            for validation_rule in attribute:
-                schema_name: str = f'{class_name}{attribute_name.capitalize()}'
-                formatted_attribute[validation_rule] = self._format_validation_rule(validation_rule, attribute, schema_name)  # noqa: E501
-                additional_schema = self._get_schema(validation_rule, attribute)
-                if additional_schema:
-                    additional_schemas[schema_name] = additional_schema
-            sorted_attribute: SortedAttribute = self._sort_attribute_fields_order(formatted_attribute)
-            self._append_to_content(self._attribute_to_string(sorted_attribute))
-        for additional_schema_name in additional_schemas.keys():
-            self.generate_header(level=2, title=additional_schema_name)
-            self.generate_attributes(additional_schema_name, additional_schemas[additional_schema_name])
+        for chunk in self.iter_attributes(class_name, schema):
+            self._append_to_content(chunk)
+
+    def _format_header(self, title: str, level: Optional[int] = 1) -> str:
+        """
+        Generate a header in MarkDown format given a title and level.
+
+        Args:
+             title (str): Header title
+             level (Optional[int]): Header level, 1 - 6 is allowed. Default is 1.
+        """
+        restricted_level: int = 6 if level > 6 else 1 if level < 1 else level
+        return f"\n{'#' * restricted_level} {title}\n\n"
 
     def generate_header(self, title: str, level: Optional[int] = 1) -> None:
         """
@@ -349,9 +457,7 @@ class MarkDownUtils:
              title (str): Header title
              level (Optional[int]): Header level, 1 - 6 is allowed. Default is 1.
         """
-        restricted_level: int = 6 if level > 6 else 1 if level < 1 else level
-        header: str = f"\n{'#' * restricted_level} {title}\n\n"
-        self._append_to_content(header)
+        self._append_to_content(self._format_header(title, level))
 
     def generate_schema_example(self, schema: Schema) -> None:
         """
@@ -363,11 +469,148 @@ class MarkDownUtils:
         Raises:
             :class:`.CerberusDocsException`: Type in schema not supported
         """
-        schema_example_dict = self._generate_schema_example_dict(schema)
+        schema_example_dict = self.example_dict(schema)
         schema_example_yaml = yaml.dump(schema_example_dict)
         self.generate_header('Example Schema Input', level=2)
         self._append_to_content(f'```\n{schema_example_yaml}```\n')
 
+    def iter_schema_example(self, schema: Schema) -> Iterator[str]:
+        """
+        Yields the yaml example of valid input for the schema line by line, in the same format as
+        generate_schema_example. When the example generator validates, the example is validated before the first line
+        is yielded.
+
+        Args:
+             schema (Schema): The schema to generate an example for
+
+        Raises:
+            :class:`.CerberusDocsException`: Type in schema not supported, or the example is not valid for the schema
+                when validation is enabled.
+        """
+        if self.example_generator.validate:
+            # The yaml is generated one attribute at a time, so the complete example is only generated to validate it.
+            self.example_dict(schema)
+        yield self._format_header('Example Schema Input', level=2)
+        yield '```\n'
+        yield from self._iter_schema_example_yaml(schema)
+        yield '```\n'
+
+    def _rendering_key(self) -> Hashable:
+        """
+        Returns the options of the instance that rendered attributes depend on: its class, since subclasses may
+        override the rule generators, the function of every rule generator, and the rule order and separators.
+        """
+        generators = tuple(
+            (rule, getattr(generator, '__func__', generator)) for rule, generator in sorted(self.generator_map.items())
+        )
+        return (
+            type(self), generators, tuple(self.validation_rule_priority_list),
+            tuple(sorted(self.validation_rule_separators.items()))
+        )
+
+    def _example_key(self) -> Hashable:
+        """
+        Returns the class of the instance and the options of the example generator that rendered examples depend on.
+        """
+        return type(self), type(self.example_generator), self.example_generator.seed, self.example_generator.validate
+
+    def render_attributes(self, class_name: str, schema: Schema) -> str:
+        """
+        Returns the MarkDown of every attribute of a schema, like iter_attributes. The result is kept with a frozen
+        schema, see :class:`.FrozenDict`, and only computed once per class name and options. Schemas are not cached
+        when long allowed value lists are moved to an appendix, as rendering adds them to the appendix.
+
+        Args:
+             class_name (str): The class name of the class the schema sent in was found.
+             schema (Schema): The schema that the function should generate documentation from.
+        """
+        if not isinstance(schema, FrozenDict) or self.allowed_appendix is not None:
+            return ''.join(self.iter_attributes(class_name, schema))
+        return schema.derived(
+            ('attributes', class_name, self._rendering_key()), lambda: ''.join(self.iter_attributes(class_name, schema))
+        )
+
+    def render_schema_example(self, schema: Schema) -> str:
+        """
+        Returns the example of valid input for a schema, like iter_schema_example. The result is kept with a frozen
+        schema and only computed once per example generator options.
+
+        Args:
+             schema (Schema): The schema to generate an example for
+
+        Raises:
+            :class:`.CerberusDocsException`: Type in schema not supported
+        """
+        if not isinstance(schema, FrozenDict):
+            return ''.join(self.iter_schema_example(schema))
+        return schema.derived(('example', self._example_key()), lambda: ''.join(self.iter_schema_example(schema)))
+
+    def iter_document(self, class_name: str, schema: Schema) -> Iterator[str]:
+        """
+        Yields the complete documentation of a schema in chunks: the class header, every attribute and the example.
+        The attributes and example of a frozen schema are rendered once and then reused.
+
+        Args:
+             class_name (str): The class name of the class the schema sent in was found.
+             schema (Schema): The schema that the function should generate documentation from.
+        """
+        yield self._format_header(class_name, level=2)
+        if isinstance(schema, FrozenDict):
+            yield self.render_attributes(class_name, schema)
+            yield self.render_schema_example(schema)
+            return
+        yield from self.iter_attributes(class_name, schema)
+        yield from self.iter_schema_example(schema)
+
+    def render(self, class_name: str, schemas: List[Schema]) -> str:
+        """
+        Returns the complete documentation of the schemas of a class, the same content that generate_docs writes.
+        Does not touch self.content, so it is safe to call concurrently on a shared instance.
+        With stats, the cost counters of every schema are added to it.
+
+        Args:
+             class_name (str): The class name of the class the schemas were found in.
+             schemas (List[Schema]): The schemas of the class.
+        """
+        if self.stats is None:
+            return ''.join(chunk for schema in schemas for chunk in self.iter_document(class_name, schema))
+        return ''.join(self._render_counted(class_name, index, schema) for index, schema in enumerate(schemas))
+
+    def _render_counted(self, class_name: str, schema_index: int, schema: Schema) -> str:
+        """
+        Returns the documentation of a schema, like iter_document, and adds its cost counters to self.stats.
+
+        Args:
+             class_name (str): The class name of the class the schema was found in.
+             schema_index (int): Index of the schema in the schemas of the class.
+             schema (Schema): The schema that the function should generate documentation from.
+        """
+        counters = SchemaCounters(class_name, schema_index)
+        start = time.perf_counter()
+        attributes = ''.join(self.iter_attributes(class_name, schema, counters))
+        counters.attributes_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        example = ''.join(self.iter_schema_example(schema))
+        counters.example_seconds = time.perf_counter() - start
+        document = f'{self._format_header(class_name, level=2)}{attributes}{example}'
+        counters.rendered_bytes = len(document.encode('utf-8'))
+        self.stats.add(counters)
+        return document
+
+    def stream_to(self, file: TextIO, class_name: str, schema: Schema) -> None:
+        """
+        Writes the complete documentation of a schema to an open file as it is generated, without holding the
+        document in self.content. Peak memory is proportional to the nesting depth of the schema rather than to the
+        size of the document.
+
+        Args:
+             file (TextIO): An open file to write to.
+             class_name (str): The class name of the class the schema sent in was found.
+             schema (Schema): The schema that the function should generate documentation from.
+        """
+        for chunk in self.iter_document(class_name, schema):
+            file.write(chunk)
+
     def create_md_file(self) -> MarkDownFile:
         """
         Creates a MarkDown file and writes self.content to it.
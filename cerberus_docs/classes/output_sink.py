@@ -0,0 +1,148 @@
+import io
+import os
+import gzip
+import tarfile
+import zipfile
+import threading
+from typing import Optional
+
+from .exceptions import CerberusDocsException
+
+ARCHIVE_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+class OutputSink:
+    """
+    Destination of the generated documents. Every document is written with one call to write, so a sink can place it
+    in a directory or an archive without temporary files. Sinks can be written to from several threads.
+    """
+    def write(self, file_name: str, content: str) -> None:
+        """
+        Writes a document.
+
+        Args:
+            file_name (str): File name of the document.
+            content (str): Content of the document.
+        """
+        raise NotImplementedError  # pragma: no cover
+
+    def close(self) -> None:
+        """
+        Finishes the output, e.g. writes the end of an archive.
+        """
+
+
+class DirectorySink(OutputSink):
+    """
+    Writes every document as a file in the build directory, optionally with a gzip compressed sibling, so a static
+    host can serve the compressed file as is instead of compressing the document on every request.
+    """
+    def __init__(self, build_dir: str, precompress: bool = False) -> None:
+        """
+        DirectorySink constructor
+
+        Args:
+            build_dir (str): The directory where the generated docs should be saved.
+            precompress (bool): Also write a .gz sibling of every document.
+        """
+        self.build_dir: str = build_dir
+        self.precompress: bool = precompress
+
+    def write(self, file_name: str, content: str) -> None:
+        file_path = os.path.join(self.build_dir, file_name)
+        with open(file_path, 'w', encoding='utf-8') as file:
+            file.write(content)
+        if self.precompress:
+            # mtime=0 and no file name in the header, so the same document always compresses to the same bytes.
+            with open(f'{file_path}.gz', 'wb') as file, \
+                    gzip.GzipFile(filename='', mode='wb', fileobj=file, compresslevel=9, mtime=0) as gzip_file:
+                gzip_file.write(content.encode('utf-8'))
+
+
+class ZipSink(OutputSink):
+    """
+    Writes every document into a deflate compressed zip archive.
+    """
+    def __init__(self, archive_path: str) -> None:
+        """
+        ZipSink constructor
+
+        Args:
+            archive_path (str): Path of the zip archive. The archive is created when the first document is written.
+        """
+        self.archive_path: str = archive_path
+        self._archive: Optional[zipfile.ZipFile] = None
+        self._lock = threading.Lock()
+
+    def _open(self) -> zipfile.ZipFile:
+        if self._archive is None:
+            self._archive = zipfile.ZipFile(self.archive_path, 'w', zipfile.ZIP_DEFLATED)
+        return self._archive
+
+    def write(self, file_name: str, content: str) -> None:
+        info = zipfile.ZipInfo(file_name, date_time=ARCHIVE_DATE_TIME)
+        info.compress_type = zipfile.ZIP_DEFLATED
+        info.external_attr = 0o644 << 16
+        with self._lock:
+            self._open().writestr(info, content.encode('utf-8'))
+
+    def close(self) -> None:
+        with self._lock:
+            self._open().close()
+
+
+class TarSink(OutputSink):
+    """
+    Writes every document into a tar archive, gzip compressed if the archive path ends with .gz or .tgz.
+    """
+    def __init__(self, archive_path: str) -> None:
+        """
+        TarSink constructor
+
+        Args:
+            archive_path (str): Path of the tar archive. The archive is created when the first document is written.
+        """
+        self.archive_path: str = archive_path
+        self._archive: Optional[tarfile.TarFile] = None
+        self._lock = threading.Lock()
+
+    def _open(self) -> tarfile.TarFile:
+        if self._archive is None:
+            compressed = self.archive_path.endswith(('.gz', '.tgz'))
+            self._archive = tarfile.open(self.archive_path, 'w:gz' if compressed else 'w')
+        return self._archive
+
+    def write(self, file_name: str, content: str) -> None:
+        data = content.encode('utf-8')
+        info = tarfile.TarInfo(file_name)
+        info.size = len(data)
+        info.mode = 0o644
+        with self._lock:
+            self._open().addfile(info, io.BytesIO(data))
+
+    def close(self) -> None:
+        with self._lock:
+            self._open().close()
+
+
+def open_output(build_dir: str, archive: Optional[str] = None, precompress: bool = False) -> OutputSink:
+    """
+    Returns the sink for the output of a build.
+
+    Args:
+        build_dir (str): The directory where the generated docs should be saved if no archive is given.
+        archive (Optional[str]): Path of a .zip, .tar, .tar.gz or .tgz archive to write every document into.
+        precompress (bool): Also write a .gz sibling of every document in the build directory.
+
+    Raises:
+        :class:`.CerberusDocsException`: Unsupported archive type, or precompress combined with an archive
+    """
+    if archive is None:
+        return DirectorySink(build_dir, precompress)
+    if precompress:
+        raise CerberusDocsException('Documents in an archive cannot be precompressed')
+    if archive.endswith('.zip'):
+        return ZipSink(archive)
+    if archive.endswith(('.tar', '.tar.gz', '.tgz')):
+        return TarSink(archive)
+    raise CerberusDocsException(f'Unsupported archive {archive}, expected a .zip, .tar, .tar.gz or .tgz file')
@@ -0,0 +1,251 @@
+import os
+import sys
+import pickle
+import contextlib
+import hashlib
+import logging
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .. import __version__
+from ..utils.dependencies import file_hash
+from .compact_schema import CompactSchemaMap, compact_schema_map, thaw_schema_map
+from .types import SchemaMap
+
+logger = logging.getLogger(__name__)
+
+CACHE_MAGIC: bytes = b'CDSC'
+CACHE_FORMAT_VERSION: int = 2
+CACHE_HEADER: bytes = CACHE_MAGIC + CACHE_FORMAT_VERSION.to_bytes(2, 'big')
+CACHE_FILE_EXTENSION: str = '.schemacache'
+
+
+class SchemaCache:
+    """
+    Persistent cache of extracted schemas with one cache file per source module.
+
+    Every entry is keyed by the hash of the module source, the interpreter version and the cerberus-docs version,
+    and holds the sha256 hash of every file the module imported, so an entry is only ever returned for the exact
+    source it was extracted from and the exact modules it imported.
+    """
+    def __init__(self, cache_dir: str) -> None:
+        """
+        SchemaCache constructor
+
+        Args:
+            cache_dir (str): Directory where the cache files are stored. Created if it does not exist.
+        """
+        self.cache_dir: str = cache_dir
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def source_key(file_path: str) -> str:
+        """
+        Returns the cache key of a source file.
+
+        Args:
+            file_path (str): Path of the source file.
+        """
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as source:
+            digest.update(source.read())
+        digest.update(sys.version.encode())
+        digest.update(__version__.encode())
+        return digest.hexdigest()
+
+    def _entry_path(self, file_path: str) -> str:
+        """
+        Returns the path of the cache file belonging to a source file.
+
+        Args:
+            file_path (str): Path of the source file.
+        """
+        name = hashlib.sha1(os.path.abspath(file_path).encode()).hexdigest()
+        return os.path.join(self.cache_dir, f'{name}{CACHE_FILE_EXTENSION}')
+
+    def _read_entry(self, entry_path: str) -> Optional[dict]:
+        """
+        Reads a cache file and returns its payload, or None if the file is missing, corrupt or of another format.
+
+        Args:
+            entry_path (str): Path of the cache file.
+        """
+        try:
+            with open(entry_path, 'rb') as entry_file:
+                if entry_file.read(len(CACHE_HEADER)) != CACHE_HEADER:
+                    return None
+                return pickle.load(entry_file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug('Ignoring unreadable cache entry %s: %s', entry_path, e)
+            return None
+
+    def _is_current(self, entry: dict, file_path: str) -> bool:
+        """
+        Returns if a cache entry was extracted from the current source of a file and the current content of every
+        file it imported.
+
+        Args:
+            entry (dict): The payload of the cache file.
+            file_path (str): Path of the source file.
+        """
+        if entry['key'] != self.source_key(file_path):
+            return False
+        return all(file_hash(path) == digest for path, digest in entry['dependencies'].items())
+
+    def lookup(self, file_path: str) -> Optional[Tuple[SchemaMap, List[str]]]:
+        """
+        Returns the cached SchemaMap of a source file together with the paths of the files it imported, or None if
+        there is no valid entry for its current source and dependencies.
+
+        Args:
+            file_path (str): Path of the source file.
+        """
+        entry = self._read_entry(self._entry_path(file_path))
+        if entry is None or not self._is_current(entry, file_path):
+            return None
+        return entry['schema_map'], list(entry['dependencies'])
+
+    def get(self, file_path: str) -> Optional[SchemaMap]:
+        """
+        Returns the cached SchemaMap of a source file, or None if there is no valid entry for its current source
+        and dependencies.
+
+        Args:
+            file_path (str): Path of the source file.
+        """
+        cached = self.lookup(file_path)
+        return cached[0] if cached is not None else None
+
+    def put(self, file_path: str, schema_map: SchemaMap, dependencies: Iterable[str] = ()) -> bool:
+        """
+        Stores the SchemaMap extracted from a source file.
+        Schemas that cannot be pickled (e.g. containing lambdas) are not cached.
+
+        Args:
+            file_path (str): Path of the source file.
+            schema_map (SchemaMap): The schemas extracted from the source file.
+            dependencies (Iterable[str]): Paths of the files the source file imports, directly or through other
+                files. The entry is stale once one of them changes.
+
+        Returns:
+            True if the entry was written.
+        """
+        entry = {
+            'source_path': os.path.abspath(file_path),
+            'key': self.source_key(file_path),
+            'dependencies': {os.path.abspath(path): file_hash(path) for path in dependencies},
+            'schema_map': schema_map,
+        }
+        try:
+            payload = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.debug('Could not cache schemas of %s: %s', file_path, e)
+            return False
+        entry_path = self._entry_path(file_path)
+        temp_path = f'{entry_path}.{os.getpid()}.tmp'
+        try:
+            with open(temp_path, 'wb') as entry_file:
+                entry_file.write(CACHE_HEADER)
+                entry_file.write(payload)
+            os.replace(temp_path, entry_path)
+        except Exception:
+            # A partly written entry is not left behind.
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(temp_path)
+            raise
+        return True
+
+    def entries(self, source_dir: Optional[str] = None) -> Iterator[Tuple[str, Optional[SchemaMap]]]:
+        """
+        Yields every source path in the cache together with its SchemaMap.
+        The SchemaMap is None if the source file or a file it imports has changed since it was cached. Entries of
+        source files that no longer exist are skipped.
+
+        Args:
+            source_dir (Optional[str]): Only yield the entries of source files inside this directory. Every entry
+                is yielded if omitted.
+        """
+        source_prefix = os.path.join(os.path.abspath(source_dir), '') if source_dir is not None else ''
+        for name in sorted(os.listdir(self.cache_dir)):
+            if not name.endswith(CACHE_FILE_EXTENSION):
+                continue
+            entry = self._read_entry(os.path.join(self.cache_dir, name))
+            if entry is None:
+                continue
+            source_path: str = entry['source_path']
+            if not source_path.startswith(source_prefix) or not os.path.isfile(source_path):
+                continue
+            yield source_path, entry['schema_map'] if self._is_current(entry, source_path) else None
+
+
+class MemorySchemaCache:
+    """
+    In-memory cache of extracted schemas for a long running process. Entries are keyed by the modification time and
+    size of the source file and of every file it imports, so an entry is dropped as soon as one of them changes.
+
+    Entries are kept as :class:`.CompactSchema` copies, which share their rule names between attributes, so the
+    cache holds the schemas of evicted modules in about 10% less memory than the schema dicts, and changes made to
+    the returned schemas do not change the cache. Every get returns new plain schema dicts, except for frozen schemas,
+    which are kept as they are.
+    """
+    def __init__(self) -> None:
+        """
+        MemorySchemaCache constructor
+        """
+        self._entries: Dict[
+            str, Tuple[Optional[Tuple[int, int]], CompactSchemaMap, Dict[str, Optional[Tuple[int, int]]]]
+        ] = {}
+
+    @staticmethod
+    def _stat_key(file_path: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def get(self, file_path: str) -> Optional[SchemaMap]:
+        """
+        Returns the cached schemas of a source file, or None if there is no entry for its current source.
+
+        Args:
+            file_path (str): Path of the source file.
+        """
+        file_path = os.path.abspath(file_path)
+        entry = self._entries.get(file_path)
+        if entry is None:
+            return None
+        is_current = entry[0] == self._stat_key(file_path) and all(
+            self._stat_key(path) == stat_key for path, stat_key in entry[2].items()
+        )
+        if not is_current:
+            del self._entries[file_path]
+            return None
+        return thaw_schema_map(entry[1])
+
+    def put(self, file_path: str, schema_map: SchemaMap, dependencies: Iterable[str] = ()) -> None:
+        """
+        Caches the schemas of a source file.
+
+        Args:
+            file_path (str): Path of the source file.
+            schema_map (SchemaMap): The schemas extracted from the source file.
+            dependencies (Iterable[str]): Paths of the files the source file imports, directly or through other
+                files. The entry is dropped once one of them changes.
+        """
+        file_path = os.path.abspath(file_path)
+        self._entries[file_path] = (
+            self._stat_key(file_path),
+            compact_schema_map(schema_map),
+            {os.path.abspath(path): self._stat_key(path) for path in dependencies},
+        )
+
+    def clear(self) -> None:
+        """
+        Drops every entry.
+        """
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
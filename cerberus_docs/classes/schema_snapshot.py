@@ -0,0 +1,181 @@
+import os
+import json
+import hashlib
+from typing import Any, Dict, Iterator, List, Optional
+
+from .exceptions import CerberusDocsException
+from .types import Schema, SchemaMap
+
+SNAPSHOT_FILE_NAME: str = 'cerberus-docs.snapshot'
+SNAPSHOT_FORMAT_VERSION: int = 2
+
+
+def _json_default(value: Any) -> str:
+    """
+    Returns a stable string for rule values that are not JSON serializable. Functions and classes are stored by their
+    qualified name rather than their repr, which contains a memory address that changes between runs.
+
+    Args:
+        value (Any): The value to convert.
+    """
+    qualified_name = getattr(value, '__qualname__', None)
+    if qualified_name:
+        return f'{getattr(value, "__module__", None)}.{qualified_name}'
+    return repr(value)
+
+
+class SubtreeHasher:
+    """
+    Computes Merkle-style hashes of schema subtrees: the hash of a dict or list is computed from the hashes of its
+    children, and every hash is memoized, so after the root of a tree is hashed the hash of any of its subtrees is
+    available in O(1). Two subtrees with the same hash are equal and do not have to be compared.
+    """
+    def __init__(self) -> None:
+        """
+        SubtreeHasher constructor
+        """
+        self._hashes: Dict[int, bytes] = {}
+        # Keeps the hashed values alive so their ids are not reused by other values.
+        self._values: List[Any] = []
+
+    def hash(self, value: Any) -> bytes:
+        """
+        Returns the hash of a JSON value.
+
+        Args:
+            value (Any): A value of a schema snapshot.
+        """
+        cached = self._hashes.get(id(value))
+        if cached is not None:
+            return cached
+        if isinstance(value, dict):
+            digest = hashlib.sha1(b'd')
+            for key in sorted(value):
+                digest.update(repr(key).encode())
+                digest.update(self.hash(value[key]))
+        elif isinstance(value, list):
+            digest = hashlib.sha1(b'l')
+            for item in value:
+                digest.update(self.hash(item))
+        else:
+            digest = hashlib.sha1(f'v{type(value).__name__}:{value!r}'.encode())
+        self._hashes[id(value)] = digest.digest()
+        self._values.append(value)
+        return self._hashes[id(value)]
+
+    def equal(self, old: Any, new: Any) -> bool:
+        """
+        Returns if two values are equal by comparing their hashes.
+
+        Args:
+            old (Any): A value of the old snapshot.
+            new (Any): A value of the new snapshot.
+        """
+        return self.hash(old) == self.hash(new)
+
+
+class SchemaSnapshot:
+    """
+    The extracted schemas of a build, stored as JSON so the schemas of two builds can be compared without
+    importing any module, see :func:`.diff_snapshots`.
+
+    Classes are stored by qualified name ('module.Class'), so classes with the same name in different modules do not
+    replace each other.
+
+    The snapshot file has a JSON header line followed by one line per class with the qualified class name, the Merkle
+    hash of its schemas and the schemas as JSON, separated by tabs. Reading a snapshot only splits the lines, the
+    schemas of a class are only parsed when they are requested, so comparing two snapshots only parses the classes
+    that changed.
+    """
+    def __init__(self) -> None:
+        """
+        SchemaSnapshot constructor
+        """
+        self.hashes: Dict[str, str] = {}
+        self._schemas: Dict[str, str] = {}
+
+    def add(self, schema_map: SchemaMap, module: Optional[str] = None) -> None:
+        """
+        Adds the schemas of a SchemaMap to the snapshot. Values that are not JSON serializable are stored as strings.
+
+        Args:
+            schema_map (SchemaMap): The schemas to add.
+            module (Optional[str]): Dotted name of the module the classes are defined in, which qualifies their names.
+                Classes are stored by their bare name if it is not given.
+        """
+        hasher = SubtreeHasher()
+        for class_name, schemas in schema_map.items():
+            qualified_name = f'{module}.{class_name}' if module else class_name
+            serialized = json.dumps(schemas, default=_json_default, sort_keys=True)
+            self._schemas[qualified_name] = serialized
+            self.hashes[qualified_name] = hasher.hash(json.loads(serialized)).hex()
+
+    def update(self, other: 'SchemaSnapshot') -> None:
+        """
+        Adds the schemas of another snapshot, e.g. of another shard.
+
+        Args:
+            other (SchemaSnapshot): The snapshot to add.
+        """
+        self.hashes.update(other.hashes)
+        self._schemas.update(other._schemas)
+
+    def schemas(self, class_name: str) -> List[Schema]:
+        """
+        Returns the schemas of a class.
+
+        Args:
+            class_name (str): Qualified name of the class.
+        """
+        return json.loads(self._schemas[class_name])
+
+    def iter_lines(self) -> Iterator[str]:
+        """
+        Yields the lines of the snapshot file.
+        """
+        yield json.dumps({'version': SNAPSHOT_FORMAT_VERSION}) + '\n'
+        for class_name in sorted(self.hashes):
+            yield f'{class_name}\t{self.hashes[class_name]}\t{self._schemas[class_name]}\n'
+
+    def write(self, build_dir: str) -> str:
+        """
+        Writes the snapshot to the build directory.
+
+        Args:
+            build_dir (str): The build directory.
+
+        Returns:
+            Path of the written snapshot.
+        """
+        snapshot_path = os.path.join(build_dir, SNAPSHOT_FILE_NAME)
+        with open(snapshot_path, 'w', encoding='utf-8') as snapshot_file:
+            snapshot_file.writelines(self.iter_lines())
+        return snapshot_path
+
+    @classmethod
+    def read(cls, path: str) -> 'SchemaSnapshot':
+        """
+        Reads a snapshot from a snapshot file or from the build directory it was written to.
+
+        Args:
+            path (str): The snapshot file or build directory.
+
+        Raises:
+            :class:`.CerberusDocsException`: No snapshot found, or unsupported snapshot version
+        """
+        snapshot_path = os.path.join(path, SNAPSHOT_FILE_NAME) if os.path.isdir(path) else path
+        if not os.path.isfile(snapshot_path):
+            raise CerberusDocsException(f'No snapshot found at {path}')
+        snapshot = cls()
+        with open(snapshot_path, 'r', encoding='utf-8') as snapshot_file:
+            try:
+                version = json.loads(snapshot_file.readline()).get('version')
+            except (ValueError, AttributeError):
+                version = None
+            if version != SNAPSHOT_FORMAT_VERSION:
+                raise CerberusDocsException(f'Unsupported snapshot version {version} in {snapshot_path}')
+            for line in snapshot_file:
+                class_name, hash_, serialized = line.rstrip('\n').split('\t', 2)
+                snapshot.hashes[class_name] = hash_
+                snapshot._schemas[class_name] = serialized
+        return snapshot
@@ -0,0 +1,165 @@
+import io
+import csv
+import json
+import threading
+from typing import Any, Dict, List, Tuple
+
+from .exceptions import CerberusDocsException
+
+STATS_FIELDS: Tuple[str, ...] = (
+    'class',
+    'schema',
+    'attributes',
+    'max_depth',
+    'nested_sections',
+    'allowed_values',
+    'max_allowed',
+    'rendered_bytes',
+    'attributes_seconds',
+    'example_seconds'
+)
+
+
+class SchemaCounters:
+    """
+    Cost counters of one schema of a class, filled in while the schema is rendered.
+
+    Attributes:
+        attributes (int): Number of attributes, including the attributes of nested schemas.
+        max_depth (int): Deepest nesting level of an attribute, 1 for a schema without nested schemas.
+        nested_sections (int): Number of nested schema sections emitted.
+        allowed_values (int): Total number of allowed values over every attribute.
+        max_allowed (int): Length of the longest allowed value list.
+        rendered_bytes (int): Size of the rendered document in bytes.
+        attributes_seconds (float): Time spent rendering the attributes.
+        example_seconds (float): Time spent generating the example input.
+    """
+    __slots__ = ('class_name', 'schema_index', 'attributes', 'max_depth', 'nested_sections', 'allowed_values',
+                 'max_allowed', 'rendered_bytes', 'attributes_seconds', 'example_seconds')
+
+    def __init__(self, class_name: str, schema_index: int) -> None:
+        """
+        SchemaCounters constructor
+
+        Args:
+            class_name (str): Name of the class.
+            schema_index (int): Index of the schema in the schemas of the class.
+        """
+        self.class_name: str = class_name
+        self.schema_index: int = schema_index
+        self.attributes: int = 0
+        self.max_depth: int = 0
+        self.nested_sections: int = 0
+        self.allowed_values: int = 0
+        self.max_allowed: int = 0
+        self.rendered_bytes: int = 0
+        self.attributes_seconds: float = 0.0
+        self.example_seconds: float = 0.0
+
+    def count_attribute(self, attribute: Dict[str, Any], depth: int) -> None:
+        """
+        Counts an attribute.
+
+        Args:
+            attribute (Dict[str, Any]): The attribute.
+            depth (int): Nesting level of the attribute.
+        """
+        self.attributes += 1
+        self.max_depth = max(self.max_depth, depth)
+        allowed = attribute.get('allowed')
+        if allowed:
+            self.allowed_values += len(allowed)
+            self.max_allowed = max(self.max_allowed, len(allowed))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns the counters as a dict with the keys of STATS_FIELDS.
+        """
+        return {
+            'class': self.class_name,
+            'schema': self.schema_index,
+            'attributes': self.attributes,
+            'max_depth': self.max_depth,
+            'nested_sections': self.nested_sections,
+            'allowed_values': self.allowed_values,
+            'max_allowed': self.max_allowed,
+            'rendered_bytes': self.rendered_bytes,
+            'attributes_seconds': round(self.attributes_seconds, 6),
+            'example_seconds': round(self.example_seconds, 6),
+        }
+
+
+class SchemaStats:
+    """
+    Collects the :class:`SchemaCounters` of every rendered schema of a build, to find the schemas that make a build
+    expensive. Counters are filled in by MarkDownUtils while rendering, so collecting them needs no extra pass over the
+    schemas. Counters can be added from several threads.
+    """
+    def __init__(self) -> None:
+        """
+        SchemaStats constructor
+        """
+        self.counters: List[SchemaCounters] = []
+        self._lock = threading.Lock()
+
+    def add(self, counters: SchemaCounters) -> None:
+        """
+        Adds the counters of a rendered schema.
+
+        Args:
+            counters (SchemaCounters): The counters.
+        """
+        with self._lock:
+            self.counters.append(counters)
+
+    def rows(self, sort_by: str = 'rendered_bytes') -> List[Dict[str, Any]]:
+        """
+        Returns the counters of every schema as dicts, sorted by a field, largest first. Ties are sorted by class name
+        and schema index.
+
+        Args:
+            sort_by (str): One of STATS_FIELDS.
+
+        Raises:
+            :class:`.CerberusDocsException`: Unknown field
+        """
+        if sort_by not in STATS_FIELDS:
+            raise CerberusDocsException(f'Unknown stats field {sort_by}, expected one of {", ".join(STATS_FIELDS)}')
+        rows = sorted((counters.to_dict() for counters in self.counters), key=lambda row: (row['class'], row['schema']))
+        if sort_by not in ('class', 'schema'):
+            rows.sort(key=lambda row: row[sort_by], reverse=True)
+        return rows
+
+    def to_csv(self, sort_by: str = 'rendered_bytes') -> str:
+        """
+        Returns the stats as CSV with a header row.
+
+        Args:
+            sort_by (str): Field to sort by, see :meth:`rows`.
+        """
+        output = io.StringIO()
+        writer = csv.DictWriter(output, fieldnames=STATS_FIELDS, lineterminator='\n')
+        writer.writeheader()
+        writer.writerows(self.rows(sort_by))
+        return output.getvalue()
+
+    def to_json(self, sort_by: str = 'rendered_bytes') -> str:
+        """
+        Returns the stats as JSON.
+
+        Args:
+            sort_by (str): Field to sort by, see :meth:`rows`.
+        """
+        return json.dumps({'schemas': self.rows(sort_by)}, indent=2) + '\n'
+
+    def write(self, path: str, sort_by: str = 'rendered_bytes') -> None:
+        """
+        Writes the stats to a file, as JSON if the path ends with .json and as CSV otherwise.
+
+        Args:
+            path (str): Path of the stats file.
+            sort_by (str): Field to sort by, see :meth:`rows`.
+        """
+        content = self.to_json(sort_by) if path.endswith('.json') else self.to_csv(sort_by)
+        with open(path, 'w', encoding='utf-8', newline='') as stats_file:
+            stats_file.write(content)
@@ -0,0 +1,284 @@
+import os
+import json
+import sqlite3
+import hashlib
+import threading
+import contextlib
+import urllib.parse
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Set, Tuple
+
+from .exceptions import CerberusDocsException
+from .schema_snapshot import _json_default
+from .types import Schema, SchemaMap
+
+SEARCH_SCHEMA_VERSION: int = 2
+# The tables are created in the transaction of the build, so they are rolled back with it.
+_SCHEMA = f'''
+BEGIN;
+CREATE TABLE IF NOT EXISTS search_version (version INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS sources (source TEXT PRIMARY KEY, key TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    class TEXT NOT NULL,
+    schema INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    title TEXT,
+    type TEXT,
+    required INTEGER,
+    allowed TEXT,
+    regex TEXT,
+    description TEXT,
+    document TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_source ON entries (source);
+CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(class, path, title, description);
+INSERT INTO search_version SELECT {SEARCH_SCHEMA_VERSION} WHERE NOT EXISTS (SELECT 1 FROM search_version);
+'''
+_INSERT_ENTRY = '''
+INSERT INTO entries (source, kind, class, schema, path, title, type, required, allowed, regex, description, document)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+SearchRow = Tuple[
+    str, str, str, int, str, Optional[str], Optional[str], Optional[int], Optional[str], Optional[str], Optional[str],
+    str
+]
+
+
+def _nested_schema(attribute: Dict[str, Any], path: str) -> Tuple[Optional[Schema], str]:
+    """
+    Returns the nested schema of a dict attribute or of the dict items of a list attribute, and the path prefix of its
+    attributes, or None if the attribute has no nested schema.
+    """
+    nested = attribute.get('schema')
+    if not isinstance(nested, dict):
+        return None, ''
+    if attribute.get('type') == 'dict':
+        return nested, f'{path}.'
+    item_schema = nested.get('schema') if nested.get('type') == 'dict' else None
+    if attribute.get('type') == 'list' and isinstance(item_schema, dict):
+        return item_schema, f'{path}[].'
+    return None, ''
+
+
+def _iter_schema_rows(section: str, schema: Schema, prefix: str, sections: Dict[int, str]
+                      ) -> Iterator[Tuple[str, str, Optional[str], Dict[str, Any]]]:
+    """
+    Yields the kind ('attribute' or 'schema'), dotted path, section title and rules of every attribute and nested
+    schema of a schema, including those of nested schemas. Items of lists are marked with '[]'. Nested schemas are
+    titled like the section MarkDownUtils renders them in, so a nested schema shared by several attributes has the
+    title of its first section.
+    """
+    nested: List[Tuple[str, str, Schema, str]] = []
+    for attribute_name, attribute in schema.items():
+        path = f'{prefix}{attribute_name}'
+        yield 'attribute', path, None, attribute
+        nested_schema, nested_prefix = _nested_schema(attribute, path)
+        if nested_schema is not None:
+            title = sections.setdefault(id(attribute['schema']), f'{section}{attribute_name.capitalize()}')
+            nested.append((path, title, nested_schema, nested_prefix))
+    for path, title, nested_schema, nested_prefix in nested:
+        yield 'schema', path, title, {}
+        yield from _iter_schema_rows(title, nested_schema, nested_prefix, sections)
+
+
+class SearchIndex:
+    """
+    SQLite database with a row per documented class, nested schema and attribute, and an FTS5 full-text index over
+    the class names, paths, section titles and descriptions. The kind column of a row is 'class', 'schema' or
+    'attribute'. Attribute rows have the type, required, allowed, regex and description of the attribute, and nested
+    schema rows the title of the section the schema is rendered in, e.g. to find every schema with a customer_id
+    attribute:
+
+    .. code-block:: sql
+
+        SELECT class, path, document FROM entries
+        WHERE id IN (SELECT rowid FROM entries_fts WHERE entries_fts MATCH 'customer_id') AND kind = 'attribute'
+
+    Every build updates the database in one transaction, which is rolled back if the build fails, see
+    :meth:`abort`. Sources whose schemas did not change since the previous build keep their rows, and the rows of
+    sources that are no longer part of the build are removed. The database can be written to from several threads.
+    """
+    def __init__(self, database_path: str) -> None:
+        """
+        SearchIndex constructor. Opens or creates the database and starts the transaction of the build.
+
+        Args:
+            database_path (str): Path of the SQLite database.
+
+        Raises:
+            :class:`.CerberusDocsException`: The database cannot be opened, or SQLite was built without FTS5
+        """
+        self.database_path: str = database_path
+        self.updated_sources: int = 0
+        self._seen: Set[str] = set()
+        self._lock = threading.Lock()
+        self._created: bool = not os.path.exists(database_path)
+        self._connection: Optional[sqlite3.Connection] = None
+        try:
+            self._connection = sqlite3.connect(database_path, isolation_level=None, check_same_thread=False)
+            self._connection.executescript(_SCHEMA)
+            version = self._connection.execute('SELECT version FROM search_version').fetchone()[0]
+        except sqlite3.Error as e:
+            self.abort()
+            raise CerberusDocsException(f'Search database {database_path} cannot be opened: {e}')
+        if version != SEARCH_SCHEMA_VERSION:
+            self.abort()
+            raise CerberusDocsException(f'Unsupported search database version {version} in {database_path}')
+
+    @staticmethod
+    def source_key(schema_map: SchemaMap, document_names: Mapping[str, str]) -> str:
+        """
+        Returns a hash of the schemas and document names of a source, which changes whenever its rows change.
+
+        Args:
+            schema_map (SchemaMap): The schemas extracted from the source.
+            document_names (Mapping[str, str]): File name of the document of every class.
+        """
+        serialized = json.dumps([schema_map, document_names], default=_json_default, sort_keys=True)
+        return hashlib.sha1(serialized.encode()).hexdigest()
+
+    @staticmethod
+    def rows(source_name: str, schema_map: SchemaMap, document_names: Mapping[str, str]) -> List[SearchRow]:
+        """
+        Returns the rows of every class, nested schema and attribute of the schemas of a source.
+
+        Args:
+            source_name (str): Relative path or module name of the source.
+            schema_map (SchemaMap): The schemas extracted from the source.
+            document_names (Mapping[str, str]): File name of the document of every class.
+        """
+        rows: List[SearchRow] = []
+        for class_name, schemas in schema_map.items():
+            for schema_index, schema in enumerate(schemas):
+                rows.append((
+                    source_name, 'class', class_name, schema_index, '', class_name, None, None, None, None, None,
+                    document_names[class_name],
+                ))
+                for kind, path, title, attribute in _iter_schema_rows(class_name, schema, '', {}):
+                    attribute_type = attribute.get('type')
+                    required = attribute.get('required')
+                    allowed = attribute.get('allowed')
+                    description = (attribute.get('meta') or {}).get('description')
+                    rows.append((
+                        source_name,
+                        kind,
+                        class_name,
+                        schema_index,
+                        path,
+                        title,
+                        ', '.join(attribute_type) if isinstance(attribute_type, list) else attribute_type,
+                        None if required is None else int(bool(required)),
+                        None if allowed is None else json.dumps(list(allowed), default=_json_default),
+                        None if attribute.get('regex') is None else str(attribute['regex']),
+                        None if description is None else str(description),
+                        document_names[class_name],
+                    ))
+        return rows
+
+    def add(self, source_name: str, schema_map: SchemaMap, document_names: Mapping[str, str]) -> None:
+        """
+        Replaces the rows of a source, unless its schemas did not change since the previous build.
+
+        Args:
+            source_name (str): Relative path or module name of the source.
+            schema_map (SchemaMap): The schemas extracted from the source.
+            document_names (Mapping[str, str]): File name of the document of every class.
+        """
+        key = self.source_key(schema_map, document_names)
+        with self._lock:
+            self._seen.add(source_name)
+            stored = self._connection.execute('SELECT key FROM sources WHERE source = ?', (source_name,)).fetchone()
+            if stored is not None and stored[0] == key:
+                return
+            self._delete_source(source_name)
+            self._connection.executemany(_INSERT_ENTRY, self.rows(source_name, schema_map, document_names))
+            self._connection.execute(
+                'INSERT INTO entries_fts (rowid, class, path, title, description) '
+                'SELECT id, class, path, title, description FROM entries WHERE source = ?', (source_name,)
+            )
+            self._connection.execute('INSERT INTO sources (source, key) VALUES (?, ?)', (source_name, key))
+            self.updated_sources += 1
+
+    def _delete_source(self, source_name: str) -> None:
+        self._connection.execute(
+            'DELETE FROM entries_fts WHERE rowid IN (SELECT id FROM entries WHERE source = ?)', (source_name,)
+        )
+        self._connection.execute('DELETE FROM entries WHERE source = ?', (source_name,))
+        self._connection.execute('DELETE FROM sources WHERE source = ?', (source_name,))
+
+    def close(self, remove_unseen: bool = True) -> None:
+        """
+        Commits the transaction of the build and closes the database. If the transaction cannot be committed, it is
+        rolled back like with :meth:`abort`.
+
+        Args:
+            remove_unseen (bool): Remove the rows of every source that was not added in this build.
+
+        Raises:
+            :class:`.CerberusDocsException`: The transaction cannot be committed
+        """
+        with self._lock:
+            try:
+                if remove_unseen:
+                    for (source_name,) in self._connection.execute('SELECT source FROM sources').fetchall():
+                        if source_name not in self._seen:
+                            self._delete_source(source_name)
+                self._connection.execute('COMMIT')
+            except sqlite3.Error as e:
+                self._abort()
+                raise CerberusDocsException(f'Search database {self.database_path} cannot be written: {e}')
+            self._connection.close()
+            self._connection = None
+            self._created = False
+
+    def abort(self) -> None:
+        """
+        Rolls back the transaction of the build and closes the database, e.g. when the build fails, so the database
+        keeps the rows of the previous build. A database created by this build is removed.
+        """
+        with self._lock:
+            self._abort()
+
+    def _abort(self) -> None:
+        if self._connection is not None:
+            with contextlib.suppress(sqlite3.Error):
+                self._connection.execute('ROLLBACK')
+            self._connection.close()
+            self._connection = None
+        if self._created:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(self.database_path)
+
+    @staticmethod
+    def search(database_path: str, query: str, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        Returns the classes, nested schemas and attributes that match a full-text query, best matches first.
+
+        Args:
+            database_path (str): Path of the SQLite database.
+            query (str): FTS5 query, e.g. 'customer_id', 'description:invoice' or 'title:OrderAddress'.
+            limit (int): Maximum number of results.
+
+        Raises:
+            :class:`.CerberusDocsException`: Search database not found or invalid query
+        """
+        # Opened read-only, since connecting to a missing path would create an empty database.
+        uri = f'file:{urllib.parse.quote(os.path.abspath(database_path))}?mode=ro'
+        try:
+            connection = sqlite3.connect(uri, uri=True)
+        except sqlite3.OperationalError:
+            raise CerberusDocsException(f'Search database {database_path} not found')
+        connection.row_factory = sqlite3.Row
+        try:
+            results = connection.execute(
+                'SELECT entries.* FROM entries_fts JOIN entries ON entries.id = entries_fts.rowid '
+                'WHERE entries_fts MATCH ? ORDER BY rank LIMIT ?', (query, limit)
+            ).fetchall()
+        except sqlite3.OperationalError as e:
+            raise CerberusDocsException(f'Invalid search query {query}: {e}')
+        finally:
+            connection.close()
+        return [dict(row) for row in results]
@@ -1,9 +1,19 @@
 import os
 import sys
 from argparse import ArgumentParser, Namespace
+from typing import Any, Callable, Dict, List, Optional
 
-from .classes.types import SchemaMap
-from .utils.generator import extract_schemas, generate_docs
+from .classes.build_metrics import METRICS_FORMATS
+from .classes.docs_builder import DocsBuilder
+from .classes.example_generator import ExampleGenerator
+from .classes.exceptions import CerberusDocsException
+from .classes.schema_cache import MemorySchemaCache
+from .classes.schema_snapshot import SchemaSnapshot
+from .classes.schema_stats import STATS_FIELDS, SchemaStats
+from .daemon import forward, parse_daemon_args
+from .utils.memory import current_rss, format_rss, peak_rss
+from .utils.schema_diff import diff_snapshots, format_diff_json, format_diff_markdown
+from .utils.shards import merge_shards, parse_shard
 
 
 def dir_path(string: str) -> str:
@@ -22,32 +32,188 @@ def dir_path(string: str) -> str:
         raise NotADirectoryError(string)
 
 
-def parse_args(args) -> None:
+def print_pipeline_metrics(metrics: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Prints the metrics of every pipeline stage as a table.
+
+    Args:
+        metrics (Dict[str, Dict[str, Any]]): The metrics returned by DocsBuilder.build_pipelined.
+    """
+    print(f'{"stage":<10}{"items":>8}{"max depth":>11}{"mean depth":>12}{"blocked s":>11}{"idle s":>9}')
+    for stage, stage_metrics in metrics.items():
+        print(
+            f'{stage:<10}{stage_metrics["items"]:>8}{stage_metrics["max_depth"]:>11}'
+            f'{stage_metrics["mean_depth"]:>12.1f}{stage_metrics["blocked_seconds"]:>11.3f}'
+            f'{stage_metrics["idle_seconds"]:>9.3f}'
+        )
+
+
+def parse_merge_args(args: List[str]) -> None:
+    """
+    The entry point for the merge command.
+    Will combine the build directories of sharded builds into one build directory.
+    """
+    parser: ArgumentParser = ArgumentParser(prog='cerberus-docs merge', description='Merge sharded builds')
+    parser.add_argument('shard_dirs', type=dir_path, nargs='+')
+    parser.add_argument('--build-dir', type=os.path.abspath, action='store', default=os.getcwd())
+    args: Namespace = parser.parse_args(args)
+
+    try:
+        merge_shards(args.shard_dirs, args.build_dir)
+    except CerberusDocsException as e:
+        print(f'Merge failed: {e.message}')
+        sys.exit(1)
+
+    print('Shards successfully merged.')
+
+
+def parse_diff_args(args: List[str]) -> None:
+    """
+    The entry point for the diff command.
+    Will print the schema changes between the snapshots of two builds.
+    """
+    parser: ArgumentParser = ArgumentParser(prog='cerberus-docs diff', description='Compare the schemas of two builds')
+    parser.add_argument('old')
+    parser.add_argument('new')
+    parser.add_argument('--format', choices=['md', 'json'], action='store', default='md')
+    parser.add_argument('--output', type=os.path.abspath, action='store', default=None)
+    args: Namespace = parser.parse_args(args)
+
+    try:
+        changes = diff_snapshots(SchemaSnapshot.read(args.old), SchemaSnapshot.read(args.new))
+    except CerberusDocsException as e:
+        print(f'Diff failed: {e.message}')
+        sys.exit(1)
+
+    result = format_diff_json(changes) if args.format == 'json' else format_diff_markdown(changes)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            output_file.write(result)
+    else:
+        sys.stdout.write(result)
+
+
+def run_build(args: Namespace, memory_cache: Optional[MemorySchemaCache] = None) -> None:
+    """
+    Builds the documentation with the options parsed by parse_args.
+
+    Args:
+        args (Namespace): The parsed options.
+        memory_cache (Optional[MemorySchemaCache]): In-memory schema cache of a long running process.
+
+    Raises:
+        :class:`.CerberusDocsException`: The build failed
+    """
+    stats: Optional[SchemaStats] = SchemaStats() if args.stats else None
+    builder = DocsBuilder(
+        args.source_dir,
+        args.build_dir,
+        cache_dir=args.cache_dir,
+        shard=args.shard,
+        stream=args.stream,
+        example_generator=ExampleGenerator(seed=args.example_seed, validate=args.validate_examples),
+        evict_modules=args.evict_modules,
+        keep_modules=args.keep_modules,
+        allowed_threshold=args.allowed_threshold,
+        snapshot=args.snapshot,
+        archive=args.archive,
+        precompress=args.precompress,
+        memory_cache=memory_cache,
+        stub_imports=args.stub_imports,
+        stats=stats,
+        index=args.index,
+        search_db=args.search_db
+    )
+    if args.package:
+        builder.build_package(args.package)
+    elif args.from_cache:
+        builder.build_from_cache()
+    elif args.pipeline:
+        metrics = builder.build_pipelined(args.queue_size, args.write_queue_size, args.writers)
+        print_pipeline_metrics(metrics)
+    else:
+        builder.build()
+    if stats:
+        stats.write(args.stats, args.stats_sort)
+    if args.metrics_file:
+        builder.metrics.write(args.metrics_file, args.metrics_format)
+
+
+SUBCOMMANDS: Dict[str, Callable[[List[str]], None]] = {
+    'merge': parse_merge_args,
+    'diff': parse_diff_args,
+    'daemon': parse_daemon_args,
+}
+
+
+def parse_args(args, memory_cache: Optional[MemorySchemaCache] = None) -> None:
     """
     The entry point for argparse.
     Will generate documentation of the CerberusSchemas that can be found in the given source-dir
+
+    Args:
+        args: The command line arguments.
+        memory_cache (Optional[MemorySchemaCache]): In-memory schema cache, used when running in the daemon.
     """
+    if args and args[0] in SUBCOMMANDS:
+        return SUBCOMMANDS[args[0]](args[1:])
+
     parser: ArgumentParser = ArgumentParser(prog='cerberus-docs', description='Cerberus-docs package')
     parser.add_argument('--source-dir', type=dir_path, action='store', default=os.getcwd())
     parser.add_argument('--build-dir', type=dir_path, action='store', default=os.getcwd())
+    parser.add_argument('--package', action='store', default=None, metavar='NAME')
+    parser.add_argument('--cache-dir', type=os.path.abspath, action='store', default=None)
+    parser.add_argument('--from-cache', action='store_true')
+    parser.add_argument('--shard', type=parse_shard, action='store', default=None, metavar='INDEX/COUNT')
+    parser.add_argument('--stream', action='store_true')
+    parser.add_argument('--pipeline', action='store_true')
+    parser.add_argument('--queue-size', type=int, action='store', default=64)
+    parser.add_argument('--write-queue-size', type=int, action='store', default=64)
+    parser.add_argument('--writers', type=int, action='store', default=4)
+    parser.add_argument('--example-seed', type=int, action='store', default=0)
+    parser.add_argument('--validate-examples', action='store_true')
+    parser.add_argument('--evict-modules', action='store_true')
+    parser.add_argument('--keep-modules', action='store', nargs='+', default=[], metavar='MODULE')
+    parser.add_argument('--report-memory', action='store_true')
+    parser.add_argument('--allowed-threshold', type=int, action='store', default=None, metavar='COUNT')
+    parser.add_argument('--snapshot', action='store_true')
+    parser.add_argument('--archive', type=os.path.abspath, action='store', default=None, metavar='PATH')
+    parser.add_argument('--precompress', action='store_true')
+    parser.add_argument('--stub-imports', action='store', nargs='*', default=None, metavar='PACKAGE')
+    parser.add_argument('--stats', type=os.path.abspath, action='store', default=None, metavar='PATH')
+    parser.add_argument('--stats-sort', action='store', choices=STATS_FIELDS, default='rendered_bytes')
+    parser.add_argument('--index', action='store_true')
+    parser.add_argument('--search-db', type=os.path.abspath, action='store', default=None, metavar='PATH')
+    parser.add_argument('--metrics-file', type=os.path.abspath, action='store', default=None, metavar='PATH')
+    parser.add_argument('--metrics-format', action='store', choices=METRICS_FORMATS, default='openmetrics')
     args: Namespace = parser.parse_args(args)
 
-    for root, dirs, filenames in os.walk(args.source_dir):
-        for name in filenames:
-            if name.endswith('.py'):
-                file_path: str = os.path.join(root, name)
-                try:
-                    schema_map: SchemaMap = extract_schemas(name, file_path)
-                    generate_docs(schema_map, args.build_dir)
-                except Exception as e:
-                    print(f'{file_path} failed: {e}')
-                    continue
+    if args.from_cache and not args.cache_dir:
+        parser.error('--from-cache requires --cache-dir')
+    if args.pipeline and (args.stream or args.from_cache):
+        parser.error('--pipeline cannot be combined with --stream or --from-cache')
+    if args.package and (args.from_cache or args.pipeline or args.stub_imports is not None):
+        parser.error('--package cannot be combined with --from-cache, --pipeline or --stub-imports')
+    if args.index and (args.from_cache or args.pipeline):
+        parser.error('--index cannot be combined with --from-cache or --pipeline')
+
+    try:
+        run_build(args, memory_cache)
+    except CerberusDocsException as e:
+        print(f'Build failed: {e.message}')
+        sys.exit(1)
 
     print('Docs successfully generated.')
+    if args.report_memory:
+        print(f'Peak RSS: {format_rss(peak_rss())}, final RSS: {format_rss(current_rss())}')
 
 
 def main() -> None:
-    parse_args(sys.argv[1:])  # pragma: no cover
+    args = sys.argv[1:]  # pragma: no cover
+    exit_code = forward(args) if args[:1] != ['daemon'] else None  # pragma: no cover
+    if exit_code is not None:  # pragma: no cover
+        sys.exit(exit_code)
+    parse_args(args)  # pragma: no cover
 
 
 if __name__ == '__main__':
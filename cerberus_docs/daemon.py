@@ -0,0 +1,360 @@
+import io
+import os
+import sys
+import json
+import stat
+import time
+import socket
+import struct
+import tempfile
+import threading
+import traceback
+import subprocess
+import socketserver
+import contextlib
+from argparse import ArgumentParser, Namespace
+from typing import Any, Dict, List, Optional, Tuple
+
+from .classes.exceptions import CerberusDocsException
+from .classes.schema_cache import MemorySchemaCache
+
+SOCKET_ENV: str = 'CERBERUS_DOCS_SOCKET'
+DISABLE_ENV: str = 'CERBERUS_DOCS_NO_DAEMON'
+START_TIMEOUT: float = 10.0
+
+
+def default_socket_path() -> str:
+    """
+    Returns the path of the daemon socket: $CERBERUS_DOCS_SOCKET if set, otherwise a per-user socket in
+    $XDG_RUNTIME_DIR, or in a per-user directory in the temporary directory, which the daemon creates only
+    accessible to the current user.
+    """
+    if os.environ.get(SOCKET_ENV):
+        return os.environ[SOCKET_ENV]
+    uid = getattr(os, 'getuid', lambda: 0)()
+    if os.environ.get('XDG_RUNTIME_DIR'):
+        return os.path.join(os.environ['XDG_RUNTIME_DIR'], f'cerberus-docs-{uid}.sock')
+    return os.path.join(tempfile.gettempdir(), f'cerberus-docs-{uid}', 'daemon.sock')
+
+
+def secure_socket_directory(directory: str) -> None:
+    """
+    Creates the directory of the daemon socket, only accessible to the current user, if it does not exist, and
+    checks that no other user can replace the socket in it: the directory must be owned by the current user and not
+    writable by other users, or have the sticky bit set like the temporary directory.
+
+    Args:
+        directory (str): The directory of the socket.
+
+    Raises:
+        :class:`.CerberusDocsException`: Other users can replace the socket in the directory
+    """
+    with contextlib.suppress(FileExistsError):
+        os.makedirs(directory, 0o700)
+    status = os.stat(directory)
+    private = status.st_uid == os.getuid() and not status.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+    if not private and not status.st_mode & stat.S_ISVTX:
+        raise CerberusDocsException(f'Other users can replace the daemon socket in {directory}')
+
+
+def python_environment() -> Dict[str, str]:
+    """
+    Returns what decides which modules a build imports: the interpreter, its installation prefix, e.g. a virtualenv,
+    and $PYTHONPATH. Builds run with the sys.path and environment variables of the daemon, so the daemon only runs
+    commands of clients with the same Python environment.
+    """
+    return {'executable': sys.executable, 'prefix': sys.prefix, 'pythonpath': os.environ.get('PYTHONPATH', '')}
+
+
+def peer_uid(connection: socket.socket) -> Optional[int]:
+    """
+    Returns the user id of the process on the other end of a Unix domain socket, or None if the platform does not
+    report it.
+
+    Args:
+        connection (socket.socket): A connected Unix domain socket.
+    """
+    if not hasattr(socket, 'SO_PEERCRED'):
+        return None
+    credentials = connection.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i'))
+    return struct.unpack('3i', credentials)[1]
+
+
+class ModuleTracker:
+    """
+    Tracks the modification time of the source of every imported module, to remove modules whose source changed
+    from sys.modules before they are used again.
+    """
+    def __init__(self) -> None:
+        """
+        ModuleTracker constructor
+        """
+        self._mtimes: Dict[str, Tuple[str, int]] = {}
+
+    def invalidate(self) -> List[str]:
+        """
+        Removes every module whose source changed since the last call from sys.modules and starts tracking the
+        modules imported since the last call.
+
+        Returns:
+            The names of the removed modules.
+        """
+        changed: List[str] = []
+        mtimes: Dict[str, Tuple[str, int]] = {}
+        for module_name, module in list(sys.modules.items()):
+            file_path = getattr(module, '__file__', None)
+            try:
+                mtime = os.stat(file_path).st_mtime_ns if file_path else None
+            except OSError:
+                mtime = None
+            if mtime is None:
+                continue
+            tracked = self._mtimes.get(module_name)
+            if tracked is not None and tracked != (file_path, mtime):
+                del sys.modules[module_name]
+                changed.append(module_name)
+            else:
+                mtimes[module_name] = (file_path, mtime)
+        self._mtimes = mtimes
+        return changed
+
+
+class SchemaDaemon:
+    """
+    Runs forwarded CLI commands in-process with a shared in-memory schema cache.
+    """
+    def __init__(self) -> None:
+        """
+        SchemaDaemon constructor
+        """
+        self.memory_cache: MemorySchemaCache = MemorySchemaCache()
+        self.module_tracker: ModuleTracker = ModuleTracker()
+        self.module_tracker.invalidate()
+
+    def run(self, cwd: str, args: List[str]) -> Dict[str, Any]:
+        """
+        Runs a CLI command as if it was started in the given working directory.
+        If the source of an imported module changed, the module is imported again and the schema cache is cleared,
+        since any cached schema may depend on the changed module.
+
+        Args:
+            cwd (str): Working directory of the client.
+            args (List[str]): Command line arguments of the client.
+
+        Returns:
+            The exit code and the output of the command.
+        """
+        from .cli import parse_args
+
+        if self.module_tracker.invalidate():
+            self.memory_cache.clear()
+        stdout, stderr = io.StringIO(), io.StringIO()
+        exit_code = 0
+        previous_cwd = os.getcwd()
+        try:
+            os.chdir(cwd)
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                parse_args(args, memory_cache=self.memory_cache)
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+            if isinstance(e.code, str):
+                stderr.write(f'{e.code}\n')
+        except Exception:
+            exit_code = 1
+            stderr.write(traceback.format_exc())
+        finally:
+            os.chdir(previous_cwd)
+        self.module_tracker.invalidate()
+        return {'exit_code': exit_code, 'stdout': stdout.getvalue(), 'stderr': stderr.getvalue()}
+
+    def handle(self, request: Dict[str, Any], server: socketserver.BaseServer) -> Dict[str, Any]:
+        """
+        Handles a request from a client.
+
+        A run request is rejected if the client runs in another Python environment, see :func:`python_environment`.
+
+        Args:
+            request (Dict[str, Any]): The request, with a command ('run', 'ping' or 'stop') and its arguments.
+            server (socketserver.BaseServer): The server that received the request.
+        """
+        command = request.get('command')
+        if command == 'run':
+            cwd, args = request['cwd'], request['args']
+            if request.get('environment') != python_environment():
+                return {'error': f'The daemon runs in another Python environment: {python_environment()}'}
+            return self.run(cwd, args)
+        if command == 'stop':
+            # shutdown blocks until serve_forever returns, so it cannot be called from the serving thread.
+            threading.Thread(target=server.shutdown, daemon=True).start()
+        return {'pid': os.getpid(), 'cached': len(self.memory_cache)}
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        # The socket is only accessible to the current user, this also rejects other users where the platform
+        # reports the peer.
+        if peer_uid(self.request) not in (None, os.getuid()):
+            return
+        try:
+            request = json.loads(self.rfile.readline().decode('utf-8'))
+            if not isinstance(request, dict):
+                raise ValueError('expected a JSON object')
+            response = self.server.schema_daemon.handle(request, self.server)
+        except (ValueError, KeyError) as e:
+            response = {'error': f'Invalid request: {e}'}
+        try:
+            self.wfile.write(json.dumps(response).encode('utf-8') + b'\n')
+        except (BrokenPipeError, ConnectionResetError):
+            # The client disconnected before the response, e.g. it was interrupted, so the response is dropped.
+            pass
+
+
+def serve(socket_path: str) -> None:
+    """
+    Runs the daemon in the foreground until it receives a stop request. Requests are handled one at a time,
+    since every request changes the working directory of the process. The socket is created only accessible to the
+    current user, and requests from processes of other users are rejected.
+
+    Args:
+        socket_path (str): Path of the Unix domain socket to listen on.
+
+    Raises:
+        :class:`.CerberusDocsException`: Other users can replace the socket in its directory
+    """
+    secure_socket_directory(os.path.dirname(socket_path))
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(socket_path)
+    # Binding creates the socket, so the umask makes it private from the start instead of after a chmod.
+    previous_umask = os.umask(0o177)
+    try:
+        server = socketserver.UnixStreamServer(socket_path, _RequestHandler)
+    finally:
+        os.umask(previous_umask)
+    server.schema_daemon = SchemaDaemon()
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(socket_path)
+
+
+def send_request(request: Dict[str, Any], socket_path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Sends a request to the daemon and returns its response, or None if the daemon is not running. The request is
+    only sent if the daemon runs as the current user, so arguments are never sent to a socket of another user.
+
+    Args:
+        request (Dict[str, Any]): The request.
+        socket_path (Optional[str]): Path of the daemon socket. Defaults to :func:`default_socket_path`.
+    """
+    if not hasattr(socket, 'AF_UNIX'):
+        return None
+    socket_path = socket_path or default_socket_path()
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        try:
+            client.connect(socket_path)
+            owner = peer_uid(client)
+            if owner is None:
+                owner = os.stat(socket_path).st_uid
+        except OSError:
+            return None
+        if owner != os.getuid():
+            return None
+        try:
+            client.sendall(json.dumps(request).encode('utf-8') + b'\n')
+            with client.makefile('rb') as response_file:
+                response = response_file.readline()
+        except OSError:
+            return None
+        return json.loads(response.decode('utf-8')) if response else None
+    finally:
+        client.close()
+
+
+def forward(args: List[str], socket_path: Optional[str] = None) -> Optional[int]:
+    """
+    Runs a CLI command in the daemon and prints its output.
+
+    Args:
+        args (List[str]): Command line arguments.
+        socket_path (Optional[str]): Path of the daemon socket. Defaults to :func:`default_socket_path`.
+
+    Returns:
+        The exit code of the command, or None if the daemon is not running, runs in another Python environment or is
+        disabled with $CERBERUS_DOCS_NO_DAEMON, in which case the command should run in-process.
+    """
+    if os.environ.get(DISABLE_ENV):
+        return None
+    request = {'command': 'run', 'cwd': os.getcwd(), 'args': args, 'environment': python_environment()}
+    response = send_request(request, socket_path)
+    if response is None or 'error' in response:
+        return None
+    sys.stdout.write(response['stdout'])
+    sys.stderr.write(response['stderr'])
+    return response['exit_code']
+
+
+def start(socket_path: str) -> bool:
+    """
+    Starts the daemon in the background, unless it is already running, and waits until it accepts requests.
+
+    Args:
+        socket_path (str): Path of the daemon socket.
+
+    Returns:
+        If the daemon is running.
+    """
+    if send_request({'command': 'ping'}, socket_path) is not None:
+        return True
+    subprocess.Popen(
+        [sys.executable, '-m', 'cerberus_docs.daemon', 'serve', f'--socket={socket_path}'],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+    deadline = time.monotonic() + START_TIMEOUT
+    while time.monotonic() < deadline:
+        if send_request({'command': 'ping'}, socket_path) is not None:
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def parse_daemon_args(args: List[str]) -> None:
+    """
+    The entry point for the daemon command.
+    Will start, stop or show the status of the daemon, or run it in the foreground with serve.
+    """
+    parser: ArgumentParser = ArgumentParser(prog='cerberus-docs daemon', description='Manage the cerberus-docs daemon')
+    parser.add_argument('action', choices=['start', 'stop', 'status', 'serve'])
+    parser.add_argument('--socket', type=os.path.abspath, action='store', default=default_socket_path())
+    args: Namespace = parser.parse_args(args)
+
+    if not hasattr(socket, 'AF_UNIX'):
+        print('The daemon requires Unix domain sockets, which are not supported on this platform.')
+        sys.exit(1)
+    if args.action == 'serve':
+        try:
+            serve(args.socket)
+        except CerberusDocsException as e:
+            print(f'Daemon failed to start: {e.message}')
+            sys.exit(1)
+    elif args.action == 'start':
+        if not start(args.socket):
+            print('Daemon failed to start.')
+            sys.exit(1)
+        print(f'Daemon running on {args.socket}.')
+    else:
+        response = send_request({'command': 'ping' if args.action == 'status' else 'stop'}, args.socket)
+        if response is None:
+            print('Daemon is not running.')
+            sys.exit(args.action == 'status')
+        print(f'Daemon {response["pid"]} {"stopped" if args.action == "stop" else "running"} on {args.socket}, '
+              f'{response["cached"]} cached modules.')
+
+
+if __name__ == '__main__':
+    parse_daemon_args(sys.argv[1:])  # pragma: no cover
@@ -0,0 +1,232 @@
+"""
+Sphinx extension that renders CerberusSchemas inline with the ``cerberus-schema`` directive.
+
+Enable it in conf.py:
+
+.. code-block:: python
+
+    extensions = ['cerberus_docs.sphinx_extension']
+
+and document a class with:
+
+.. code-block:: rst
+
+    .. cerberus-schema:: pkg.module.Class
+"""
+import os
+import sys
+import pickle
+import importlib
+from importlib import util
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import yaml
+from docutils import nodes
+from docutils.statemachine import StringList
+from sphinx.application import Sphinx
+from sphinx.environment import BuildEnvironment
+from sphinx.util.docutils import SphinxDirective
+
+from . import __version__
+from .classes.exceptions import CerberusDocsException
+from .classes.markdown_utils import MarkDownUtils
+from .classes.types import Attribute, Schema, SchemaMap
+from .utils.generator import extract_module_schemas
+
+ENV_ATTRIBUTE: str = 'cerberus_docs_schemas'
+
+_md_utils = MarkDownUtils('')
+
+
+def _get_env_schemas(env: BuildEnvironment) -> Dict[str, Tuple[float, SchemaMap]]:
+    """
+    Returns the extracted schemas stored in the Sphinx environment, keyed by module name
+    together with the modification time of the module source they were extracted from.
+
+    Args:
+        env (BuildEnvironment): The Sphinx build environment.
+    """
+    if not hasattr(env, ENV_ATTRIBUTE):
+        setattr(env, ENV_ATTRIBUTE, {})
+    return getattr(env, ENV_ATTRIBUTE)
+
+
+def _module_source(module_name: str) -> Optional[str]:
+    """
+    Returns the path of the source file of a module without importing the module itself.
+
+    Args:
+        module_name (str): Dotted name of the module.
+    """
+    spec = util.find_spec(module_name)
+    return spec.origin if spec and spec.has_location else None
+
+
+def get_module_schemas(env: BuildEnvironment, module_name: str) -> Tuple[Optional[str], SchemaMap]:
+    """
+    Returns the source path and the extracted schemas of a module. The schemas are taken from the environment if the
+    module source has not changed since they were extracted, and modules already in sys.modules are not imported again
+    unless their source has changed.
+
+    Args:
+        env (BuildEnvironment): The Sphinx build environment.
+        module_name (str): Dotted name of the module.
+    """
+    env_schemas = _get_env_schemas(env)
+    source_path = _module_source(module_name)
+    mtime = os.path.getmtime(source_path) if source_path else 0.0
+    cached = env_schemas.get(module_name)
+    if cached and cached[0] == mtime:
+        return source_path, cached[1]
+
+    module = sys.modules.get(module_name)
+    if module is None:
+        module = importlib.import_module(module_name)
+    elif cached:
+        module = importlib.reload(module)
+    schema_map = extract_module_schemas(module)
+    try:
+        pickle.dumps(schema_map)
+        env_schemas[module_name] = (mtime, schema_map)
+    except Exception:
+        # Schemas that cannot be pickled (e.g. containing lambdas) cannot be stored in the environment.
+        pass
+    return source_path, schema_map
+
+
+def _literal(value: Any) -> str:
+    """
+    Returns a value as inline reStructuredText literal. Empty values, values with leading or trailing whitespace,
+    which inline markup cannot start or end with, and values with line breaks or other unprintable characters are
+    shown as their repr. Values with backticks use the literal role with escaped backslashes and backticks.
+
+    Args:
+        value (Any): The value to format.
+    """
+    text = str(value)
+    if not text or text != text.strip() or not text.isprintable():
+        text = repr(value)
+    if '`' in text:
+        return ':literal:`' + text.replace('\\', '\\\\').replace('`', '\\`') + '`'
+    return f'``{text}``'
+
+
+def _format_attribute(attribute: Attribute, link: Optional[str]) -> str:
+    """
+    Returns the validation rules of an attribute as a line of reStructuredText,
+    in the same order and with the same separators as the MarkDown documentation.
+
+    Args:
+        attribute (Attribute): The attribute to format.
+        link (Optional[str]): Reference to the section of the nested schema of the attribute.
+    """
+    formatters = {
+        'required': lambda value: '**[required]**' if value else '**[optional]**',
+        'type': lambda value: value,
+        'regex': lambda value: f'must match {_literal(value)}',
+        'default': lambda value: f'defaults to {_literal(value)}',
+        'schema': lambda value: link,
+        'allowed': lambda value: 'one of ' + ', '.join(_literal(allowed) for allowed in value) if value else None,
+    }
+    result: str = ''
+    for rule, value in _md_utils.attribute_rules(attribute):
+        if rule in formatters and value is not None:
+            part = formatters[rule](value)
+            if part:
+                result += part + _md_utils.rule_separator(rule)
+    return result.rstrip(', ')
+
+
+def schema_to_rst(title: str, schema: Schema, target_prefix: str) -> List[str]:
+    """
+    Returns the documentation of a schema as reStructuredText lines: a rubric per (nested) schema with a
+    definition list of its attributes.
+
+    Args:
+        title (str): Title of the schema section.
+        schema (Schema): The schema to document.
+        target_prefix (str): Prefix of the link targets of the sections, to keep them unique across documents.
+    """
+    lines: List[str] = ['', f'.. rubric:: {title}', f'   :name: {target_prefix}.{title}', '']
+    additional_schemas: Dict[str, Schema] = {}
+    for attribute_name, attribute in schema.items():
+        schema_name = f'{title}{attribute_name.capitalize()}'
+        link = None
+        additional_schema = _md_utils.nested_schema(attribute)
+        if additional_schema:
+            additional_schemas[schema_name] = additional_schema
+            link = f'`{schema_name} <{target_prefix}.{schema_name}_>`_'
+        lines.append(f'``{attribute_name}``')
+        lines.append(f'   {_format_attribute(attribute, link) or "any"}')
+        description = (attribute.get('meta') or {}).get('description')
+        if description:
+            lines.extend(['', f'   {description}'])
+        lines.append('')
+    for schema_name, additional_schema in additional_schemas.items():
+        lines.extend(schema_to_rst(schema_name, additional_schema, target_prefix))
+    return lines
+
+
+def example_to_rst(schema: Schema) -> List[str]:
+    """
+    Returns the example of valid input for a schema as a reStructuredText yaml code block.
+
+    Args:
+        schema (Schema): The schema to generate an example for.
+    """
+    example = yaml.dump(_md_utils.example_dict(schema))
+    return ['', '.. code-block:: yaml', ''] + [f'   {line}' for line in example.splitlines()] + ['']
+
+
+class CerberusSchemaDirective(SphinxDirective):
+    """
+    Directive that renders the CerberusSchemas of a class: ``.. cerberus-schema:: pkg.module.Class``
+    """
+    required_arguments = 1
+    has_content = False
+
+    def run(self) -> List[nodes.Node]:
+        qualified_name: str = self.arguments[0]
+        module_name, _, class_name = qualified_name.rpartition('.')
+        if not module_name:
+            raise self.error(f'Expected a qualified class name such as pkg.module.Class, got {qualified_name}')
+        try:
+            source_path, schema_map = get_module_schemas(self.env, module_name)
+        except Exception as e:
+            raise self.error(f'Could not extract schemas from {module_name}: {e}')
+        if source_path:
+            self.env.note_dependency(source_path)
+        if class_name not in schema_map:
+            raise self.error(f'No CerberusSchema found in {qualified_name}')
+
+        lines: List[str] = []
+        try:
+            for schema in schema_map[class_name]:
+                lines.extend(schema_to_rst(class_name, schema, module_name))
+                lines.extend(example_to_rst(schema))
+        except CerberusDocsException as e:
+            raise self.error(f'Could not document {qualified_name}: {e.message}')
+        container = nodes.container(classes=['cerberus-schema'])
+        self.state.nested_parse(StringList(lines, source=qualified_name), self.content_offset, container)
+        return [container]
+
+
+def merge_env_schemas(app: Sphinx, env: BuildEnvironment, docnames: Set[str], other: BuildEnvironment) -> None:
+    """
+    Merges the schemas extracted by a parallel reader process into the main environment.
+    """
+    _get_env_schemas(env).update(_get_env_schemas(other))
+
+
+def setup(app: Sphinx) -> Dict[str, Any]:
+    """
+    Entry point of the Sphinx extension.
+    """
+    app.add_directive('cerberus-schema', CerberusSchemaDirective)
+    app.connect('env-merge-info', merge_env_schemas)
+    return {
+        'version': __version__,
+        'env_version': 1,
+        'parallel_read_safe': True,
+        'parallel_write_safe': True,
+    }
@@ -0,0 +1,162 @@
+import os
+import sys
+import hashlib
+import builtins
+import importlib.util
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Set
+
+# Dependency graph of source files: the files every file imports directly, by path relative to the source directory.
+Dependencies = Mapping[str, Iterable[str]]
+
+
+def file_hash(file_path: str) -> Optional[str]:
+    """
+    Returns the sha256 hash of the content of a file, or None if the file does not exist.
+
+    Args:
+        file_path (str): Path of the file.
+    """
+    try:
+        with open(file_path, 'rb') as source:
+            return hashlib.sha256(source.read()).hexdigest()
+    except OSError:
+        return None
+
+
+class DependencyRecorder:
+    """
+    Context manager that records which files of the source directory every file of the source directory imports
+    while it is active, by wrapping builtins.__import__.
+
+    Every executed import statement is recorded, also of modules that are already in sys.modules, so a fragment
+    imported by many sources is recorded for every one of them, unlike with diffing sys.modules. Modules imported
+    with importlib.import_module are not recorded.
+    """
+    def __init__(self, root_dir: str) -> None:
+        """
+        DependencyRecorder constructor
+
+        Args:
+            root_dir (str): The source directory. Only files inside it are recorded.
+        """
+        self.root_dir: str = os.path.realpath(root_dir)
+        self.dependencies: Dict[str, Set[str]] = {}
+        self._relative_paths: Dict[str, Optional[str]] = {}
+        self._import: Optional[Callable[..., ModuleType]] = None
+
+    def relative_path(self, file_path: Optional[str]) -> Optional[str]:
+        """
+        Returns the path of a python file relative to the source directory with '/' separators, or None if it is
+        not a python file inside the source directory.
+
+        Args:
+            file_path (Optional[str]): Path of the file, e.g. the __file__ of a module.
+        """
+        if not file_path:
+            return None
+        if file_path not in self._relative_paths:
+            path = os.path.realpath(file_path)
+            try:
+                is_local = path.endswith('.py') and os.path.commonpath([path, self.root_dir]) == self.root_dir
+            except ValueError:
+                is_local = False
+            relative_path = os.path.relpath(path, self.root_dir).replace(os.sep, '/') if is_local else None
+            self._relative_paths[file_path] = relative_path
+        return self._relative_paths[file_path]
+
+    def _imported_modules(self, name: str, globals_: Mapping[str, Any], fromlist: Iterable[str], level: int
+                          ) -> List[Optional[ModuleType]]:
+        """
+        Returns the modules an import statement loaded: the imported module, its parent packages and every
+        submodule in the fromlist.
+        """
+        if level:
+            try:
+                name = importlib.util.resolve_name(f'{"." * level}{name}', globals_.get('__package__'))
+            except (ImportError, ValueError):
+                return []
+        parts = name.split('.')
+        modules = [sys.modules.get('.'.join(parts[:i])) for i in range(1, len(parts) + 1)]
+        modules.extend(sys.modules.get(f'{name}.{item}') for item in fromlist or () if item != '*')
+        return modules
+
+    def _record(self, name: str, globals_: Optional[Mapping[str, Any]], fromlist: Iterable[str], level: int) -> None:
+        importer = self.relative_path(globals_.get('__file__')) if globals_ else None
+        if importer is None:
+            return
+        dependencies = self.dependencies.setdefault(importer, set())
+        for module in self._imported_modules(name, globals_, fromlist, level):
+            dependency = self.relative_path(getattr(module, '__file__', None))
+            if dependency is not None and dependency != importer:
+                dependencies.add(dependency)
+
+    def __enter__(self) -> 'DependencyRecorder':
+        original_import = self._import = builtins.__import__
+
+        # Same signature as builtins.__import__, which can also be called with keyword arguments.
+        def recording_import(name: str, globals: Optional[Mapping[str, Any]] = None, locals: Any = None,
+                             fromlist: Iterable[str] = (), level: int = 0) -> ModuleType:
+            module = original_import(name, globals, locals, fromlist, level)
+            self._record(name, globals, fromlist, level)
+            return module
+
+        builtins.__import__ = recording_import
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        builtins.__import__ = self._import
+
+
+def dependents(dependencies: Dependencies, changed: Iterable[str]) -> Set[str]:
+    """
+    Returns the changed files and every file that imports one of them, directly or through other files.
+
+    Args:
+        dependencies (Dependencies): The dependency graph.
+        changed (Iterable[str]): The changed files.
+    """
+    importers: Dict[str, Set[str]] = {}
+    for importer, imported in dependencies.items():
+        for dependency in imported:
+            importers.setdefault(dependency, set()).add(importer)
+    result = set(changed)
+    pending = list(result)
+    while pending:
+        for importer in importers.get(pending.pop(), ()):
+            if importer not in result:
+                result.add(importer)
+                pending.append(importer)
+    return result
+
+
+def reachable(dependencies: Dependencies, roots: Iterable[str]) -> Set[str]:
+    """
+    Returns the roots and every file they import, directly or through other files.
+
+    Args:
+        dependencies (Dependencies): The dependency graph.
+        roots (Iterable[str]): The files to start from.
+    """
+    result = set(roots)
+    pending = list(result)
+    while pending:
+        for dependency in dependencies.get(pending.pop(), ()):
+            if dependency not in result:
+                result.add(dependency)
+                pending.append(dependency)
+    return result
+
+
+def changed_files(file_hashes: Mapping[str, str], root_dir: str) -> Set[str]:
+    """
+    Returns the files whose content changed, or that were removed, since their hashes were recorded.
+
+    Args:
+        file_hashes (Mapping[str, str]): Hash of every file, by path relative to the source directory.
+        root_dir (str): The source directory.
+    """
+    return {
+        relative_path for relative_path, recorded_hash in file_hashes.items()
+        if file_hash(os.path.join(root_dir, *relative_path.split('/'))) != recorded_hash
+    }
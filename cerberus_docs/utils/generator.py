@@ -1,28 +1,74 @@
+import os
 import sys
 import inspect
+import logging
+import pkgutil
+import importlib
 from importlib import util
 from types import ModuleType
-from typing import Dict, List
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
 
 from ..classes.cerberus_schema import CerberusSchema
 from ..classes.markdown_utils import MarkDownUtils
 from ..classes.types import SchemaMap, Schema
+from .import_stubs import contains_stubs, stubbed_imports
+from .memory import evicting_modules
 
+logger = logging.getLogger(__name__)
 
-def extract_schemas(file_name: str, file_path: str) -> SchemaMap:
+
+def extract_schemas(file_name: str, file_path: str, stub_imports: Optional[Sequence[str]] = None,
+                    source_dir: Optional[str] = None) -> SchemaMap:
     """
     Imports module at the provided file_path and name,
     finds all CerberusSchema classes and extracts the schemas into a schema map.
 
+    With stub_imports, the module is first imported with placeholder modules for the given packages, or for every
+    third-party package if the sequence is empty, so heavy dependencies that the schemas do not need are not imported.
+    The stub modules and every module of the source directory imported during that attempt are evicted afterwards,
+    while other modules, e.g. third-party ones that are not stubbed, stay loaded. If the import fails, the schemas
+    contain a placeholder or a placeholder was iterated over or converted to a string, the module is imported again
+    with real imports.
+
     Args:
          file_name (str): Name of the file.
          file_path (str): Path of the file.
+         stub_imports (Optional[Sequence[str]]): Top-level packages to stub, empty to stub every third-party package.
+         source_dir (Optional[str]): Directory of the modules that may hold placeholders after the stubbed attempt.
+             Defaults to the directory of the file.
 
     Returns:
         Returns the extracted schemas in a SchemaMap
     """
+    if stub_imports is not None:
+        try:
+            directory = source_dir or os.path.dirname(file_path)
+            with evicting_modules(directory=directory), stubbed_imports(stub_imports) as finder:
+                schema_map = extract_module_schemas(import_module(file_name, file_path))
+            if not finder.tainted and not contains_stubs(schema_map):
+                return schema_map
+            logger.debug('Schemas of %s depend on a stubbed package, retrying with real imports', file_path)
+        except Exception as e:
+            logger.debug('Extracting %s with stubbed imports failed, retrying with real imports: %s', file_path, e)
     module = import_module(file_name, file_path)
-    classes = [obj[1] for obj in inspect.getmembers(module) if inspect.isclass(obj[1])]
+    return extract_module_schemas(module)
+
+
+def extract_module_schemas(module: ModuleType, defined_only: bool = False) -> SchemaMap:
+    """
+    Finds all CerberusSchema classes of an already imported module and extracts the schemas into a schema map.
+
+    Args:
+         module (ModuleType): The module to extract schemas from.
+         defined_only (bool): Skip classes that are imported into the module rather than defined in it.
+
+    Returns:
+        Returns the extracted schemas in a SchemaMap
+    """
+    classes = [
+        obj[1] for obj in inspect.getmembers(module)
+        if inspect.isclass(obj[1]) and (not defined_only or obj[1].__module__ == module.__name__)
+    ]
     schema_map: SchemaMap = {}
     for class_ in classes:
         schemas: List[Dict] = []
@@ -35,6 +81,51 @@ def extract_schemas(file_name: str, file_path: str) -> SchemaMap:
     return schema_map
 
 
+def extract_schemas_by_name(module_name: str) -> SchemaMap:
+    """
+    Imports a module by its dotted name and extracts the schemas of the classes defined in it into a schema map.
+    Modules that are already in sys.modules are not imported again, and modules inside wheels or zip files are
+    supported.
+
+    Args:
+         module_name (str): Dotted name of the module.
+
+    Returns:
+        Returns the extracted schemas in a SchemaMap
+    """
+    return extract_module_schemas(importlib.import_module(module_name), defined_only=True)
+
+
+def iter_package_modules(package_name: str, errors: Optional[Dict[str, Exception]] = None) -> Iterator[str]:
+    """
+    Yields the dotted name of a package and of every module and subpackage in it, without importing the modules.
+    Subpackages are imported to find their submodules. A plain module only yields its own name. Subpackages that
+    fail to import are not yielded, and neither are their submodules, which cannot be found without importing them.
+
+    Args:
+         package_name (str): Dotted name of the package.
+         errors (Optional[Dict[str, Exception]]): Filled with the error of every subpackage that failed to import,
+            by its dotted name.
+    """
+    package: ModuleType = importlib.import_module(package_name)
+    yield package_name
+    package_path = getattr(package, '__path__', None)
+    if package_path is None:
+        return
+    failed: Dict[str, Exception] = {} if errors is None else errors
+
+    def record_error(name: str) -> None:
+        # pkgutil calls this while handling the exception, without passing it.
+        failed[name] = sys.exc_info()[1]
+
+    # walk_packages yields a subpackage before importing it, so the names are only yielded after the walk.
+    module_names = [
+        module_info.name
+        for module_info in pkgutil.walk_packages(package_path, prefix=f'{package_name}.', onerror=record_error)
+    ]
+    yield from (module_name for module_name in module_names if module_name not in failed)
+
+
 def import_module(file_name: str, file_path: str) -> ModuleType:
     """
     Import and return a python module from a path and name. Python 3.5+ only.
@@ -53,7 +144,127 @@ def import_module(file_name: str, file_path: str) -> ModuleType:
     return module
 
 
-def generate_docs(schema_map: SchemaMap, build_dir: str) -> None:
+def document_name(class_name: str) -> str:
+    """
+    Returns the file name of the document generated for a class.
+
+    Args:
+        class_name (str): Name of the class.
+    """
+    return f'{class_name}_cerberus_doc.md'
+
+
+def _take_appendix_documents(md_utils_options: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """
+    Returns the file name and content of the allowed values appendix documents added since the last call.
+
+    Args:
+        md_utils_options (Dict[str, Any]): Keyword arguments passed on to every MarkDownUtils.
+    """
+    allowed_appendix = md_utils_options.get('allowed_appendix')
+    return allowed_appendix.take_pending() if allowed_appendix else []
+
+
+def _write_appendix_documents(build_dir: str, md_utils_options: Dict[str, Any]) -> List[str]:
+    """
+    Writes the allowed values appendix documents added since the last call and returns their file names.
+
+    Args:
+        build_dir (str): The directory where the generated docs should be saved.
+        md_utils_options (Dict[str, Any]): Keyword arguments passed on to every MarkDownUtils.
+    """
+    documents: List[str] = []
+    for file_name, content in _take_appendix_documents(md_utils_options):
+        with open(os.path.join(build_dir, file_name), 'w', encoding='utf-8') as file:
+            file.write(content)
+        documents.append(file_name)
+    return documents
+
+
+# Renderer of every render without options. It holds no state, so it is shared by every caller and thread.
+_default_md_utils: MarkDownUtils = MarkDownUtils(file_name='')
+
+
+def _shared_md_utils(**md_utils_options: Any) -> MarkDownUtils:
+    """
+    Returns the MarkDownUtils shared by every render without options, or a new one if options are given. Options
+    like stats or allowed_appendix collect state, so a renderer with options is not kept after the render.
+
+    Args:
+        **md_utils_options: Keyword arguments passed on to MarkDownUtils.
+    """
+    if all(option is None for option in md_utils_options.values()):
+        return _default_md_utils
+    return MarkDownUtils(file_name='', **md_utils_options)
+
+
+def render_document(class_name: str, schemas: List[Schema], **md_utils_options: Any) -> str:
+    """
+    Returns the documentation of the schemas of a class, the same content that generate_docs writes, without writing
+    it. Without options it renders with a shared MarkDownUtils that is only read, so it is safe to call
+    concurrently, e.g. from a thread pool in a web service, and does not construct a renderer per call.
+
+    Args:
+        class_name (str): The class name of the class the schemas were found in.
+        schemas (List[Schema]): The schemas of the class.
+        **md_utils_options: Keyword arguments passed on to MarkDownUtils, e.g. example_generator.
+    """
+    return _shared_md_utils(**md_utils_options).render(class_name, schemas)
+
+
+def render_docs(schema_map: SchemaMap, document_names: Optional[Mapping[str, str]] = None, **md_utils_options: Any
+                ) -> Iterator[Tuple[str, str]]:
+    """
+    Render documentation given a SchemaMap without writing it.
+
+    Args:
+        schema_map (SchemaMap) A dict which contains schemas grouped by the parent class name as key.
+        document_names (Optional[Mapping[str, str]]): File name of the document of every class, e.g. assigned by a
+            :class:`.LinkIndex`. Defaults to the name of the class.
+        **md_utils_options: Keyword arguments passed on to every MarkDownUtils, e.g. example_generator.
+
+    Returns:
+        Yields the file name and content of every document, the same content that generate_docs writes,
+        including allowed values appendix documents the first time they are referenced.
+    """
+    for class_name, schemas in schema_map.items():
+        file_name = document_names[class_name] if document_names else document_name(class_name)
+        yield file_name, render_document(class_name, schemas, **md_utils_options)
+        yield from _take_appendix_documents(md_utils_options)
+
+
+def stream_docs(schema_map: SchemaMap, build_dir: str, **md_utils_options: Any) -> List[str]:
+    """
+    Generate documentation given a SchemaMap and build directory, writing every document as it is generated
+    instead of building it in memory first. The output is the same as that of generate_docs.
+
+    Args:
+        schema_map (SchemaMap) A dict which contains schemas grouped by the parent class name as key.
+        build_dir (str): The directory where the generated docs should be saved.
+        **md_utils_options: Keyword arguments passed on to every MarkDownUtils, e.g. example_generator.
+
+    Returns:
+        The file names of the generated documents.
+    """
+    documents: List[str] = []
+    for class_name, schemas in schema_map.items():
+        file_name = document_name(class_name)
+        documents.append(file_name)
+        md_utils = MarkDownUtils(file_name=file_name, file_path=build_dir, **md_utils_options)
+        file_path = os.path.join(build_dir, file_name)
+        try:
+            with open(file_path, 'w', encoding='utf-8') as file:
+                for schema in schemas:
+                    md_utils.stream_to(file, class_name, schema)
+        except Exception:
+            # A document that failed halfway is not left behind.
+            os.remove(file_path)
+            raise
+        documents.extend(_write_appendix_documents(build_dir, md_utils_options))
+    return documents
+
+
+def generate_docs(schema_map: SchemaMap, build_dir: str, stream: bool = False, **md_utils_options: Any) -> List[str]:
     """
     Generate documentation given a SchemaMap and build directory.
     Creates a markdown file per schema and populates it with generated documentation from the schema attributes.
@@ -61,17 +272,29 @@ def generate_docs(schema_map: SchemaMap, build_dir: str) -> None:
     Args:
         schema_map (SchemaMap) A dict which contains schemas grouped by the parent class name as key.
         build_dir (str): The directory where the generated docs should be saved.
+        stream (bool): Write the documents with stream_docs, keeping memory bounded for very large schemas.
+        **md_utils_options: Keyword arguments passed on to every MarkDownUtils, e.g. example_generator.
+
+    Returns:
+        The file names of the generated documents, including allowed values appendix documents.
     """
+    if stream:
+        return stream_docs(schema_map, build_dir, **md_utils_options)
+    documents: List[str] = []
     for class_name in schema_map.keys():
         schemas: List[Schema] = schema_map[class_name]
+        documents.append(document_name(class_name))
         for i, schema in enumerate(schemas):
             file_mode: str = 'w+' if i == 0 else 'a'
             md_file = MarkDownUtils(
-                file_name=f'{class_name}_cerberus_doc.md',
+                file_name=document_name(class_name),
                 file_mode=file_mode,
-                file_path=build_dir
+                file_path=build_dir,
+                **md_utils_options
             )
             md_file.generate_header(class_name, level=2)
             md_file.generate_attributes(class_name, schema)
             md_file.generate_schema_example(schema)
             md_file.create_md_file()
+        documents.extend(_write_appendix_documents(build_dir, md_utils_options))
+    return documents
@@ -0,0 +1,223 @@
+import sys
+import inspect
+import importlib.abc
+import importlib.machinery
+import importlib.util
+from contextlib import contextmanager
+from types import ModuleType
+from typing import Any, Dict, Iterator, Optional, Sequence
+
+# Packages that are needed to evaluate any schema and are never stubbed.
+NEVER_STUBBED: Sequence[str] = ('cerberus', 'cerberus_docs')
+_THIRD_PARTY_DIRS: Sequence[str] = ('site-packages', 'dist-packages')
+
+
+class Stub:
+    """
+    Placeholder for any value of a stubbed module. Every attribute, item and call result is another placeholder,
+    so module level code like ``Base = declarative_base()`` or ``Column(String(50))`` runs without the real package.
+    Classes can inherit from placeholders, and placeholders used as decorators return the decorated object.
+
+    Iterating over a placeholder, converting it to a string, bool or number, comparing or hashing it gives a value
+    that no longer looks like a placeholder, e.g. an empty list of allowed values, a default of ``'<stub ...>'`` or
+    the wrong branch of ``if settings.FEATURE:``, so it taints the finder that created it and the schemas are
+    extracted again with real imports.
+    """
+    def __init__(self, name: str, finder: Optional['StubFinder'] = None) -> None:
+        """
+        Stub constructor
+
+        Args:
+            name (str): Qualified name of the stubbed value.
+            finder (Optional[StubFinder]): The finder of the stubbed module, tainted when the placeholder is turned into
+                a plain value.
+        """
+        self._stub_name: str = name
+        self._stub_finder: Optional[StubFinder] = finder
+
+    def _taint(self) -> None:
+        if self._stub_finder is not None:
+            self._stub_finder.tainted = True
+
+    def __getattr__(self, name: str) -> 'Stub':
+        if name.startswith('__') and name.endswith('__'):
+            raise AttributeError(name)
+        return Stub(f'{self._stub_name}.{name}', self._stub_finder)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        if len(args) == 1 and not kwargs and (inspect.isclass(args[0]) or inspect.isfunction(args[0])):
+            return args[0]
+        return Stub(f'{self._stub_name}()', self._stub_finder)
+
+    def __getitem__(self, item: Any) -> 'Stub':
+        return self
+
+    def __or__(self, other: Any) -> 'Stub':
+        return self
+
+    __ror__ = __or__
+
+    def __iter__(self) -> Iterator[Any]:
+        self._taint()
+        return iter(())
+
+    def __mro_entries__(self, bases: Any) -> tuple:
+        # A class inheriting from a placeholder just inherits from its other bases.
+        return ()
+
+    def __repr__(self) -> str:
+        self._taint()
+        return f'<stub {self._stub_name}>'
+
+    def __str__(self) -> str:
+        return repr(self)
+
+    def __format__(self, format_spec: str) -> str:
+        return format(repr(self), format_spec)
+
+    def __bool__(self) -> bool:
+        self._taint()
+        return True
+
+    def __eq__(self, other: Any) -> bool:
+        self._taint()
+        return self is other
+
+    def __ne__(self, other: Any) -> bool:
+        return not self == other
+
+    def __hash__(self) -> int:
+        self._taint()
+        return id(self)
+
+    def __len__(self) -> int:
+        self._taint()
+        return 0
+
+    def __int__(self) -> int:
+        self._taint()
+        return 0
+
+    def __float__(self) -> float:
+        self._taint()
+        return 0.0
+
+    def __index__(self) -> int:
+        self._taint()
+        return 0
+
+
+class StubModule(ModuleType):
+    """
+    Lazy placeholder module returned for stubbed packages. It is a package, so its submodules are stubbed as well.
+    """
+    def __init__(self, name: str, finder: Optional['StubFinder'] = None) -> None:
+        """
+        StubModule constructor
+
+        Args:
+            name (str): Name of the stubbed module.
+            finder (Optional[StubFinder]): The finder that created the module.
+        """
+        super().__init__(name)
+        self.__path__ = []
+        self.__all__ = []
+        self._stub_finder: Optional[StubFinder] = finder
+
+    def __getattr__(self, name: str) -> Stub:
+        if name.startswith('__') and name.endswith('__'):
+            raise AttributeError(name)
+        return Stub(f'{self.__name__}.{name}', self._stub_finder)
+
+
+class StubFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """
+    sys.meta_path finder that returns a :class:`StubModule` instead of importing a stubbed package or any of its
+    submodules. Modules that are already imported are not affected, since Python only asks the finders for modules
+    that are not in sys.modules. The finder is tainted once a placeholder of its modules is turned into a plain value,
+    see :class:`Stub`.
+    """
+    def __init__(self, packages: Sequence[str] = ()) -> None:
+        """
+        StubFinder constructor
+
+        Args:
+            packages (Sequence[str]): Top-level packages to stub. If empty, every package installed in a
+                site-packages directory is stubbed.
+        """
+        self.packages: Sequence[str] = packages
+        self.tainted: bool = False
+        self._third_party: Dict[str, bool] = {}
+
+    def _is_third_party(self, package: str) -> bool:
+        """
+        Returns if a top-level package is installed in a site-packages directory, without importing it.
+        """
+        if package not in self._third_party:
+            spec = importlib.machinery.PathFinder.find_spec(package)
+            location = (spec.origin or next(iter(spec.submodule_search_locations or ()), '')) if spec else ''
+            self._third_party[package] = any(directory in (location or '') for directory in _THIRD_PARTY_DIRS)
+        return self._third_party[package]
+
+    def is_stubbed(self, module_name: str) -> bool:
+        """
+        Returns if a module is stubbed.
+
+        Args:
+            module_name (str): Dotted name of the module.
+        """
+        package = module_name.partition('.')[0]
+        if package in NEVER_STUBBED:
+            return False
+        return package in self.packages if self.packages else self._is_third_party(package)
+
+    def find_spec(self, fullname: str, path: Any, target: Optional[ModuleType] = None
+                  ) -> Optional[importlib.machinery.ModuleSpec]:
+        if not self.is_stubbed(fullname):
+            return None
+        return importlib.util.spec_from_loader(fullname, self, is_package=True)
+
+    def create_module(self, spec: importlib.machinery.ModuleSpec) -> ModuleType:
+        return StubModule(spec.name, self)
+
+    def exec_module(self, module: ModuleType) -> None:
+        pass
+
+
+@contextmanager
+def stubbed_imports(packages: Sequence[str] = ()) -> Iterator[StubFinder]:
+    """
+    Context manager that stubs the imports of the given packages inside the context, see :class:`StubFinder`.
+    The stub modules are removed from sys.modules when the context exits. Modules that imported them still hold
+    placeholders, so the context should be combined with :func:`.evicting_modules`.
+
+    Args:
+        packages (Sequence[str]): Top-level packages to stub. If empty, every package installed in a site-packages
+            directory is stubbed.
+    """
+    finder = StubFinder(packages)
+    sys.meta_path.insert(0, finder)
+    try:
+        yield finder
+    finally:
+        sys.meta_path.remove(finder)
+        for module_name, module in list(sys.modules.items()):
+            if isinstance(module, StubModule) and module._stub_finder is finder:
+                del sys.modules[module_name]
+
+
+def contains_stubs(value: Any) -> bool:
+    """
+    Returns if a value, e.g. an extracted schema map, contains a placeholder anywhere, which means the value
+    depends on a stubbed package.
+
+    Args:
+        value (Any): The value to check.
+    """
+    if isinstance(value, (Stub, StubModule)):
+        return True
+    if isinstance(value, dict):
+        return any(contains_stubs(key) or contains_stubs(item) for key, item in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return any(contains_stubs(item) for item in value)
+    return False
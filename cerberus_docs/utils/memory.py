@@ -0,0 +1,119 @@
+import gc
+import os
+import sys
+from contextlib import contextmanager
+from types import ModuleType
+from typing import Dict, Iterator, List, Optional, Sequence
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None
+
+
+def _is_kept(module_name: str, keep_modules: Sequence[str]) -> bool:
+    """
+    Returns if a module is in the allow-list, either by name or as a submodule of a listed package.
+
+    Args:
+        module_name (str): Name of the module.
+        keep_modules (Sequence[str]): Names of the modules and packages to keep.
+    """
+    return any(module_name == keep or module_name.startswith(keep + '.') for keep in keep_modules)
+
+
+def _is_in_directory(module: ModuleType, directory: str) -> bool:
+    """
+    Returns if the source of a module is inside a directory. Modules without a source file, e.g. built-in modules,
+    are not.
+
+    Args:
+        module (ModuleType): The module.
+        directory (str): Absolute, real path of the directory.
+    """
+    file_path = getattr(module, '__file__', None)
+    return bool(file_path) and os.path.realpath(file_path).startswith(directory + os.sep)
+
+
+def evict_modules(before: Dict[str, ModuleType], keep_modules: Sequence[str] = (), directory: Optional[str] = None
+                  ) -> List[str]:
+    """
+    Restores sys.modules to a previous snapshot: modules imported since the snapshot are removed and modules replaced
+    since the snapshot are restored, except for the modules in the allow-list. Runs the garbage collector afterwards
+    so the globals of the evicted modules are released.
+
+    Args:
+        before (Dict[str, ModuleType]): Copy of sys.modules taken before the imports.
+        keep_modules (Sequence[str]): Names of the modules and packages to keep loaded.
+        directory (Optional[str]): Only evict modules whose source is inside this directory, e.g. the source
+            directory, so third-party and extension modules, which may not support being imported twice, stay
+            loaded. Every module is evicted if omitted.
+
+    Returns:
+        The names of the evicted modules.
+    """
+    if directory is not None:
+        directory = os.path.realpath(directory)
+    evicted: List[str] = []
+    for module_name, module in list(sys.modules.items()):
+        if before.get(module_name) is module or _is_kept(module_name, keep_modules):
+            continue
+        if directory is not None and not _is_in_directory(module, directory):
+            continue
+        if module_name in before:
+            sys.modules[module_name] = before[module_name]
+        else:
+            del sys.modules[module_name]
+        evicted.append(module_name)
+    if evicted:
+        gc.collect()
+    return evicted
+
+
+@contextmanager
+def evicting_modules(keep_modules: Sequence[str] = (), directory: Optional[str] = None) -> Iterator[None]:
+    """
+    Context manager that evicts every module imported inside the context when it exits, see :func:`evict_modules`.
+
+    Args:
+        keep_modules (Sequence[str]): Names of the modules and packages to keep loaded.
+        directory (Optional[str]): Only evict modules whose source is inside this directory.
+    """
+    before: Dict[str, ModuleType] = dict(sys.modules)
+    try:
+        yield
+    finally:
+        evict_modules(before, keep_modules, directory)
+
+
+def current_rss() -> Optional[int]:
+    """
+    Returns the resident set size of the current process in bytes, or None if it cannot be determined.
+    Only available on systems with /proc.
+    """
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def peak_rss() -> Optional[int]:
+    """
+    Returns the peak resident set size of the current process in bytes, or None if it cannot be determined.
+    """
+    if resource is None:
+        return None  # pragma: no cover
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes everywhere else.
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
+def format_rss(rss: Optional[int]) -> str:
+    """
+    Returns a resident set size as mebibytes.
+
+    Args:
+        rss (Optional[int]): Size in bytes, or None if unknown.
+    """
+    return 'unavailable' if rss is None else f'{rss / (1024 * 1024):.1f} MiB'
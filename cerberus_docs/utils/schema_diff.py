@@ -0,0 +1,142 @@
+import json
+from typing import Any, Dict, List, Optional
+
+from ..classes.schema_snapshot import SchemaSnapshot, SubtreeHasher
+from ..classes.types import Attribute, Schema
+
+SchemaChange = Dict[str, Any]
+
+
+def _change(change: str, class_name: str, path: str, rule: Optional[str] = None, old: Any = None, new: Any = None
+            ) -> SchemaChange:
+    return {'change': change, 'class': class_name, 'path': path, 'rule': rule, 'old': old, 'new': new}
+
+
+def _is_nested_schema(rule: str, old: Any, new: Any) -> bool:
+    return rule == 'schema' and isinstance(old, dict) and isinstance(new, dict)
+
+
+def _diff_attribute(hasher: SubtreeHasher, class_name: str, path: str, old: Attribute, new: Attribute
+                    ) -> List[SchemaChange]:
+    """
+    Returns the added, removed and changed rules of an attribute, descending into nested schemas.
+    """
+    changes: List[SchemaChange] = []
+    for rule in sorted(set(old) | set(new)):
+        if rule not in new:
+            changes.append(_change('removed', class_name, path, rule, old=old[rule]))
+        elif rule not in old:
+            changes.append(_change('added', class_name, path, rule, new=new[rule]))
+        elif hasher.equal(old[rule], new[rule]):
+            continue
+        elif _is_nested_schema(rule, old[rule], new[rule]) and old.get('type') == new.get('type') == 'dict':
+            changes.extend(_diff_schema(hasher, class_name, f'{path}.', old[rule], new[rule]))
+        elif _is_nested_schema(rule, old[rule], new[rule]) and old.get('type') == new.get('type') == 'list':
+            changes.extend(_diff_attribute(hasher, class_name, f'{path}[]', old[rule], new[rule]))
+        else:
+            changes.append(_change('changed', class_name, path, rule, old=old[rule], new=new[rule]))
+    return changes
+
+
+def _diff_schema(hasher: SubtreeHasher, class_name: str, prefix: str, old: Schema, new: Schema) -> List[SchemaChange]:
+    """
+    Returns the added, removed and changed attributes of a schema. Attributes with equal hashes are skipped.
+    """
+    changes: List[SchemaChange] = []
+    for attribute_name in sorted(set(old) | set(new)):
+        path = f'{prefix}{attribute_name}'
+        if attribute_name not in new:
+            changes.append(_change('removed', class_name, path, old=old[attribute_name]))
+        elif attribute_name not in old:
+            changes.append(_change('added', class_name, path, new=new[attribute_name]))
+        elif not hasher.equal(old[attribute_name], new[attribute_name]):
+            changes.extend(_diff_attribute(hasher, class_name, path, old[attribute_name], new[attribute_name]))
+    return changes
+
+
+def _diff_class(hasher: SubtreeHasher, class_name: str, old: List[Schema], new: List[Schema]) -> List[SchemaChange]:
+    """
+    Returns the changes between the schemas of a class. A class with more than one schema prefixes the paths with
+    the index of the schema.
+    """
+    changes: List[SchemaChange] = []
+    for i in range(max(len(old), len(new))):
+        prefix = f'[{i}].' if len(old) > 1 or len(new) > 1 else ''
+        if i >= len(new):
+            changes.append(_change('removed', class_name, f'[{i}]', old=old[i]))
+        elif i >= len(old):
+            changes.append(_change('added', class_name, f'[{i}]', new=new[i]))
+        elif not hasher.equal(old[i], new[i]):
+            changes.extend(_diff_schema(hasher, class_name, prefix, old[i], new[i]))
+    return changes
+
+
+def diff_snapshots(old: SchemaSnapshot, new: SchemaSnapshot) -> List[SchemaChange]:
+    """
+    Compares the schemas of two snapshots. Classes are compared by the hashes stored in the snapshots, and only the
+    schemas of changed classes are parsed and compared by the Merkle hashes of their subtrees, so identical classes,
+    attributes and rules are skipped without being compared value by value.
+
+    Args:
+        old (SchemaSnapshot): The snapshot of the old build.
+        new (SchemaSnapshot): The snapshot of the new build.
+
+    Returns:
+        Every added, removed or changed class, attribute and rule as a dict with the keys change ('added', 'removed'
+        or 'changed'), class (qualified name of the class), path (dotted attribute path, empty for a class, '[]' marks
+        list items), rule (None for classes and attributes), old and new.
+    """
+    hasher = SubtreeHasher()
+    changes: List[SchemaChange] = []
+    for class_name in sorted(set(old.hashes) | set(new.hashes)):
+        if class_name not in new.hashes:
+            changes.append(_change('removed', class_name, ''))
+        elif class_name not in old.hashes:
+            changes.append(_change('added', class_name, ''))
+        elif old.hashes[class_name] != new.hashes[class_name]:
+            changes.extend(_diff_class(hasher, class_name, old.schemas(class_name), new.schemas(class_name)))
+    return changes
+
+
+def _describe_change(change: SchemaChange) -> str:
+    """
+    Returns a change as a line of a MarkDown list.
+    """
+    if change['rule']:
+        subject = f'rule `{change["rule"]}` of `{change["path"]}`'
+    elif change['path']:
+        subject = f'attribute `{change["path"]}`'
+    else:
+        subject = 'class'
+    if change['change'] == 'changed':
+        return f'- changed {subject}: `{json.dumps(change["old"])}` to `{json.dumps(change["new"])}`\n'
+    return f'- {change["change"]} {subject}\n'
+
+
+def format_diff_markdown(changes: List[SchemaChange]) -> str:
+    """
+    Returns schema changes as MarkDown, grouped by class.
+
+    Args:
+        changes (List[SchemaChange]): The changes returned by diff_snapshots.
+    """
+    if not changes:
+        return 'No schema changes.\n'
+    result: List[str] = []
+    class_name: Optional[str] = None
+    for change in changes:
+        if change['class'] != class_name:
+            class_name = change['class']
+            result.append(f'\n## {class_name}\n\n')
+        result.append(_describe_change(change))
+    return ''.join(result)
+
+
+def format_diff_json(changes: List[SchemaChange]) -> str:
+    """
+    Returns schema changes as JSON.
+
+    Args:
+        changes (List[SchemaChange]): The changes returned by diff_snapshots.
+    """
+    return json.dumps({'changes': changes}, indent=2) + '\n'
@@ -0,0 +1,112 @@
+import os
+import shutil
+import hashlib
+from typing import Dict, List, Tuple
+
+from ..classes.allowed_appendix import is_appendix_document
+from ..classes.build_manifest import BuildManifest
+from ..classes.exceptions import CerberusDocsException
+from ..classes.schema_snapshot import SNAPSHOT_FILE_NAME, SchemaSnapshot
+
+
+def shard_index(source_path: str, shard_count: int) -> int:
+    """
+    Returns the shard a source file is assigned to. The assignment only depends on the path relative to the
+    source directory, so it is the same on every machine and for every run.
+
+    Args:
+        source_path (str): Path of the source file relative to the source directory.
+        shard_count (int): Total number of shards.
+    """
+    digest = hashlib.sha1(source_path.replace(os.sep, '/').encode()).digest()
+    return int.from_bytes(digest[:8], 'big') % shard_count
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """
+    Parses a shard given as 'INDEX/COUNT', where INDEX is zero based.
+
+    Args:
+        value (str): The shard string.
+
+    Raises:
+        ValueError: Invalid shard
+    """
+    index, separator, count = value.partition('/')
+    if not separator:
+        raise ValueError(f'Invalid shard {value}, expected INDEX/COUNT')
+    shard = (int(index), int(count))
+    if shard[1] < 1 or not 0 <= shard[0] < shard[1]:
+        raise ValueError(f'Invalid shard {value}, INDEX must be in the range 0 to COUNT - 1')
+    return shard
+
+
+def _find_collisions(manifests: List[Tuple[str, BuildManifest]]) -> List[str]:
+    """
+    Returns a description of every document that is generated by more than one source, in different shards or in
+    the same shard, where the document of one source overwrote that of the other. Allowed values appendices are
+    named after their content, so sources that generate the same appendix do not collide.
+
+    Args:
+        manifests (List[Tuple[str, BuildManifest]]): Shard directories and their manifests.
+    """
+    owners: Dict[str, List[str]] = {}
+    for shard_dir, manifest in manifests:
+        for source_path, source in sorted(manifest.sources.items()):
+            for document in source['documents']:
+                if is_appendix_document(document):
+                    continue
+                owners.setdefault(document, []).append(f'{source_path} in {shard_dir}')
+    return [
+        f'{document} is generated by {", ".join(sources)}'
+        for document, sources in sorted(owners.items())
+        if len(sources) > 1
+    ]
+
+
+def merge_shards(shard_dirs: List[str], build_dir: str) -> BuildManifest:
+    """
+    Combines the output of sharded builds into one build directory and writes a manifest of the combined build.
+    Precompressed siblings of the documents are copied along, and if every shard wrote a schema snapshot, the
+    snapshots are combined too.
+
+    Args:
+        shard_dirs (List[str]): The build directories of the shards.
+        build_dir (str): The directory to merge the shards into.
+
+    Raises:
+        :class:`.CerberusDocsException`: Shards are missing, duplicated, from different shard counts,
+            or generate documents with the same name.
+    """
+    manifests = sorted(
+        ((shard_dir, BuildManifest.read(shard_dir)) for shard_dir in shard_dirs),
+        key=lambda item: item[1].shard or (0, 1)
+    )
+    shards = [manifest.shard or (0, 1) for _, manifest in manifests]
+    counts = {count for _, count in shards}
+    if len(counts) != 1:
+        raise CerberusDocsException(f'Shards have different shard counts: {sorted(counts)}')
+    count = counts.pop()
+    if [index for index, _ in shards] != list(range(count)):
+        raise CerberusDocsException(f'Expected shards 0 to {count - 1}, got {[index for index, _ in shards]}')
+    collisions = _find_collisions(manifests)
+    if collisions:
+        raise CerberusDocsException('Class name collisions: ' + '; '.join(collisions))
+
+    os.makedirs(build_dir, exist_ok=True)
+    merged = BuildManifest()
+    for shard_dir, manifest in manifests:
+        for document in manifest.documents:
+            shutil.copyfile(os.path.join(shard_dir, document), os.path.join(build_dir, document))
+            if os.path.isfile(os.path.join(shard_dir, f'{document}.gz')):
+                shutil.copyfile(os.path.join(shard_dir, f'{document}.gz'), os.path.join(build_dir, f'{document}.gz'))
+        merged.update(manifest)
+    merged.write(build_dir)
+
+    snapshot_paths = [os.path.join(shard_dir, SNAPSHOT_FILE_NAME) for shard_dir, _ in manifests]
+    if all(os.path.isfile(snapshot_path) for snapshot_path in snapshot_paths):
+        snapshot = SchemaSnapshot()
+        for snapshot_path in snapshot_paths:
+            snapshot.update(SchemaSnapshot.read(snapshot_path))
+        snapshot.write(build_dir)
+    return merged
@@ -0,0 +1,76 @@
+"""
+Compares the memory held by extracted schemas as plain dicts with the compact slotted model that the in-memory
+schema cache keeps.
+
+A source module with the given number of attributes is generated and its schemas are extracted like in a build.
+Both models hold their own copy of the schemas, like a cache entry that outlives the evicted module.
+The saving is in the memory the schemas hold. Rendering reads a compact schema as stored, without converting it
+back to dicts, and formats every attribute without building sorted copies of it for either model.
+
+Usage:
+    python scripts/benchmark_memory.py [ATTRIBUTE_COUNT]
+"""
+import os
+import gc
+import sys
+import copy
+import tempfile
+import tracemalloc
+from typing import Any, Callable
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from cerberus_docs import extract_schemas  # noqa: E402
+from cerberus_docs.classes.compact_schema import compact_schema_map  # noqa: E402
+
+SOURCE_TEMPLATE: str = '''from cerberus_docs import CerberusSchema
+
+ADDRESS = {{
+    'street': {{'type': 'string', 'required': True, 'maxlength': 80}},
+    'country': {{'type': 'string', 'allowed': ['NL', 'SE', 'US']}},
+}}
+
+
+class Benchmark:
+    schema = CerberusSchema({{
+        f'attribute_{{i}}': {{
+            'type': 'string',
+            'required': bool(i % 2),
+            'regex': '^[a-z]+$',
+            'meta': {{'description': f'Description of attribute {{i}}'}},
+        }}
+        for i in range({attribute_count})
+    }})
+    schema.schema['address'] = {{'type': 'dict', 'schema': ADDRESS}}
+'''
+
+
+def measure(build: Callable[[], Any]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    result = build()  # noqa: F841
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size
+
+
+def main() -> None:
+    attribute_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    with tempfile.TemporaryDirectory() as source_dir:
+        file_path = os.path.join(source_dir, 'benchmark_schemas.py')
+        with open(file_path, 'w') as source_file:
+            source_file.write(SOURCE_TEMPLATE.format(attribute_count=attribute_count))
+        schema_map = extract_schemas('benchmark_schemas', file_path)
+
+    # Rule and attribute names are interned by the first conversion, which a long running process only pays once.
+    compact_schema_map(schema_map)
+    dict_size = measure(lambda: copy.deepcopy(schema_map))
+    compact_size = measure(lambda: compact_schema_map(copy.deepcopy(schema_map)))
+    print(f'attributes:    {attribute_count}')
+    print(f'dict model:    {dict_size / 1024:.0f} KiB ({dict_size / attribute_count:.0f} B/attribute)')
+    print(f'compact model: {compact_size / 1024:.0f} KiB ({compact_size / attribute_count:.0f} B/attribute)')
+    print(f'saving:        {100 * (1 - compact_size / dict_size):.1f}%')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+import unittest
+from unittest import mock
+
+from cerberus_docs import AllowedAppendix
+from cerberus_docs.classes.allowed_appendix import is_appendix_document
+
+
+class TestAllowedAppendix(unittest.TestCase):
+    def setUp(self) -> None:
+        self.allowed_appendix = AllowedAppendix(threshold=2)
+
+    def test_document_name(self) -> None:
+        file_name = AllowedAppendix.document_name(['a', 'b', 'c'])
+        self.assertTrue(is_appendix_document(file_name))
+        self.assertFalse(is_appendix_document('Class_cerberus_doc.md'))
+        self.assertEqual(AllowedAppendix.document_name(('a', 'b', 'c')), file_name)
+        self.assertNotEqual(AllowedAppendix.document_name(['a', 'b', 'd']), file_name)
+        self.assertNotEqual(AllowedAppendix.document_name([1, 2, 3]), AllowedAppendix.document_name(['1', '2', '3']))
+
+    def test_render(self) -> None:
+        self.assertEqual(AllowedAppendix.render(['a', 1]), '\n## Allowed values\n\n2 values:\n\n  - a\n  - 1\n')
+
+    def test_is_collapsed(self) -> None:
+        self.assertFalse(self.allowed_appendix.is_collapsed(['a', 'b']))
+        self.assertTrue(self.allowed_appendix.is_collapsed(['a', 'b', 'c']))
+
+    def test_add(self) -> None:
+        with mock.patch.object(AllowedAppendix, 'render', wraps=AllowedAppendix.render) as render:
+            file_name = self.allowed_appendix.add(['a', 'b', 'c'])
+            self.assertEqual(self.allowed_appendix.add(['a', 'b', 'c']), file_name)
+            render.assert_called_once()
+        self.assertEqual(self.allowed_appendix.take_pending(), [(file_name, AllowedAppendix.render(['a', 'b', 'c']))])
+        self.assertEqual(self.allowed_appendix.take_pending(), [])
+        self.allowed_appendix.add(['a', 'b', 'c'])
+        self.assertEqual(self.allowed_appendix.take_pending(), [])
@@ -0,0 +1,65 @@
+import os
+import json
+import shutil
+import unittest
+
+from cerberus_docs import CerberusDocsException
+from cerberus_docs.classes.build_manifest import BuildManifest, MANIFEST_FILE_NAME
+
+
+class TestBuildManifest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.current_dir = os.path.dirname(os.path.realpath(__file__))
+        self.test_folder: str = 'test_dir'
+        self.test_folder_path = os.path.join(self.current_dir, self.test_folder)
+        os.mkdir(self.test_folder_path)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.test_folder_path)
+
+    def test_add_source(self) -> None:
+        manifest = BuildManifest()
+        manifest.add_source(os.path.join('pkg', 'module.py'), ['B', 'A'], ['B.md', 'A.md'])
+        self.assertEqual(manifest.sources, {'pkg/module.py': {'classes': ['A', 'B'], 'documents': ['A.md', 'B.md']}})
+        self.assertEqual(manifest.documents, ['A.md', 'B.md'])
+
+    def test_write_and_read(self) -> None:
+        manifest = BuildManifest((1, 4))
+        manifest.add_source('module.py', ['A'], ['A.md'])
+        manifest_path = manifest.write(self.test_folder_path)
+        self.assertEqual(manifest_path, os.path.join(self.test_folder_path, MANIFEST_FILE_NAME))
+        read_manifest = BuildManifest.read(self.test_folder_path)
+        self.assertEqual(read_manifest.shard, (1, 4))
+        self.assertEqual(read_manifest.to_dict(), manifest.to_dict())
+
+    def test_read_missing(self) -> None:
+        self.assertRaises(CerberusDocsException, BuildManifest.read, self.test_folder_path)
+        self.assertIsNone(BuildManifest.read_if_exists(self.test_folder_path))
+
+    def test_dependencies(self) -> None:
+        manifest = BuildManifest()
+        manifest.add_source('model.py', ['A'], ['A.md'])
+        manifest.set_dependencies({'model.py': {'shared/b.py', 'shared/a.py'}}, {'model.py': 'hash'})
+        self.assertEqual(manifest.to_dict()['dependencies'], {'model.py': ['shared/a.py', 'shared/b.py']})
+        manifest.write(self.test_folder_path)
+        read_manifest = BuildManifest.read_if_exists(self.test_folder_path)
+        self.assertEqual(read_manifest.dependencies, manifest.dependencies)
+        self.assertEqual(read_manifest.file_hashes, {'model.py': 'hash'})
+
+        with self.subTest('manifests without dependencies'):
+            data = manifest.to_dict()
+            del data['dependencies'], data['file_hashes']
+            self.assertEqual(BuildManifest.from_dict(data).dependencies, {})
+
+        with self.subTest('update'):
+            other = BuildManifest()
+            other.add_source('other.py', ['B'], ['B.md'])
+            other.set_dependencies({'other.py': []}, {'other.py': 'other hash'})
+            manifest.update(other)
+            self.assertEqual(sorted(manifest.sources), ['model.py', 'other.py'])
+            self.assertEqual(manifest.file_hashes, {'model.py': 'hash', 'other.py': 'other hash'})
+
+    def test_read_unsupported_version(self) -> None:
+        with open(os.path.join(self.test_folder_path, MANIFEST_FILE_NAME), 'w') as manifest_file:
+            json.dump({'version': 0, 'shard': None, 'sources': {}}, manifest_file)
+        self.assertRaises(CerberusDocsException, BuildManifest.read, self.test_folder_path)
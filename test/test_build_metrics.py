@@ -0,0 +1,87 @@
+import os
+import shutil
+import unittest
+
+from cerberus_docs import CerberusDocsException
+from cerberus_docs.classes.build_metrics import COUNTERS, BuildMetrics, Histogram
+
+
+class TestBuildMetrics(unittest.TestCase):
+    def setUp(self) -> None:
+        self.current_dir = os.path.dirname(os.path.realpath(__file__))
+        self.test_folder: str = 'test_dir'
+        self.test_folder_path = os.path.join(self.current_dir, self.test_folder)
+        os.mkdir(self.test_folder_path)
+        self.metrics = BuildMetrics()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.test_folder_path)
+
+    def test_histogram(self) -> None:
+        histogram = Histogram((1.0, 10.0))
+        for value in (0.5, 1.0, 5.0, 50.0):
+            histogram.observe(value)
+        self.assertEqual(histogram.to_dict(), {'buckets': {'1.0': 2, '10.0': 3, '+Inf': 4}, 'sum': 56.5, 'count': 4})
+
+    def test_timed(self) -> None:
+        self.assertEqual(list(self.metrics.timed('discover', iter(range(3)))), [0, 1, 2])
+        with self.metrics.phase('write'):
+            pass
+        phase_seconds = self.metrics.to_dict()['phase_seconds']
+        self.assertGreater(phase_seconds['discover'], 0)
+        self.assertGreater(phase_seconds['write'], 0)
+        self.assertEqual(phase_seconds['render'], 0)
+
+    def test_to_openmetrics(self) -> None:
+        self.metrics.count('files_scanned', 3)
+        self.metrics.count('files_cached')
+        self.metrics.observe('import_seconds', 0.02)
+        self.metrics.add_seconds('extract', 0.5)
+        self.assertNotIn('cerberus_docs_build_duration_seconds', self.metrics.to_openmetrics())
+        self.metrics.stop()
+
+        lines = self.metrics.to_openmetrics().splitlines()
+        self.assertIn('# TYPE cerberus_docs_files_scanned counter', lines)
+        self.assertIn('cerberus_docs_files_scanned_total 3', lines)
+        self.assertIn('cerberus_docs_files_cached_total 1', lines)
+        self.assertIn('cerberus_docs_phase_seconds_total{phase="extract"} 0.5', lines)
+        self.assertIn('# TYPE cerberus_docs_import_seconds histogram', lines)
+        self.assertIn('cerberus_docs_import_seconds_bucket{le="0.01"} 0', lines)
+        self.assertIn('cerberus_docs_import_seconds_bucket{le="0.025"} 1', lines)
+        self.assertIn('cerberus_docs_import_seconds_bucket{le="+Inf"} 1', lines)
+        self.assertIn('cerberus_docs_import_seconds_count 1', lines)
+        self.assertTrue(any(line.startswith('cerberus_docs_build_duration_seconds ') for line in lines))
+        self.assertEqual(len([line for line in lines if line.endswith('_total 0')]), len(COUNTERS) - 2)
+        self.assertEqual(lines[-1], '# EOF')
+
+    def test_to_prometheus(self) -> None:
+        self.metrics.count('files_scanned', 3)
+        self.metrics.observe('import_seconds', 0.02)
+        self.metrics.add_seconds('extract', 0.5)
+        self.metrics.stop()
+
+        lines = self.metrics.to_prometheus().splitlines()
+        self.assertIn('# TYPE cerberus_docs_files_scanned_total counter', lines)
+        self.assertIn('# HELP cerberus_docs_files_scanned_total ' + COUNTERS['files_scanned'], lines)
+        self.assertIn('cerberus_docs_files_scanned_total 3', lines)
+        self.assertIn('# TYPE cerberus_docs_phase_seconds_total counter', lines)
+        self.assertIn('cerberus_docs_phase_seconds_total{phase="extract"} 0.5', lines)
+        self.assertIn('# TYPE cerberus_docs_import_seconds histogram', lines)
+        self.assertIn('cerberus_docs_import_seconds_bucket{le="0.025"} 1', lines)
+        self.assertTrue(any(line.startswith('cerberus_docs_build_duration_seconds ') for line in lines))
+        self.assertNotIn('# EOF', lines)
+
+    def test_write(self) -> None:
+        self.metrics.stop()
+        metrics_path = os.path.join(self.test_folder_path, 'cerberus_docs.prom')
+        self.metrics.write(metrics_path)
+        with open(metrics_path) as metrics_file:
+            self.assertEqual(metrics_file.read(), self.metrics.to_openmetrics())
+        self.assertEqual(os.listdir(self.test_folder_path), ['cerberus_docs.prom'])
+        self.metrics.write(metrics_path, 'prometheus')
+        with open(metrics_path) as metrics_file:
+            self.assertEqual(metrics_file.read(), self.metrics.to_prometheus())
+        with self.subTest('unwritable path'):
+            with self.assertRaises(CerberusDocsException) as context:
+                self.metrics.write(os.path.join(self.test_folder_path, 'missing', 'cerberus_docs.prom'))
+            self.assertIn('cannot be written', context.exception.message)
@@ -0,0 +1,133 @@
+import io
+import os
+import contextlib
+import shutil
+import threading
+import unittest
+from typing import Iterator
+from unittest import mock
+
+from cerberus_docs import CerberusDocsException, DocsBuilder
+from cerberus_docs.classes.build_manifest import MANIFEST_FILE_NAME
+from cerberus_docs.classes.build_pipeline import BuildPipeline, StageMetrics
+
+
+class TestBuildPipeline(unittest.TestCase):
+    def setUp(self) -> None:
+        self.current_dir = os.path.dirname(os.path.realpath(__file__))
+        self.test_folder: str = 'test_dir'
+        self.test_folder_path = os.path.join(self.current_dir, self.test_folder)
+        self.source_dir = os.path.join(self.test_folder_path, 'source')
+        self.build_dir = os.path.join(self.test_folder_path, 'build')
+        self.sequential_dir = os.path.join(self.test_folder_path, 'sequential')
+        for directory in [self.source_dir, self.build_dir, self.sequential_dir]:
+            os.makedirs(directory)
+        for i in range(20):
+            package_dir = os.path.join(self.source_dir, f'package_{i % 3}')
+            os.makedirs(package_dir, exist_ok=True)
+            with open(os.path.join(package_dir, f'module_{i}.py'), 'w') as module:
+                module.write(
+                    'from cerberus_docs import CerberusSchema\n\n\n'
+                    f'class PipelineClass{i}:\n'
+                    f"    schema = CerberusSchema({{'field_{i}': {{'type': 'string', 'required': True}}}})\n"
+                )
+        with open(os.path.join(self.source_dir, 'broken.py'), 'w') as module:
+            module.write('raise ValueError("broken module")\n')
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.test_folder_path)
+
+    def test_stage_metrics(self) -> None:
+        metrics = StageMetrics('render', 4)
+        metrics.record_put(1, 0.5)
+        metrics.record_put(3, 0.25)
+        metrics.record_get(1.0)
+        self.assertEqual(metrics.to_dict(), {
+            'items': 2,
+            'queue_size': 4,
+            'max_depth': 3,
+            'mean_depth': 2.0,
+            'blocked_seconds': 0.75,
+            'idle_seconds': 1.0,
+        })
+
+    def test_run(self) -> None:
+        with contextlib.redirect_stdout(io.StringIO()):
+            DocsBuilder(self.source_dir, self.sequential_dir).build()
+        for queue_size, writers in [(64, 4), (1, 1)]:
+            with self.subTest(queue_size=queue_size, writers=writers):
+                pipeline = BuildPipeline(
+                    DocsBuilder(self.source_dir, self.build_dir),
+                    queue_size=queue_size,
+                    write_queue_size=queue_size,
+                    writers=writers
+                )
+                metrics = pipeline.run()
+                self.assertEqual(metrics['discover']['items'], 21)
+                self.assertEqual(metrics['render']['items'], 20)
+                self.assertEqual(metrics['write']['items'], 20)
+                self.assertLessEqual(metrics['render']['max_depth'], queue_size)
+                self.assertEqual([os.path.basename(file_path) for file_path, _ in pipeline.errors], ['broken.py'])
+                for file_name in [name for name in os.listdir(self.sequential_dir) if name.endswith('.md')]:
+                    with open(os.path.join(self.sequential_dir, file_name)) as expected, \
+                            open(os.path.join(self.build_dir, file_name)) as actual:
+                        self.assertEqual(actual.read(), expected.read())
+
+    def test_build_pipelined_manifest(self) -> None:
+        builder = DocsBuilder(self.source_dir, self.build_dir)
+        builder.build_pipelined(queue_size=2, write_queue_size=2, writers=2)
+        self.assertEqual(len(builder.manifest.sources), 20)
+        self.assertIn('PipelineClass0_cerberus_doc.md', builder.manifest.documents)
+
+    def test_build_pipelined_failed_write(self) -> None:
+        builder = DocsBuilder(self.source_dir, self.build_dir)
+        write_document = builder._write_document
+
+        def fail_first(file_name: str, content: str) -> None:
+            if file_name == 'PipelineClass0_cerberus_doc.md':
+                raise OSError('disk full')
+            write_document(file_name, content)
+
+        with mock.patch.object(builder, '_write_document', side_effect=fail_first), \
+                contextlib.redirect_stdout(io.StringIO()):
+            builder.build_pipelined(queue_size=2, write_queue_size=2, writers=2)
+        self.assertEqual(len(builder.manifest.sources), 19)
+        self.assertNotIn('PipelineClass0_cerberus_doc.md', builder.manifest.documents)
+        self.assertIn('PipelineClass1_cerberus_doc.md', builder.manifest.documents)
+
+    def test_run_interrupted(self) -> None:
+        class Interrupt(BaseException):
+            pass
+
+        builder = DocsBuilder(self.source_dir, self.build_dir)
+        pipeline = BuildPipeline(builder, queue_size=1, write_queue_size=1, writers=1)
+        raised = []
+
+        def run() -> None:
+            try:
+                pipeline.run()
+            except Interrupt:
+                raised.append(True)
+
+        with mock.patch.object(builder, '_extract', side_effect=Interrupt):
+            thread = threading.Thread(target=run, daemon=True)
+            thread.start()
+            # The discovery thread is blocked on the full paths queue when the render stage stops.
+            thread.join(10)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(raised, [True])
+
+    def test_build_pipelined_failed_discovery(self) -> None:
+        builder = DocsBuilder(self.source_dir, self.build_dir)
+        iter_source_files = builder._iter_source_files
+
+        def fail_after_first() -> Iterator[str]:
+            yield next(iter_source_files())
+            raise PermissionError('cannot scan')
+
+        with mock.patch.object(builder, '_iter_source_files', side_effect=fail_after_first), \
+                contextlib.redirect_stdout(io.StringIO()):
+            with self.assertRaises(CerberusDocsException) as context:
+                builder.build_pipelined(queue_size=2, write_queue_size=2, writers=2)
+        self.assertIn('cannot scan', context.exception.message)
+        self.assertFalse(os.path.exists(os.path.join(self.build_dir, MANIFEST_FILE_NAME)))
@@ -1,6 +1,9 @@
 import unittest
+from unittest import mock
 
-from cerberus_docs import CerberusSchema
+from cerberus_docs import CerberusSchema, MarkDownUtils, render_document
+from cerberus_docs.classes.frozen_schema import FrozenDict
+from test.__mocks__.mock_schema import mock_schema
 
 
 class TestCerberusSchema(unittest.TestCase):
@@ -14,3 +17,52 @@ class TestCerberusSchema(unittest.TestCase):
     def test_to_schema(self) -> None:
         cerberus_schema = CerberusSchema(self.schema)
         self.assertEqual(cerberus_schema.to_schema(), self.schema)
+
+    def test_frozen(self) -> None:
+        cerberus_schema = CerberusSchema(mock_schema, frozen=True)
+        self.assertTrue(cerberus_schema.frozen)
+        self.assertFalse(CerberusSchema(self.schema).frozen)
+        self.assertIsInstance(cerberus_schema.to_schema(), FrozenDict)
+        self.assertEqual(cerberus_schema.to_schema(), mock_schema)
+        with self.assertRaises(TypeError):
+            cerberus_schema.to_schema()['test1']['type'] = 'integer'
+
+    def test_derived_values(self) -> None:
+        frozen = CerberusSchema(mock_schema, frozen=True)
+        mutable = CerberusSchema(mock_schema)
+        self.assertEqual(frozen.fingerprint(), mutable.fingerprint())
+        self.assertEqual(CerberusSchema(dict(reversed(list(mock_schema.items())))).fingerprint(), frozen.fingerprint())
+        self.assertNotEqual(CerberusSchema(self.schema).fingerprint(), frozen.fingerprint())
+        self.assertEqual(frozen.example(), mutable.example())
+        self.assertIsInstance(frozen.example(), FrozenDict)
+        self.assertEqual(frozen.attributes_markdown('Foo'), mutable.attributes_markdown('Foo'))
+        self.assertEqual(frozen.nested_sections('Foo'), mutable.nested_sections('Foo'))
+        self.assertEqual(frozen.nested_sections('Foo'), ('FooTest4', 'FooTest4Test5'))
+
+    def test_frozen_memoized(self) -> None:
+        cerberus_schema = CerberusSchema(mock_schema, frozen=True)
+        expected = render_document('Foo', [mock_schema])
+        with mock.patch.object(MarkDownUtils, 'iter_attributes', autospec=True,
+                               side_effect=MarkDownUtils.iter_attributes) as iter_attributes:
+            self.assertEqual(render_document('Foo', [cerberus_schema.to_schema()]), expected)
+            first_calls = iter_attributes.call_count
+            for _ in range(3):
+                self.assertEqual(render_document('Foo', [cerberus_schema.to_schema()]), expected)
+                cerberus_schema.attributes_markdown('Foo')
+            self.assertEqual(iter_attributes.call_count, first_calls)
+            self.assertIs(cerberus_schema.fingerprint(), cerberus_schema.fingerprint())
+            self.assertIs(cerberus_schema.example(), cerberus_schema.example())
+
+    def test_frozen_rendering_parity(self) -> None:
+        address = {'street': {'type': 'string'}}
+        schema = {
+            'billing': {'type': 'dict', 'schema': address},
+            'shipping': {'type': 'dict', 'schema': address},
+            'items': {'type': 'list', 'schema': {'type': 'dict', 'schema': address}},
+        }
+        frozen = CerberusSchema(schema, frozen=True)
+        mutable = CerberusSchema(schema)
+        self.assertEqual(frozen.nested_sections('Order'), ('OrderBilling', 'OrderItems'))
+        self.assertEqual(frozen.nested_sections('Order'), mutable.nested_sections('Order'))
+        self.assertEqual(frozen.attributes_markdown('Order'), mutable.attributes_markdown('Order'))
+        self.assertEqual(render_document('Order', [frozen.to_schema()]), render_document('Order', [schema]))
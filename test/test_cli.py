@@ -1,8 +1,16 @@
+import io
 import os
+import json
+import contextlib
+import sys
 import shutil
+import subprocess
 import unittest
+import importlib.util
 from pathlib import Path
 
+from cerberus_docs.classes.schema_snapshot import SchemaSnapshot
+from cerberus_docs.classes.search_index import SearchIndex
 from cerberus_docs.cli import dir_path, parse_args
 
 
@@ -47,3 +55,169 @@ class TestCli(unittest.TestCase):
 
         with open(mock_file_path, 'r') as mock_file:
             self.assertEqual(mock_file.read(), '\n## MockFile1\n\n`name`: string, \n\n\n## Example Schema Input\n\n```\nname: str\n```\n')  # noqa: E501
+
+    def test_parse_args_from_cache(self) -> None:
+        source_dir = os.path.join(self.current_dir, '__mocks__')
+        cache_dir = os.path.join(self.test_folder_path, 'cache')
+        with self.subTest('requires cache dir'):
+            with contextlib.redirect_stderr(io.StringIO()):
+                self.assertRaises(SystemExit, parse_args, ['--from-cache'])
+
+        parse_args([f'--source-dir={source_dir}', f'--build-dir={self.test_folder_path}', f'--cache-dir={cache_dir}'])
+        mock_file_path = os.path.join(self.test_folder_path, 'MockFile1_cerberus_doc.md')
+        os.remove(mock_file_path)
+        parse_args([f'--build-dir={self.test_folder_path}', f'--cache-dir={cache_dir}', '--from-cache'])
+        self.assertTrue(Path(mock_file_path).is_file())
+
+    def test_parse_args_shards(self) -> None:
+        source_dir = os.path.join(self.current_dir, '__mocks__')
+        shard_dirs = [os.path.join(self.test_folder_path, f'shard_{index}') for index in range(2)]
+        processes = []
+        for index, shard_dir in enumerate(shard_dirs):
+            os.mkdir(shard_dir)
+            processes.append(subprocess.Popen(
+                [sys.executable, '-m', 'cerberus_docs.cli', f'--source-dir={source_dir}',
+                 f'--build-dir={shard_dir}', f'--shard={index}/2'],
+                cwd=os.path.dirname(self.current_dir),
+                stdout=subprocess.DEVNULL,
+            ))
+        for process in processes:
+            self.assertEqual(process.wait(), 0)
+
+        build_dir = os.path.join(self.test_folder_path, 'build')
+        parse_args(['merge', *shard_dirs, f'--build-dir={build_dir}'])
+        for file_name in ['MockFileParent', 'MockFileChild', 'MockFile1']:
+            self.assertTrue(Path(os.path.join(build_dir, f'{file_name}_cerberus_doc.md')).is_file())
+
+        with self.subTest('invalid shards'):
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertRaises(SystemExit, parse_args, ['merge', build_dir, build_dir])
+
+    def test_parse_args_pipeline(self) -> None:
+        source_dir = os.path.join(self.current_dir, '__mocks__')
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            parse_args([
+                f'--source-dir={source_dir}', f'--build-dir={self.test_folder_path}', '--pipeline', '--writers=2'
+            ])
+        self.assertIn('discover', output.getvalue())
+        self.assertTrue(Path(os.path.join(self.test_folder_path, 'MockFile1_cerberus_doc.md')).is_file())
+        with self.subTest('cannot be combined with --stream'):
+            with contextlib.redirect_stderr(io.StringIO()):
+                self.assertRaises(SystemExit, parse_args, ['--pipeline', '--stream'])
+
+    def test_parse_args_package(self) -> None:
+        with contextlib.redirect_stdout(io.StringIO()):
+            parse_args(['--package=test.__mocks__', f'--build-dir={self.test_folder_path}'])
+        self.assertTrue(Path(os.path.join(self.test_folder_path, 'MockFileParent_cerberus_doc.md')).is_file())
+        with self.subTest('package cannot be imported'):
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertRaises(SystemExit, parse_args, ['--package=does_not_exist'])
+        with self.subTest('cannot be combined with --pipeline'):
+            with contextlib.redirect_stderr(io.StringIO()):
+                self.assertRaises(SystemExit, parse_args, ['--package=test.__mocks__', '--pipeline'])
+
+    def test_parse_args_diff(self) -> None:
+        source_dir = os.path.join(self.current_dir, '__mocks__')
+        old_dir = os.path.join(self.test_folder_path, 'old')
+        os.mkdir(old_dir)
+        with contextlib.redirect_stdout(io.StringIO()):
+            parse_args([f'--source-dir={source_dir}', f'--build-dir={old_dir}', '--snapshot'])
+        snapshot = SchemaSnapshot.read(old_dir)
+        self.assertEqual(snapshot.schemas('mock_folder_2.mock_file_2.MockFile1'), [{'name': {'type': 'string'}}])
+        snapshot.add({'MockFile1': [{'name': {'type': 'integer'}}]}, 'mock_folder_2.mock_file_2')
+        new_path = snapshot.write(os.path.join(self.test_folder_path))
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            parse_args(['diff', old_dir, new_path])
+        self.assertEqual(output.getvalue(), (
+            '\n## mock_folder_2.mock_file_2.MockFile1\n\n- changed rule `type` of `name`: `"string"` to `"integer"`\n'
+        ))
+        with self.subTest('json output'):
+            output_path = os.path.join(self.test_folder_path, 'diff.json')
+            parse_args(['diff', old_dir, new_path, '--format=json', f'--output={output_path}'])
+            with open(output_path) as output_file:
+                self.assertEqual(len(json.load(output_file)['changes']), 1)
+        with self.subTest('missing snapshot'):
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertRaises(SystemExit, parse_args, ['diff', old_dir, os.path.join(self.test_folder_path, 'x')])
+
+    def test_parse_args_precompress(self) -> None:
+        source_dir = os.path.join(self.current_dir, '__mocks__')
+        with contextlib.redirect_stdout(io.StringIO()):
+            parse_args([f'--source-dir={source_dir}', f'--build-dir={self.test_folder_path}', '--precompress'])
+        self.assertTrue(Path(os.path.join(self.test_folder_path, 'MockFile1_cerberus_doc.md.gz')).is_file())
+        with self.subTest('cannot be combined with --archive'):
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                self.assertRaises(SystemExit, parse_args, ['--precompress', '--archive=docs.zip'])
+            self.assertIn('Build failed', output.getvalue())
+
+    def test_parse_args_stats(self) -> None:
+        source_dir = os.path.join(self.current_dir, '__mocks__')
+        stats_path = os.path.join(self.test_folder_path, 'stats.json')
+        with contextlib.redirect_stdout(io.StringIO()):
+            parse_args([f'--source-dir={source_dir}', f'--build-dir={self.test_folder_path}', f'--stats={stats_path}',
+                        '--stats-sort=attributes'])
+        with open(stats_path) as stats_file:
+            rows = json.load(stats_file)['schemas']
+        self.assertIn('MockFile1', [row['class'] for row in rows])
+        self.assertEqual([row['attributes'] for row in rows], sorted((row['attributes'] for row in rows), reverse=True))
+
+    def test_parse_args_search_db(self) -> None:
+        source_dir = os.path.join(self.current_dir, '__mocks__')
+        database_path = os.path.join(self.test_folder_path, 'search.db')
+        with contextlib.redirect_stdout(io.StringIO()):
+            parse_args([f'--source-dir={source_dir}', f'--build-dir={self.test_folder_path}',
+                        f'--search-db={database_path}'])
+        results = SearchIndex.search(database_path, 'name')
+        self.assertIn(('MockFile1', 'MockFile1_cerberus_doc.md'), [(row['class'], row['document']) for row in results])
+
+    def test_parse_args_report_memory(self) -> None:
+        source_dir = os.path.join(self.current_dir, '__mocks__')
+        args = [f'--source-dir={source_dir}', f'--build-dir={self.test_folder_path}']
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            parse_args(args)
+        self.assertEqual(output.getvalue(), 'Docs successfully generated.\n')
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            parse_args(args + ['--report-memory'])
+        self.assertIn('Peak RSS: ', output.getvalue())
+
+    def test_parse_args_metrics_file(self) -> None:
+        source_dir = os.path.join(self.current_dir, '__mocks__')
+        metrics_path = os.path.join(self.test_folder_path, 'cerberus_docs.prom')
+        with contextlib.redirect_stdout(io.StringIO()):
+            parse_args([f'--source-dir={source_dir}', f'--build-dir={self.test_folder_path}',
+                        f'--metrics-file={metrics_path}'])
+        with open(metrics_path) as metrics_file:
+            lines = metrics_file.read().splitlines()
+        self.assertIn('# TYPE cerberus_docs_files_scanned counter', lines)
+        self.assertNotIn('cerberus_docs_files_scanned_total 0', lines)
+        self.assertEqual(lines[-1], '# EOF')
+
+    @unittest.skipIf(importlib.util.find_spec('cerberus') is None, 'cerberus is not installed')
+    def test_parse_args_validate_examples(self) -> None:
+        source_dir = os.path.join(self.test_folder_path, 'source')
+        os.mkdir(source_dir)
+        with open(os.path.join(source_dir, 'invalid.py'), 'w') as source_file:
+            source_file.write(
+                'from cerberus_docs import CerberusSchema\n\n\n'
+                'class Invalid:\n'
+                "    schema = CerberusSchema({'code': {'type': 'string', 'allowed': ['ab'], 'minlength': 5}})\n"
+            )
+        document_path = os.path.join(self.test_folder_path, 'Invalid_cerberus_doc.md')
+        for mode in ([], ['--stream'], ['--pipeline']):
+            with self.subTest(mode=mode):
+                output = io.StringIO()
+                with contextlib.redirect_stdout(output):
+                    parse_args([f'--source-dir={source_dir}', f'--build-dir={self.test_folder_path}'] + mode)
+                self.assertTrue(Path(document_path).is_file())
+                os.remove(document_path)
+                with contextlib.redirect_stdout(output):
+                    parse_args([f'--source-dir={source_dir}', f'--build-dir={self.test_folder_path}',
+                                '--validate-examples'] + mode)
+                self.assertIn('Generated example is not valid', output.getvalue())
+                self.assertFalse(Path(document_path).exists())
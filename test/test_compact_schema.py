@@ -0,0 +1,130 @@
+import os
+import copy
+import shutil
+import unittest
+import tracemalloc
+
+from cerberus_docs import MarkDownUtils
+from cerberus_docs.classes.compact_schema import (
+    CompactAttribute,
+    CompactSchema,
+    compact_schema_map,
+    thaw_schema_map,
+)
+from cerberus_docs.classes.frozen_schema import freeze
+from cerberus_docs.classes.markdown_utils import VALIDATION_RULE_PRIORITY_LIST
+from test.__mocks__.mock_schema import mock_schema
+
+
+class TestCompactSchema(unittest.TestCase):
+    def setUp(self) -> None:
+        self.schema = copy.deepcopy(mock_schema)
+        self.current_dir = os.path.dirname(os.path.realpath(__file__))
+        self.test_folder_path = os.path.join(self.current_dir, 'test_dir')
+        os.mkdir(self.test_folder_path)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.test_folder_path)
+
+    def test_from_attribute(self) -> None:
+        attribute = CompactAttribute.from_attribute('test1', self.schema['test1'])
+        with self.subTest('rules are in display order'):
+            self.assertEqual(attribute.rule_names, ('required', 'type', 'allowed', 'meta'))
+        with self.subTest('unknown rules are last'):
+            unknown = CompactAttribute.from_attribute('test3', self.schema['test3'])
+            self.assertEqual(unknown.rule_names, ('required', 'type', 'allow_unknown', 'valuesrules'))
+        with self.subTest('mapping access'):
+            self.assertEqual(attribute['type'], 'string')
+            self.assertIsNone(attribute.get('regex'))
+            self.assertEqual(attribute.get('regex', ''), '')
+            self.assertEqual(attribute.get('required'), self.schema['test1']['required'])
+            self.assertIn('meta', attribute)
+            self.assertNotIn('regex', attribute)
+            self.assertRaises(KeyError, lambda: attribute['regex'])
+            self.assertEqual(len(attribute), 4)
+
+    def test_shared_rule_names(self) -> None:
+        first = CompactAttribute.from_attribute('a', {'type': 'string', 'required': True})
+        second = CompactAttribute.from_attribute('b', {'required': False, 'type': 'integer'})
+        self.assertIs(first.rule_names, second.rule_names)
+        self.assertTrue(all(rule in VALIDATION_RULE_PRIORITY_LIST for rule in first.rule_names))
+
+    def test_slots(self) -> None:
+        attribute = CompactAttribute.from_attribute('a', {'type': 'string'})
+        self.assertFalse(hasattr(attribute, '__dict__'))
+        self.assertFalse(hasattr(CompactSchema.from_schema(self.schema), '__dict__'))
+
+    def test_round_trip(self) -> None:
+        compact = CompactSchema.from_schema(self.schema)
+        self.assertIsInstance(compact['test4']['schema'], CompactSchema)
+        self.assertIsInstance(compact['test4']['schema']['test5']['schema'], CompactAttribute)
+        self.assertEqual(compact.to_schema(), self.schema)
+        self.assertEqual(list(compact), list(self.schema))
+        self.assertIn('test2', compact)
+        self.assertNotIn('missing', compact)
+        self.assertIs(compact['test2'], compact.attributes[1])
+        self.assertRaises(KeyError, lambda: compact['missing'])
+
+    def test_shared_nested_schemas(self) -> None:
+        address = {'street': {'type': 'string'}}
+        schema = {'billing': {'type': 'dict', 'schema': address}, 'shipping': {'type': 'dict', 'schema': address}}
+        compact = CompactSchema.from_schema(schema)
+        self.assertIs(compact['billing']['schema'], compact['shipping']['schema'])
+        thawed = compact.to_schema()
+        self.assertEqual(thawed, schema)
+        self.assertIs(thawed['billing']['schema'], thawed['shipping']['schema'])
+
+    def test_compact_schema_map(self) -> None:
+        frozen = freeze(self.schema)
+        schema_map = compact_schema_map({'Foo': [self.schema, frozen]})
+        self.assertEqual(schema_map['Foo'][0].to_schema(), self.schema)
+        self.assertIs(schema_map['Foo'][1], frozen)
+        thawed = thaw_schema_map(schema_map)
+        self.assertEqual(thawed, {'Foo': [self.schema, self.schema]})
+        self.assertIs(type(thawed['Foo'][0]), dict)
+        self.assertIs(thawed['Foo'][1], frozen)
+
+    def test_renders_like_dict_schema(self) -> None:
+        dict_utils = MarkDownUtils('dict', file_path=self.test_folder_path)
+        compact_utils = MarkDownUtils('compact', file_path=self.test_folder_path)
+        compact = CompactSchema.from_schema(self.schema)
+        dict_utils.generate_attributes('Test', self.schema)
+        dict_utils.generate_schema_example(self.schema)
+        compact_utils.generate_attributes('Test', compact)
+        compact_utils.generate_schema_example(compact)
+        self.assertEqual(compact_utils.content, dict_utils.content)
+
+    def test_renders_with_custom_rule_order(self) -> None:
+        dict_utils = MarkDownUtils('dict')
+        compact_utils = MarkDownUtils('compact')
+        for md_utils in (dict_utils, compact_utils):
+            md_utils.validation_rule_priority_list.reverse()
+        compact = CompactSchema.from_schema(self.schema)
+        rendered = ''.join(dict_utils.iter_attributes('Test', self.schema))
+        self.assertEqual(''.join(compact_utils.iter_attributes('Test', compact)), rendered)
+        self.assertTrue(rendered.startswith('`test1`: \n\n\n'))
+
+    def test_memory_saving(self) -> None:
+        # Both models hold their own copy of the schema, like a cache entry that outlives its module. The saving
+        # grows with the number of rules of an attribute, as the rule names are shared.
+        schema = {
+            f'attribute_{i}': {
+                'type': 'string', 'required': bool(i % 2), 'regex': '^[a-z]+$', 'nullable': True, 'minlength': 1,
+                'maxlength': 9,
+            }
+            for i in range(2000)
+        }
+        CompactSchema.from_schema(schema)
+
+        tracemalloc.start()
+        dict_model = copy.deepcopy(schema)
+        dict_size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        tracemalloc.start()
+        compact_model = CompactSchema.from_schema(copy.deepcopy(schema))
+        compact_size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        self.assertEqual(compact_model.to_schema(), dict_model)
+        self.assertLess(compact_size, dict_size)
@@ -0,0 +1,153 @@
+import gc
+import os
+import time
+import types
+import shutil
+import tracemalloc
+import unittest
+from typing import Any, Callable, List
+
+from cerberus_docs import CerberusSchema, DocsBuilder, MarkDownUtils, render_document
+from cerberus_docs.utils.generator import extract_module_schemas
+from cerberus_docs.classes.compact_schema import CompactSchema
+from cerberus_docs.classes.types import Schema
+
+# Every input grows 8 times over three doublings. Linear growth multiplies time and allocations by about 8 and
+# quadratic growth by about 64. Both are the best of several runs, which leaves out the runs slowed down by other
+# processes, and the bounds leave room for the remaining noise while still catching quadratic regressions.
+SCALE: int = 8
+REPEATS: int = 3
+MAX_TIME_GROWTH: float = SCALE * 4
+MAX_ALLOCATION_GROWTH: float = SCALE * 1.5
+
+
+def measure_time(run: Callable[[int], Any], size: int, repeats: int = REPEATS) -> float:
+    """
+    Returns the fastest of several runs in seconds.
+    """
+    timings: List[float] = []
+    for _ in range(repeats):
+        gc.collect()
+        start = time.perf_counter()
+        run(size)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def measure_allocations(run: Callable[[int], Any], size: int, repeats: int = 2) -> int:
+    """
+    Returns the smallest peak traced allocation of several runs in bytes, after a first run that fills the caches.
+    A run can also allocate for global state, e.g. when the table of interned strings is resized, which the
+    smallest peak leaves out.
+    """
+    run(size)
+    peaks: List[int] = []
+    for _ in range(repeats):
+        gc.collect()
+        tracemalloc.start()
+        try:
+            run(size)
+            peaks.append(tracemalloc.get_traced_memory()[1])
+        finally:
+            tracemalloc.stop()
+    return min(peaks)
+
+
+def attributes_schema(size: int) -> Schema:
+    return {f'attribute{i}': {'type': 'string', 'required': True} for i in range(size)}
+
+
+def allowed_schema(size: int) -> Schema:
+    return {'status': {'type': 'string', 'allowed': [f'value{i}' for i in range(size)]}}
+
+
+def nested_schema(depth: int, references: int = 1) -> Schema:
+    """
+    Returns a schema nested depth levels deep, where every level references the next level references times.
+    """
+    schema: Schema = {'leaf': {'type': 'string'}}
+    for level in range(depth):
+        schema = {f'level{level}ref{i}': {'type': 'dict', 'schema': schema} for i in range(references)}
+    return schema
+
+
+class TestComplexity(unittest.TestCase):
+    def setUp(self) -> None:
+        self.current_dir = os.path.dirname(os.path.realpath(__file__))
+        self.test_folder: str = 'test_dir'
+        self.test_folder_path = os.path.join(self.current_dir, self.test_folder)
+        os.mkdir(self.test_folder_path)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.test_folder_path)
+
+    def assertLinear(self, run: Callable[[int], Any], size: int) -> None:
+        allocation_growth = measure_allocations(run, size * SCALE) / measure_allocations(run, size)
+        self.assertLess(allocation_growth, MAX_ALLOCATION_GROWTH, f'allocations grew {allocation_growth:.1f}x')
+        time_growth = measure_time(run, size * SCALE) / measure_time(run, size)
+        self.assertLess(time_growth, MAX_TIME_GROWTH, f'time grew {time_growth:.1f}x')
+
+    def test_attributes(self) -> None:
+        self.assertLinear(lambda size: render_document('Foo', [attributes_schema(size)]), 250)
+
+    def test_compact_attributes(self) -> None:
+        def render(size: int) -> str:
+            return render_document('Foo', [CompactSchema.from_schema(attributes_schema(size))])
+        self.assertLinear(render, 250)
+
+    def test_content(self) -> None:
+        def generate(size: int) -> None:
+            md_utils = MarkDownUtils('')
+            md_utils.generate_header('Foo')
+            md_utils.generate_attributes('Foo', {f'attribute{i}': {} for i in range(size)})
+            self.assertTrue(md_utils.content)
+        self.assertLinear(generate, 4000)
+
+    def test_allowed_values(self) -> None:
+        self.assertLinear(lambda size: render_document('Foo', [allowed_schema(size)]), 16000)
+
+    def test_nesting_depth(self) -> None:
+        # Section names and the indentation of the example grow with the depth, so the output itself grows faster
+        # than the depth. The cost per rendered byte has to stay constant.
+        def render(size: int) -> int:
+            return len(render_document('Foo', [nested_schema(size)]))
+        output_growth = render(20 * SCALE) / render(20)
+        allocation_growth = measure_allocations(render, 20 * SCALE) / measure_allocations(render, 20)
+        self.assertLess(allocation_growth / output_growth, MAX_ALLOCATION_GROWTH / SCALE)
+        time_growth = measure_time(render, 20 * SCALE) / measure_time(render, 20)
+        self.assertLess(time_growth / output_growth, MAX_TIME_GROWTH / SCALE)
+
+    def test_shared_nested_schemas(self) -> None:
+        # Every level references the next level twice, which are 2 ** depth sections if every reference is rendered.
+        def attributes(depth: int) -> str:
+            return ''.join(MarkDownUtils('').iter_attributes('Foo', nested_schema(depth, references=2)))
+        small = attributes(3)
+        large = attributes(3 * SCALE)
+        self.assertLess(len(large) / len(small), SCALE * SCALE)
+        self.assertEqual(large.count('\n## '), 3 * SCALE)
+
+    def test_classes_per_module(self) -> None:
+        def extract(size: int) -> None:
+            module = types.ModuleType('generated')
+            for i in range(size):
+                setattr(module, f'Class{i}', type(f'Class{i}', (), {'schema': CerberusSchema(attributes_schema(2))}))
+            self.assertEqual(len(extract_module_schemas(module)), size)
+        self.assertLinear(extract, 250)
+
+    def test_modules_per_tree(self) -> None:
+        def build(size: int) -> None:
+            source_dir = os.path.join(self.test_folder_path, f'source{size}')
+            build_dir = os.path.join(self.test_folder_path, f'build{size}')
+            if not os.path.isdir(source_dir):
+                os.mkdir(source_dir)
+                for i in range(size):
+                    with open(os.path.join(source_dir, f'module{i}.py'), 'w') as source_file:
+                        source_file.write(
+                            'from cerberus_docs import CerberusSchema\n\n\n'
+                            f'class Class{i}:\n'
+                            "    schema = CerberusSchema({'name': {'type': 'string'}})\n"
+                        )
+            shutil.rmtree(build_dir, ignore_errors=True)
+            os.mkdir(build_dir)
+            DocsBuilder(source_dir, build_dir).build()
+        self.assertLinear(build, 25)
@@ -0,0 +1,170 @@
+import io
+import os
+import sys
+import json
+import time
+import types
+import socket
+import shutil
+import tempfile
+import threading
+import contextlib
+import unittest
+from unittest import mock
+
+from cerberus_docs import CerberusDocsException
+from cerberus_docs.daemon import (
+    ModuleTracker, SchemaDaemon, _RequestHandler, default_socket_path, forward, python_environment,
+    secure_socket_directory, send_request, serve
+)
+
+
+class TestModuleTracker(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_folder_path = tempfile.mkdtemp()
+        self.module_path = os.path.join(self.test_folder_path, 'tracked_module.py')
+        with open(self.module_path, 'w') as module_file:
+            module_file.write('x = 1\n')
+        module = types.ModuleType('tracked_module')
+        module.__file__ = self.module_path
+        sys.modules['tracked_module'] = module
+
+    def tearDown(self) -> None:
+        sys.modules.pop('tracked_module', None)
+        shutil.rmtree(self.test_folder_path)
+
+    def test_invalidate(self) -> None:
+        tracker = ModuleTracker()
+        self.assertNotIn('tracked_module', tracker.invalidate())
+        with self.subTest('unchanged'):
+            self.assertEqual(tracker.invalidate(), [])
+            self.assertIn('tracked_module', sys.modules)
+        with self.subTest('changed'):
+            os.utime(self.module_path, ns=(0, 0))
+            self.assertEqual(tracker.invalidate(), ['tracked_module'])
+            self.assertNotIn('tracked_module', sys.modules)
+
+
+class TestDaemon(unittest.TestCase):
+    def setUp(self) -> None:
+        self.current_dir = os.path.dirname(os.path.realpath(__file__))
+        self.test_folder_path = tempfile.mkdtemp()
+        self.build_dir = os.path.join(self.test_folder_path, 'build')
+        self.socket_path = os.path.join(self.test_folder_path, 'daemon.sock')
+        os.mkdir(self.build_dir)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.test_folder_path)
+
+    def test_default_socket_path(self) -> None:
+        with mock.patch.dict(os.environ, {'CERBERUS_DOCS_SOCKET': self.socket_path}):
+            self.assertEqual(default_socket_path(), self.socket_path)
+        with mock.patch.dict(os.environ, {'CERBERUS_DOCS_SOCKET': '', 'XDG_RUNTIME_DIR': self.test_folder_path}):
+            self.assertTrue(default_socket_path().startswith(os.path.join(self.test_folder_path, 'cerberus-docs-')))
+        with mock.patch.dict(os.environ, {'CERBERUS_DOCS_SOCKET': '', 'XDG_RUNTIME_DIR': ''}):
+            self.assertEqual(os.path.dirname(os.path.dirname(default_socket_path())), tempfile.gettempdir())
+
+    @unittest.skipUnless(hasattr(os, 'getuid'), 'requires Unix user ids')
+    def test_secure_socket_directory(self) -> None:
+        socket_dir = os.path.join(self.test_folder_path, 'sockets')
+        secure_socket_directory(socket_dir)
+        self.assertEqual(os.stat(socket_dir).st_mode & 0o777, 0o700)
+        with self.subTest('writable by other users'):
+            os.chmod(socket_dir, 0o777)
+            self.assertRaises(CerberusDocsException, secure_socket_directory, socket_dir)
+            self.assertRaises(CerberusDocsException, serve, os.path.join(socket_dir, 'daemon.sock'))
+        with self.subTest('sticky'):
+            os.chmod(socket_dir, 0o1777)
+            secure_socket_directory(socket_dir)
+        with self.subTest('owned by another user'):
+            os.chmod(socket_dir, 0o700)
+            with mock.patch('os.getuid', return_value=os.getuid() + 1):
+                self.assertRaises(CerberusDocsException, secure_socket_directory, socket_dir)
+
+    def test_run(self) -> None:
+        daemon = SchemaDaemon()
+        args = [f'--source-dir={os.path.join(self.current_dir, "__mocks__")}', f'--build-dir={self.build_dir}']
+        response = daemon.run(self.test_folder_path, args)
+        self.assertEqual(response['exit_code'], 0)
+        self.assertIn('Docs successfully generated.', response['stdout'])
+        self.assertGreater(len(daemon.memory_cache), 0)
+        self.assertTrue(os.path.isfile(os.path.join(self.build_dir, 'MockFile1_cerberus_doc.md')))
+
+        with self.subTest('warm build'), mock.patch('cerberus_docs.classes.docs_builder.extract_schemas') as extract:
+            self.assertEqual(daemon.run(self.test_folder_path, args)['exit_code'], 0)
+            extract.assert_not_called()
+
+        with self.subTest('failed build'):
+            response = daemon.run(self.test_folder_path, ['--source-dir=doesnotexist', f'--build-dir={self.build_dir}'])
+            self.assertEqual(response['exit_code'], 1)
+            self.assertIn('doesnotexist', response['stderr'])
+
+    def test_handle_other_environment(self) -> None:
+        daemon = SchemaDaemon()
+        request = {'command': 'run', 'cwd': self.test_folder_path, 'args': ['--help']}
+        with mock.patch.object(daemon, 'run') as run:
+            for environment in (None, {**python_environment(), 'prefix': '/other/venv'}):
+                response = daemon.handle({**request, 'environment': environment}, mock.Mock())
+                self.assertIn('another Python environment', response['error'])
+            run.assert_not_called()
+        with mock.patch('cerberus_docs.daemon.send_request', return_value={'error': 'other environment'}):
+            self.assertIsNone(forward(['--help'], self.socket_path))
+
+    @unittest.skipUnless(hasattr(socket, 'AF_UNIX'), 'requires Unix domain sockets')
+    def test_client_disconnects(self) -> None:
+        connection, client = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+        with connection:
+            client.sendall(b'{"command": "ping"}\n')
+            client.close()
+            # Does not raise once the client is gone.
+            _RequestHandler(connection, '', mock.Mock(schema_daemon=SchemaDaemon()))
+
+    def test_forward_not_running(self) -> None:
+        self.assertIsNone(send_request({'command': 'ping'}, self.socket_path))
+        self.assertIsNone(forward(['--help'], self.socket_path))
+
+    @unittest.skipUnless(hasattr(socket, 'AF_UNIX'), 'requires Unix domain sockets')
+    def test_serve(self) -> None:
+        server_thread = threading.Thread(target=serve, args=(self.socket_path,), daemon=True)
+        server_thread.start()
+        deadline = time.monotonic() + 5
+        while send_request({'command': 'ping'}, self.socket_path) is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(os.stat(self.socket_path).st_mode & 0o777, 0o600)
+
+        args = [f'--source-dir={os.path.join(self.current_dir, "__mocks__")}', f'--build-dir={self.build_dir}']
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            self.assertEqual(forward(args, self.socket_path), 0)
+        self.assertIn('Docs successfully generated.', output.getvalue())
+        self.assertGreater(send_request({'command': 'ping'}, self.socket_path)['cached'], 0)
+
+        with self.subTest('disabled'), mock.patch.dict(os.environ, {'CERBERUS_DOCS_NO_DAEMON': '1'}):
+            self.assertIsNone(forward(args, self.socket_path))
+
+        with self.subTest('daemon of another user'), mock.patch('cerberus_docs.daemon.peer_uid', return_value=None):
+            with mock.patch('os.stat', return_value=mock.Mock(st_uid=os.getuid() + 1)):
+                self.assertIsNone(send_request({'command': 'ping'}, self.socket_path))
+            self.assertIsNotNone(send_request({'command': 'ping'}, self.socket_path))
+
+        with self.subTest('client of another user'):
+            # Only the accepted socket of the server is bound to the socket path.
+            def client_of_another_user(connection: socket.socket) -> int:
+                return os.getuid() + 1 if connection.getsockname() else os.getuid()
+
+            with mock.patch('cerberus_docs.daemon.peer_uid', side_effect=client_of_another_user):
+                self.assertIsNone(send_request({'command': 'ping'}, self.socket_path))
+
+        with self.subTest('malformed request'):
+            for line in (b'\n', b'not json\n', b'[]\n', b'{"command": "run"}\n', b'\xff\n'):
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+                    client.connect(self.socket_path)
+                    client.sendall(line)
+                    with client.makefile('rb') as response_file:
+                        response = json.loads(response_file.readline().decode('utf-8'))
+                self.assertIn('Invalid request', response['error'])
+            self.assertIsNotNone(send_request({'command': 'ping'}, self.socket_path))
+
+        self.assertEqual(send_request({'command': 'stop'}, self.socket_path)['pid'], os.getpid())
+        server_thread.join(5)
+        self.assertFalse(server_thread.is_alive())
+        self.assertFalse(os.path.exists(self.socket_path))
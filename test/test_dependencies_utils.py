@@ -0,0 +1,80 @@
+import os
+import sys
+import shutil
+import builtins
+import unittest
+
+from cerberus_docs import extract_schemas
+from cerberus_docs.utils.dependencies import DependencyRecorder, changed_files, dependents, file_hash, reachable
+
+FILES = {
+    'fragments.py': "BASE_FIELDS = {'id': {'type': 'integer'}}\n",
+    os.path.join('shared', '__init__.py'): '',
+    os.path.join('shared', 'names.py'): "from .rules import NAME\nFIELDS = {'name': NAME}\n",
+    os.path.join('shared', 'rules.py'): "NAME = {'type': 'string'}\n",
+    'model.py': (
+        'import json\n'
+        'from fragments import BASE_FIELDS\n'
+        'from shared import names\n'
+        'from cerberus_docs import CerberusSchema\n\n\n'
+        'class Model:\n'
+        '    schema = CerberusSchema({**BASE_FIELDS, **names.FIELDS})\n'
+    ),
+}
+
+
+class TestDependenciesUtils(unittest.TestCase):
+    def setUp(self) -> None:
+        self.current_dir = os.path.dirname(os.path.realpath(__file__))
+        self.test_folder_path = os.path.join(self.current_dir, 'test_dir')
+        os.makedirs(os.path.join(self.test_folder_path, 'shared'))
+        for file_name, source in FILES.items():
+            with open(os.path.join(self.test_folder_path, file_name), 'w') as source_file:
+                source_file.write(source)
+        sys.path.insert(0, self.test_folder_path)
+
+    def tearDown(self) -> None:
+        sys.path.remove(self.test_folder_path)
+        for module_name in ('fragments', 'shared', 'shared.names', 'shared.rules', 'model.py'):
+            sys.modules.pop(module_name, None)
+        shutil.rmtree(self.test_folder_path)
+
+    def test_recorder(self) -> None:
+        original_import = builtins.__import__
+        with DependencyRecorder(self.test_folder_path) as recorder:
+            schema_map = extract_schemas('model.py', os.path.join(self.test_folder_path, 'model.py'))
+        self.assertIs(builtins.__import__, original_import)
+        self.assertEqual(list(schema_map['Model'][0]), ['id', 'name'])
+        self.assertEqual(recorder.dependencies['model.py'], {'fragments.py', 'shared/__init__.py', 'shared/names.py'})
+        self.assertEqual(recorder.dependencies['shared/names.py'], {'shared/__init__.py', 'shared/rules.py'})
+
+        with self.subTest('modules that are already imported are recorded'):
+            with DependencyRecorder(self.test_folder_path) as recorder:
+                extract_schemas('model.py', os.path.join(self.test_folder_path, 'model.py'))
+            self.assertEqual(
+                recorder.dependencies, {'model.py': {'fragments.py', 'shared/__init__.py', 'shared/names.py'}}
+            )
+
+    def test_relative_path(self) -> None:
+        recorder = DependencyRecorder(self.test_folder_path)
+        self.assertEqual(recorder.relative_path(os.path.join(self.test_folder_path, 'shared', 'names.py')),
+                         'shared/names.py')
+        self.assertIsNone(recorder.relative_path(os.__file__))
+        self.assertIsNone(recorder.relative_path(None))
+
+    def test_graph(self) -> None:
+        dependencies = {'a.py': ['b.py'], 'b.py': ['c.py'], 'd.py': ['c.py'], 'e.py': []}
+        self.assertEqual(dependents(dependencies, ['c.py']), {'a.py', 'b.py', 'c.py', 'd.py'})
+        self.assertEqual(dependents(dependencies, ['a.py']), {'a.py'})
+        self.assertEqual(reachable(dependencies, ['a.py']), {'a.py', 'b.py', 'c.py'})
+
+    def test_changed_files(self) -> None:
+        file_hashes = {
+            file_name.replace(os.sep, '/'): file_hash(os.path.join(self.test_folder_path, file_name))
+            for file_name in FILES
+        }
+        file_hashes['removed.py'] = 'hash'
+        with open(os.path.join(self.test_folder_path, 'shared', 'rules.py'), 'a') as source_file:
+            source_file.write("OTHER = {'type': 'integer'}\n")
+        self.assertEqual(changed_files(file_hashes, self.test_folder_path), {'shared/rules.py', 'removed.py'})
+        self.assertIsNone(file_hash(os.path.join(self.test_folder_path, 'removed.py')))
@@ -0,0 +1,375 @@
+import io
+import os
+import sys
+import shutil
+import contextlib
+import zipfile
+import unittest
+from unittest import mock
+
+from cerberus_docs import DocsBuilder, CerberusDocsException
+from cerberus_docs.classes.build_manifest import BuildManifest, MANIFEST_FILE_NAME
+from cerberus_docs.classes.schema_cache import MemorySchemaCache
+from cerberus_docs.classes.schema_snapshot import SchemaSnapshot
+
+
+class TestDocsBuilder(unittest.TestCase):
+    def setUp(self) -> None:
+        self.current_dir = os.path.dirname(os.path.realpath(__file__))
+        self.test_folder: str = 'test_dir'
+        self.test_folder_path = os.path.join(self.current_dir, self.test_folder)
+        self.source_dir = os.path.join(self.current_dir, '__mocks__')
+        self.cache_dir = os.path.join(self.test_folder_path, 'cache')
+        os.mkdir(self.test_folder_path)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.test_folder_path)
+
+    def test_iter_source_files(self) -> None:
+        builder = DocsBuilder(self.source_dir, self.test_folder_path)
+        file_names = [os.path.basename(file_path) for file_path in builder._iter_source_files()]
+        self.assertIn('mock_file_1.py', file_names)
+        self.assertIn('mock_file_2.py', file_names)
+        self.assertTrue(all(file_name.endswith('.py') for file_name in file_names))
+
+    def test_build(self) -> None:
+        DocsBuilder(self.source_dir, self.test_folder_path).build()
+        self.assertTrue(os.path.isfile(os.path.join(self.test_folder_path, 'MockFileParent_cerberus_doc.md')))
+        self.assertTrue(os.path.isfile(os.path.join(self.test_folder_path, 'MockFile1_cerberus_doc.md')))
+
+    def test_build_evict_modules(self) -> None:
+        sys.modules.pop('mock_file_1.py', None)
+        with self.subTest('imported source files are evicted'):
+            DocsBuilder(self.source_dir, self.test_folder_path, evict_modules=True).build()
+            self.assertNotIn('mock_file_1.py', sys.modules)
+            self.assertTrue(os.path.isfile(os.path.join(self.test_folder_path, 'MockFile1_cerberus_doc.md')))
+        with self.subTest('allow-listed modules are kept'):
+            keep_modules = ['mock_file_1']
+            DocsBuilder(self.source_dir, self.test_folder_path, evict_modules=True, keep_modules=keep_modules).build()
+            self.assertIn('mock_file_1.py', sys.modules)
+            del sys.modules['mock_file_1.py']
+
+    def test_build_package(self) -> None:
+        with self.subTest('builds every module of the package'):
+            builder = DocsBuilder(self.source_dir, self.test_folder_path)
+            builder.build_package('test.__mocks__')
+            self.assertEqual(
+                builder.manifest.documents,
+                ['MockFile1_cerberus_doc.md', 'MockFileChild_cerberus_doc.md', 'MockFileParent_cerberus_doc.md']
+            )
+            self.assertIn('test.__mocks__.mock_folder_1.mock_file_1', BuildManifest.read(self.test_folder_path).sources)
+        with self.subTest('subpackage cannot be imported'):
+            package_dir = os.path.join(self.test_folder_path, 'source', 'broken_package')
+            build_dir = os.path.join(self.test_folder_path, 'build')
+            os.makedirs(os.path.join(package_dir, 'broken'))
+            os.mkdir(build_dir)
+            for module in ('__init__.py', 'models.py', os.path.join('broken', '__init__.py')):
+                with open(os.path.join(package_dir, module), 'w') as module_file:
+                    module_file.write(
+                        "raise ValueError('broken')\n" if module.startswith('broken') else
+                        '' if module == '__init__.py' else
+                        'from cerberus_docs import CerberusSchema\n\n\n'
+                        'class Model:\n'
+                        "    schema = CerberusSchema({'name': {'type': 'string'}})\n"
+                    )
+            sys.path.insert(0, os.path.dirname(package_dir))
+            try:
+                builder = DocsBuilder(os.path.dirname(package_dir), build_dir)
+                with mock.patch('builtins.print') as print_mock:
+                    builder.build_package('broken_package')
+                print_mock.assert_called_once_with('broken_package.broken failed: broken')
+                self.assertEqual(builder.metrics.to_dict()['counters']['failures'], 1)
+                self.assertEqual(builder.manifest.documents, ['Model_cerberus_doc.md'])
+            finally:
+                sys.path.remove(os.path.dirname(package_dir))
+                for module_name in ('broken_package', 'broken_package.models'):
+                    sys.modules.pop(module_name, None)
+        with self.subTest('package cannot be imported'):
+            builder = DocsBuilder(self.source_dir, self.test_folder_path)
+            self.assertRaises(CerberusDocsException, builder.build_package, 'does_not_exist')
+        with self.subTest('failed build removes a new search database'):
+            database_path = os.path.join(self.test_folder_path, 'search.db')
+            builder = DocsBuilder(self.source_dir, self.test_folder_path, search_db=database_path)
+            self.assertRaises(CerberusDocsException, builder.build_package, 'does_not_exist')
+            self.assertFalse(os.path.exists(database_path))
+
+    def test_build_archive(self) -> None:
+        archive_path = os.path.join(self.test_folder_path, 'docs.zip')
+        build_dir = os.path.join(self.test_folder_path, 'build')
+        os.mkdir(build_dir)
+        for pipelined in [False, True]:
+            with self.subTest(pipelined=pipelined):
+                builder = DocsBuilder(self.source_dir, build_dir, archive=archive_path)
+                builder.build_pipelined() if pipelined else builder.build()
+                self.assertEqual(os.listdir(build_dir), [])
+                with zipfile.ZipFile(archive_path) as archive:
+                    self.assertEqual(
+                        sorted(archive.namelist()),
+                        sorted(builder.manifest.documents + [MANIFEST_FILE_NAME])
+                    )
+        with self.subTest('cannot be combined with stream'):
+            with self.assertRaises(CerberusDocsException):
+                DocsBuilder(self.source_dir, build_dir, stream=True, archive=archive_path)
+
+    def test_build_uses_cache(self) -> None:
+        DocsBuilder(self.source_dir, self.test_folder_path, cache_dir=self.cache_dir).build()
+        with mock.patch('cerberus_docs.classes.docs_builder.extract_schemas') as extract_schemas:
+            DocsBuilder(self.source_dir, self.test_folder_path, cache_dir=self.cache_dir).build()
+            extract_schemas.assert_not_called()
+
+    def test_build_memory_cache(self) -> None:
+        memory_cache = MemorySchemaCache()
+        DocsBuilder(self.source_dir, self.test_folder_path, memory_cache=memory_cache).build()
+        self.assertGreater(len(memory_cache), 0)
+        with mock.patch('cerberus_docs.classes.docs_builder.extract_schemas') as extract_schemas, \
+                mock.patch.object(memory_cache, 'put') as put:
+            builder = DocsBuilder(self.source_dir, self.test_folder_path, memory_cache=memory_cache)
+            builder.build()
+            extract_schemas.assert_not_called()
+            put.assert_not_called()
+        self.assertEqual(builder.metrics.counters['files_cached'], len(memory_cache))
+
+    def test_build_from_cache(self) -> None:
+        with self.subTest('cache is empty'):
+            DocsBuilder(self.source_dir, self.test_folder_path, cache_dir=self.cache_dir).build_from_cache()
+            self.assertEqual(sorted(os.listdir(self.test_folder_path)), ['cache', MANIFEST_FILE_NAME])
+
+        DocsBuilder(self.source_dir, self.test_folder_path, cache_dir=self.cache_dir).build()
+        os.remove(os.path.join(self.test_folder_path, 'MockFile1_cerberus_doc.md'))
+        with self.subTest('renders without importing'):
+            with mock.patch('cerberus_docs.classes.docs_builder.extract_schemas') as extract_schemas:
+                DocsBuilder(self.source_dir, self.test_folder_path, cache_dir=self.cache_dir).build_from_cache()
+                extract_schemas.assert_not_called()
+            self.assertTrue(os.path.isfile(os.path.join(self.test_folder_path, 'MockFile1_cerberus_doc.md')))
+        with self.subTest('skips entries outside the source directory'):
+            build_dir = os.path.join(self.test_folder_path, 'partial')
+            os.mkdir(build_dir)
+            builder = DocsBuilder(os.path.join(self.source_dir, 'mock_folder_1'), build_dir, cache_dir=self.cache_dir)
+            builder.build_from_cache()
+            self.assertEqual(list(builder.manifest.sources), ['mock_file_1.py'])
+
+    def test_build_from_cache_without_cache_dir(self) -> None:
+        builder = DocsBuilder(self.source_dir, self.test_folder_path)
+        self.assertRaises(CerberusDocsException, builder.build_from_cache)
+
+    def test_build_manifest(self) -> None:
+        DocsBuilder(self.source_dir, self.test_folder_path).build()
+        manifest = BuildManifest.read(self.test_folder_path)
+        self.assertIsNone(manifest.shard)
+        self.assertEqual(manifest.sources['mock_folder_1/mock_file_1.py'], {
+            'classes': ['MockFileChild', 'MockFileParent'],
+            'documents': ['MockFileChild_cerberus_doc.md', 'MockFileParent_cerberus_doc.md'],
+        })
+
+    def test_build_shards(self) -> None:
+        all_files = set(DocsBuilder(self.source_dir, self.test_folder_path)._iter_source_files())
+        shard_files = [
+            set(DocsBuilder(self.source_dir, self.test_folder_path, shard=(index, 3))._iter_source_files())
+            for index in range(3)
+        ]
+        self.assertEqual(set.union(*shard_files), all_files)
+        self.assertEqual(sum(len(files) for files in shard_files), len(all_files))
+
+    def test_build_metrics(self) -> None:
+        source_dir = os.path.join(self.test_folder_path, 'source')
+        build_dir = os.path.join(self.test_folder_path, 'build')
+        os.makedirs(os.path.join(source_dir, 'package'))
+        os.mkdir(build_dir)
+        for module, class_name in (('first.py', 'First'), (os.path.join('package', 'second.py'), 'Second')):
+            with open(os.path.join(source_dir, module), 'w') as source_file:
+                source_file.write(
+                    'from cerberus_docs import CerberusSchema\n\n\n'
+                    f'class {class_name}:\n'
+                    "    schema = CerberusSchema({'name': {'type': 'string'}})\n"
+                )
+        with open(os.path.join(source_dir, 'broken.py'), 'w') as source_file:
+            source_file.write("raise ValueError('broken')\n")
+        builder = DocsBuilder(source_dir, build_dir, cache_dir=self.cache_dir)
+        with mock.patch('builtins.print') as print_mock:
+            builder.build()
+        print_mock.assert_called_once()
+        metrics = builder.metrics.to_dict()
+        self.assertEqual(metrics['counters']['files_scanned'], 3)
+        self.assertEqual(metrics['counters']['files_imported'], 3)
+        self.assertEqual(metrics['counters']['files_cached'], 0)
+        self.assertEqual(metrics['counters']['failures'], 1)
+        self.assertEqual(metrics['counters']['schemas_rendered'], 2)
+        self.assertEqual(metrics['counters']['documents_written'], 2)
+        document_paths = [os.path.join(build_dir, f'{name}_cerberus_doc.md') for name in ('First', 'Second')]
+        self.assertEqual(metrics['counters']['written_bytes'], sum(map(os.path.getsize, document_paths)))
+        self.assertEqual(metrics['histograms']['import_seconds']['count'], 3)
+        self.assertEqual(metrics['histograms']['document_bytes']['count'], 2)
+        self.assertGreater(metrics['phase_seconds']['extract'], 0)
+        self.assertIsNotNone(metrics['duration_seconds'])
+
+        with self.subTest('cached sources are not imported'):
+            builder = DocsBuilder(source_dir, build_dir, cache_dir=self.cache_dir)
+            with mock.patch('builtins.print'):
+                builder.build()
+            self.assertEqual(builder.metrics.counters['files_cached'], 2)
+            self.assertEqual(builder.metrics.counters['files_imported'], 1)
+
+        with self.subTest('failed renders are not counted'):
+            builder = DocsBuilder(source_dir, build_dir)
+            with mock.patch('cerberus_docs.utils.generator.render_document', side_effect=ValueError('render')), \
+                    mock.patch('builtins.print'):
+                builder.build()
+            self.assertEqual(builder.metrics.counters['failures'], 3)
+            self.assertEqual(builder.metrics.counters['schemas_rendered'], 0)
+
+    def test_build_dependencies(self) -> None:
+        source_dir = os.path.join(self.test_folder_path, 'source')
+        build_dir = os.path.join(self.test_folder_path, 'build')
+        os.mkdir(source_dir)
+        os.mkdir(build_dir)
+        sources = {
+            'fragments.py': "BASE_FIELDS = {'id': {'type': 'integer'}}\n",
+            'model.py': (
+                'from fragments import BASE_FIELDS\n'
+                'from cerberus_docs import CerberusSchema\n\n\n'
+                'class Model:\n'
+                "    schema = CerberusSchema({**BASE_FIELDS, 'name': {'type': 'string'}})\n"
+            ),
+            'other.py': (
+                'from cerberus_docs import CerberusSchema\n\n\n'
+                'class Other:\n'
+                "    schema = CerberusSchema({'value': {'type': 'string'}})\n"
+            ),
+        }
+        for file_name, source in sources.items():
+            with open(os.path.join(source_dir, file_name), 'w') as source_file:
+                source_file.write(source)
+        sys.path.insert(0, source_dir)
+        try:
+            DocsBuilder(source_dir, build_dir, cache_dir=self.cache_dir).build()
+            manifest = BuildManifest.read(build_dir)
+            self.assertEqual(manifest.dependencies, {'fragments.py': [], 'model.py': ['fragments.py'], 'other.py': []})
+            self.assertEqual(sorted(manifest.file_hashes), ['fragments.py', 'model.py', 'other.py'])
+
+            with open(os.path.join(source_dir, 'fragments.py'), 'a') as source_file:
+                source_file.write("BASE_FIELDS['created'] = {'type': 'datetime'}\n")
+            sys.modules.pop('fragments')
+            with self.subTest('skipped sources stay invalidated'):
+                for _ in range(2):
+                    output = io.StringIO()
+                    with contextlib.redirect_stdout(output):
+                        builder = DocsBuilder(source_dir, build_dir, cache_dir=self.cache_dir)
+                        builder.build_from_cache()
+                    self.assertEqual(builder.invalidated_sources, {'fragments.py', 'model.py'})
+                    self.assertIn('model.py skipped: cache entry is out of date', output.getvalue())
+                    self.assertEqual(builder.metrics.counters['files_cached'], 1)
+                    self.assertEqual(BuildManifest.read(build_dir).dependencies['model.py'], ['fragments.py'])
+            builder = DocsBuilder(source_dir, build_dir, cache_dir=self.cache_dir)
+            self.assertEqual(builder.invalidated_sources, {'fragments.py', 'model.py'})
+            builder.build()
+            self.assertEqual(builder.metrics.counters['files_cached'], 1)
+            with open(os.path.join(build_dir, 'Model_cerberus_doc.md')) as document:
+                self.assertIn('`created`', document.read())
+
+            with self.subTest('unchanged fragments keep the cache'):
+                builder = DocsBuilder(source_dir, build_dir, cache_dir=self.cache_dir)
+                builder.build()
+                self.assertEqual(builder.invalidated_sources, set())
+                self.assertEqual(builder.metrics.counters['files_cached'], 3)
+                self.assertEqual(BuildManifest.read(build_dir).dependencies['model.py'], ['fragments.py'])
+        finally:
+            sys.path.remove(source_dir)
+            sys.modules.pop('fragments', None)
+
+    def test_build_dependencies_without_manifest(self) -> None:
+        source_dir = os.path.join(self.test_folder_path, 'source')
+        os.mkdir(source_dir)
+        sources = {
+            'fragments.py': "BASE_FIELDS = {'id': {'type': 'integer'}}\n",
+            'model.py': (
+                'from fragments import BASE_FIELDS\n'
+                'from cerberus_docs import CerberusSchema\n\n\n'
+                'class Model:\n'
+                "    schema = CerberusSchema({**BASE_FIELDS, 'name': {'type': 'string'}})\n"
+            ),
+        }
+        for file_name, source in sources.items():
+            with open(os.path.join(source_dir, file_name), 'w') as source_file:
+                source_file.write(source)
+        sys.path.insert(0, source_dir)
+        try:
+            for build in range(3):
+                build_dir = os.path.join(self.test_folder_path, f'build{build}')
+                os.mkdir(build_dir)
+                archive_path = os.path.join(self.test_folder_path, f'docs{build}.zip')
+                DocsBuilder(source_dir, build_dir, cache_dir=self.cache_dir, archive=archive_path).build()
+                with open(os.path.join(source_dir, 'fragments.py'), 'a') as source_file:
+                    source_file.write(f"BASE_FIELDS['field{build}'] = {{'type': 'string'}}\n")
+                sys.modules.pop('fragments')
+            with self.subTest('archive'):
+                with zipfile.ZipFile(archive_path) as archive:
+                    self.assertIn('`field1`', archive.read('Model_cerberus_doc.md').decode())
+            with self.subTest('fresh build directory'):
+                build_dir = os.path.join(self.test_folder_path, 'fresh')
+                os.mkdir(build_dir)
+                builder = DocsBuilder(source_dir, build_dir, cache_dir=self.cache_dir)
+                builder.build()
+                self.assertEqual(builder.metrics.counters['files_cached'], 0)
+                with open(os.path.join(build_dir, 'Model_cerberus_doc.md')) as document:
+                    self.assertIn('`field2`', document.read())
+            with self.subTest('unchanged fragments keep the cache'):
+                builder = DocsBuilder(source_dir, build_dir, cache_dir=self.cache_dir, archive=archive_path)
+                builder.build()
+                self.assertEqual(builder.metrics.counters['files_cached'], 2)
+        finally:
+            sys.path.remove(source_dir)
+            sys.modules.pop('fragments', None)
+
+    def test_build_index(self) -> None:
+        source_dir = os.path.join(self.test_folder_path, 'source')
+        build_dir = os.path.join(self.test_folder_path, 'build')
+        for package in ('app', 'worker'):
+            os.makedirs(os.path.join(source_dir, package))
+            with open(os.path.join(source_dir, package, 'config.py'), 'w') as source_file:
+                source_file.write(
+                    'from cerberus_docs import CerberusSchema\n\n\n'
+                    'class Config:\n'
+                    f"    schema = CerberusSchema({{'{package}': {{'type': 'string'}}}})\n"
+                )
+        os.mkdir(build_dir)
+        builder = DocsBuilder(source_dir, build_dir, index=True)
+        builder.build()
+        for package in ('app', 'worker'):
+            with open(os.path.join(build_dir, f'{package}.config.Config_cerberus_doc.md')) as document:
+                self.assertIn(f'`{package}`', document.read())
+        with open(os.path.join(build_dir, 'index.md')) as index_page:
+            self.assertIn('- [Config](worker.config.Config_cerberus_doc.md#config)\n', index_page.read())
+        self.assertEqual(builder.link_index.rendered_sections, 2)
+
+        with self.subTest('index is updated incrementally'):
+            builder = DocsBuilder(source_dir, build_dir, index=True)
+            builder.build()
+            self.assertEqual(builder.link_index.rendered_sections, 0)
+
+        with self.subTest('classes with the same name fail without an index'):
+            builder = DocsBuilder(source_dir, build_dir)
+            with mock.patch('builtins.print') as print_mock:
+                builder.build()
+            (built_source,) = builder.manifest.sources
+            failed_package = 'worker' if built_source.startswith('app') else 'app'
+            print_mock.assert_called_once_with(
+                f'{os.path.join(source_dir, failed_package, "config.py")} failed: Config_cerberus_doc.md is already '
+                f'generated by {built_source}, build with --index to name the documents of both after their module'
+            )
+            with open(os.path.join(build_dir, 'Config_cerberus_doc.md')) as document:
+                self.assertNotIn(f'`{failed_package}`', document.read())
+            builder = DocsBuilder(source_dir, build_dir)
+            with mock.patch('builtins.print') as print_mock:
+                builder.build_pipelined()
+            self.assertEqual(len(builder.manifest.sources), 1)
+            self.assertIn('build with --index', print_mock.call_args[0][0])
+
+        with self.subTest('snapshot keeps classes with the same name'):
+            DocsBuilder(source_dir, build_dir, snapshot=True, index=True).build()
+            snapshot = SchemaSnapshot.read(build_dir)
+            self.assertEqual(sorted(snapshot.hashes), ['app.config.Config', 'worker.config.Config'])
+            self.assertEqual(snapshot.schemas('worker.config.Config'), [{'worker': {'type': 'string'}}])
+
+        with self.subTest('cannot be combined with stream or shard'):
+            self.assertRaises(CerberusDocsException, DocsBuilder, source_dir, build_dir, stream=True, index=True)
+            self.assertRaises(CerberusDocsException, DocsBuilder, source_dir, build_dir, shard=(0, 2), index=True)
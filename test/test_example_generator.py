@@ -0,0 +1,206 @@
+import os
+import re
+import copy
+import datetime
+import unittest
+from unittest import mock
+
+from cerberus_docs import ExampleGenerator, CerberusDocsException
+from cerberus_docs.classes import example_generator
+from cerberus_docs.classes.types import Schema
+from cerberus_docs.utils.generator import extract_schemas
+from test.__mocks__.mock_schema import mock_schema
+
+MOCKS_DIR = os.path.join(os.path.dirname(__file__), '__mocks__')
+
+try:
+    import cerberus
+except ImportError:  # pragma: no cover
+    cerberus = None
+
+
+class TestExampleGenerator(unittest.TestCase):
+    def setUp(self) -> None:
+        self.generator = ExampleGenerator()
+
+    def test_value(self) -> None:
+        with self.subTest('type defaults'):
+            self.assertEqual(self.generator.value({'type': 'string'}), 'str')
+            self.assertEqual(self.generator.value({'type': 'integer'}), 12345)
+            self.assertEqual(self.generator.value({'type': 'date'}), '2022-01-01')
+        with self.subTest('default and allowed'):
+            self.assertEqual(self.generator.value({'type': 'string', 'default': 'value'}), 'value')
+            self.assertEqual(self.generator.value({'type': 'string', 'allowed': ['a', 'b']}), 'a')
+        with self.subTest('nullable'):
+            self.assertIsNone(self.generator.value({'nullable': True}))
+            self.assertIsNone(self.generator.value({'type': 'unsupported', 'nullable': True}))
+            self.assertEqual(self.generator.value({'type': 'string', 'nullable': True}), 'str')
+            self.assertEqual(self.generator.value({'type': 'string', 'nullable': True, 'minlength': 5}), 'strst')
+            self.assertEqual(self.generator.value({'type': 'integer', 'nullable': True, 'min': 18, 'max': 99}), 99)
+            self.assertEqual(self.generator.value({'type': 'date', 'nullable': True}), '2022-01-01')
+            self.assertRegex(
+                self.generator.value({'type': 'string', 'nullable': True, 'regex': '[a-z]{3}'}), '^[a-z]{3}$'
+            )
+            self.assertEqual(self.generator.value({'type': 'string', 'nullable': True, 'default': 'value'}), 'value')
+        with self.subTest('unsupported type'):
+            self.assertRaises(CerberusDocsException, self.generator.value, {'type': 'unsupported'})
+            self.assertRaises(CerberusDocsException, self.generator.value, {})
+
+    def test_value_constraints(self) -> None:
+        self.assertEqual(self.generator.value({'type': 'integer', 'max': 10}), 10)
+        self.assertEqual(self.generator.value({'type': 'integer', 'min': 20000}), 20000)
+        self.assertEqual(self.generator.value({'type': 'integer', 'min': 1, 'max': 99999}), 12345)
+        self.assertEqual(self.generator.value({'type': 'float', 'min': 0, 'max': 1}), 1)
+        self.assertEqual(self.generator.value({'type': 'string', 'minlength': 7}), 'strstrs')
+        self.assertEqual(self.generator.value({'type': 'string', 'maxlength': 2}), 'st')
+        with self.subTest('integer with float bounds'):
+            self.assertEqual(self.generator.value({'type': 'integer', 'min': 0.5, 'max': 9.5}), 9)
+            self.assertEqual(self.generator.value({'type': 'integer', 'min': 20000.5}), 20001)
+            self.assertIsInstance(self.generator.value({'type': 'integer', 'max': 9.5}), int)
+        with self.subTest('float with integer bounds'):
+            self.assertIsInstance(self.generator.value({'type': 'float', 'max': 1}), float)
+
+    def test_value_range_constraints(self) -> None:
+        self.assertEqual(self.generator.value({'type': 'string', 'min': 'x'}), 'x')
+        self.assertEqual(self.generator.value({'type': 'string', 'max': 'abc'}), 'abc')
+        self.assertEqual(self.generator.value({'type': 'string', 'min': 'a', 'max': 'z'}), 'str')
+        self.assertEqual(self.generator.value({'type': 'date', 'min': datetime.date(2023, 5, 1)}), '2023-05-01')
+        self.assertEqual(self.generator.value({'type': 'date', 'max': datetime.date(2021, 1, 1)}), '2021-01-01')
+        self.assertEqual(self.generator.value({'type': 'datetime', 'min': datetime.date(2021, 1, 1)}),
+                         '2022-01-01T00:00:00')
+        self.assertEqual(self.generator.value({'type': 'datetime', 'min': datetime.date(2023, 1, 1)}),
+                         '2023-01-01T00:00:00')
+        self.assertEqual(self.generator.value({'type': 'date', 'max': datetime.datetime(2021, 1, 1, 12)}),
+                         '2021-01-01')
+
+    def test_regex_constraints(self) -> None:
+        attributes = [
+            {'type': 'string', 'regex': '[a-z]+', 'minlength': 8},
+            {'type': 'string', 'regex': '[a-z]+', 'minlength': 20, 'maxlength': 24},
+            {'type': 'string', 'regex': r'[A-Z]{2}\d{1,10}', 'maxlength': 4},
+            {'type': 'string', 'regex': r'\d{3,8}', 'minlength': 6, 'maxlength': 6},
+            {'type': 'string', 'regex': '[a-z]{3}', 'min': 'x'},
+            {'regex': '(foo|bar)[0-9]*', 'min': 'c', 'minlength': 5},
+        ]
+        for attribute in attributes:
+            with self.subTest(attribute):
+                value = self.generator.value(attribute)
+                self.assertIsNotNone(re.fullmatch(attribute['regex'], value))
+                self.assertGreaterEqual(len(value), attribute.get('minlength', 0))
+                self.assertLessEqual(len(value), attribute.get('maxlength', len(value)))
+                self.assertGreaterEqual(value, attribute.get('min', ''))
+                self.assertEqual(ExampleGenerator().value(attribute), value)
+        with self.subTest('unconstrained samples are unchanged'):
+            self.assertEqual(self.generator.value({'type': 'string', 'regex': '[a-z]+'}),
+                             self.generator.sample_regex('[a-z]+'))
+        with self.subTest('unsatisfiable constraints keep a matching sample'):
+            value = self.generator.value({'type': 'string', 'regex': '[a-z]{3}', 'maxlength': 2})
+            self.assertIsNotNone(re.fullmatch('[a-z]{3}', value))
+
+    def test_sample_regex(self) -> None:
+        regexes = [
+            r'^[A-Z]{2}-\d+$',
+            r'(foo|bar)+baz?',
+            r'[^abc]{3,5}',
+            r'\S+@\S+\.com',
+            r'(?P<x>a|b)(?P=x)',
+            r'[a-f0-9]{8}-[a-f0-9]{4}',
+        ]
+        for regex in regexes:
+            with self.subTest(regex):
+                sample = self.generator.sample_regex(regex)
+                self.assertIsNotNone(re.fullmatch(regex, sample))
+                self.assertEqual(ExampleGenerator().sample_regex(regex), sample)
+        with self.subTest('used for string attributes'):
+            value = self.generator.value({'type': 'string', 'regex': r'[0-9]{4}'})
+            self.assertIsNotNone(re.fullmatch(r'[0-9]{4}', value))
+
+    def test_regex_parsed_once(self) -> None:
+        re.compile('[a-z]+')  # keep the compilation of the re module out of the count
+        parse = mock.Mock(wraps=example_generator.sre_parse.parse)
+        with mock.patch.object(example_generator.sre_parse, 'parse', parse):
+            for _ in range(3):
+                self.generator.value({'type': 'string', 'regex': '[a-z]+'})
+                ExampleGenerator(seed=1)._regex_sampler('[a-z]+')
+        self.assertEqual(parse.call_count, 4)
+
+    def test_example(self) -> None:
+        with self.subTest('same as before for unconstrained schemas'):
+            self.assertEqual(self.generator.example(copy.deepcopy(mock_schema)), {
+                'test1': 'v0',
+                'test2': 'str',
+                'test3': {},
+                'test4': {'test5': [{'test6': 'str', 'test7': 'str'}]},
+            })
+        with self.subTest('list minlength'):
+            schema: Schema = {'items': {'type': 'list', 'minlength': 2, 'schema': {
+                'type': 'dict', 'schema': {'name': {'type': 'string'}}
+            }}}
+            example = self.generator.example(schema)
+            self.assertEqual(example, {'items': [{'name': 'str'}, {'name': 'str'}]})
+            self.assertIsNot(example['items'][0], example['items'][1])
+        with self.subTest('lists of values and dicts without a schema'):
+            schema = {
+                'tags': {'type': 'list', 'minlength': 2, 'schema': {'type': 'string'}},
+                'matrix': {'type': 'list', 'schema': {'type': 'list', 'schema': {'type': 'integer'}}},
+                'any': {'type': 'list'},
+                'extra': {'type': 'dict'},
+                'created': {'type': 'datetime'},
+            }
+            self.assertEqual(self.generator.example(schema), {
+                'tags': ['str', 'str'],
+                'matrix': [[12345]],
+                'any': [],
+                'extra': {},
+                'created': '2022-01-01T00:00:00',
+            })
+
+    @unittest.skipIf(cerberus is None, 'cerberus is not installed')
+    def test_validate(self) -> None:
+        generator = ExampleGenerator(validate=True)
+        schema: Schema = {
+            'code': {'type': 'string', 'required': True, 'regex': r'[A-Z]{3}-\d{2,4}'},
+            'count': {'type': 'integer', 'min': 1, 'max': 100},
+            'name': {'type': 'string', 'minlength': 5, 'maxlength': 8},
+            'tags': {'type': 'list', 'minlength': 2, 'schema': {'type': 'dict', 'schema': {
+                'label': {'type': 'string', 'allowed': ['x', 'y']},
+            }}},
+        }
+        with self.subTest('valid example'):
+            generator.example(schema)
+        with self.subTest('validator is reused per schema'):
+            with mock.patch('cerberus.Validator', wraps=cerberus.Validator) as validator:
+                generator.example(schema)
+                generator.example(schema)
+                validator.assert_not_called()
+        with self.subTest('dates, lists of values and dicts without a schema'):
+            generator.example({
+                'created': {'type': 'datetime', 'min': datetime.date(2021, 1, 1)},
+                'day': {'type': 'date', 'nullable': True},
+                'tags': {'type': 'list', 'schema': {'type': 'string', 'minlength': 4}},
+                'extra': {'type': 'dict', 'valuesrules': {'type': 'string'}},
+                'count': {'type': 'integer', 'min': 0.5, 'max': 9.5},
+            })
+        with self.subTest('validators are kept for the last schemas'):
+            schemas = [{'name': {'type': 'string'}} for _ in range(example_generator.VALIDATOR_CACHE_SIZE + 1)]
+            for schema in schemas:
+                generator.example(schema)
+            self.assertEqual(len(generator._local.validators), example_generator.VALIDATOR_CACHE_SIZE)
+            self.assertNotIn(id(schemas[0]), generator._local.validators)
+        with self.subTest('invalid example'):
+            invalid_schema: Schema = {'any': {'type': 'string', 'minlength': 2, 'allowed': ['a']}}
+            self.assertRaises(CerberusDocsException, generator.example, invalid_schema)
+
+    @unittest.skipIf(cerberus is None, 'cerberus is not installed')
+    def test_validate_test_schemas(self) -> None:
+        generator = ExampleGenerator(validate=True)
+        schemas = [mock_schema]
+        for root, _, file_names in os.walk(MOCKS_DIR):
+            for file_name in sorted(file_names):
+                if file_name.endswith('.py'):
+                    schema_map = extract_schemas(file_name[:-3], os.path.join(root, file_name))
+                    schemas.extend(schema for class_schemas in schema_map.values() for schema in class_schemas)
+        self.assertGreater(len(schemas), 1)
+        for schema in schemas:
+            with self.subTest(schema=schema):
+                generator.example(copy.deepcopy(schema))
@@ -0,0 +1,69 @@
+import copy
+import json
+import pickle
+import unittest
+
+from cerberus_docs.classes.frozen_schema import FrozenDict, FrozenList, freeze, thaw
+from test.__mocks__.mock_schema import mock_schema
+
+try:
+    import cerberus
+except ImportError:  # pragma: no cover
+    cerberus = None
+
+
+class TestFrozenSchema(unittest.TestCase):
+    def setUp(self) -> None:
+        self.schema = freeze(mock_schema)
+
+    def test_freeze(self) -> None:
+        self.assertIsInstance(self.schema, FrozenDict)
+        self.assertIsInstance(self.schema['test1']['allowed'], FrozenList)
+        self.assertIsInstance(self.schema['test4']['schema']['test5'], FrozenDict)
+        self.assertEqual(self.schema, mock_schema)
+        self.assertIs(freeze(self.schema), self.schema)
+        self.assertEqual(freeze({'values': {1, 2}}), {'values': frozenset({1, 2})})
+        address = {'street': {'type': 'string'}}
+        shared = freeze({
+            'billing': {'type': 'dict', 'schema': address},
+            'shipping': {'type': 'dict', 'schema': address},
+        })
+        self.assertIs(shared['billing']['schema'], shared['shipping']['schema'])
+
+    def test_immutable(self) -> None:
+        for mutate in (
+            lambda: self.schema.__setitem__('name', {}),
+            lambda: self.schema.pop('test1'),
+            lambda: self.schema.update({}),
+            lambda: self.schema['test1']['allowed'].append('value'),
+            lambda: self.schema['test4']['schema'].clear(),
+        ):
+            with self.assertRaises(TypeError):
+                mutate()
+
+    def test_copies(self) -> None:
+        self.assertIs(copy.deepcopy(self.schema), self.schema)
+        unpickled = pickle.loads(pickle.dumps(self.schema))
+        self.assertIsInstance(unpickled['test4']['schema'], FrozenDict)
+        self.assertEqual(unpickled, self.schema)
+        self.assertEqual(json.loads(json.dumps(self.schema)), json.loads(json.dumps(mock_schema)))
+        thawed = thaw(self.schema)
+        self.assertIs(type(thawed['test4']['schema']), dict)
+        self.assertIs(type(thawed['test1']['allowed']), list)
+        self.assertEqual(thawed, mock_schema)
+
+    def test_derived(self) -> None:
+        calls = []
+
+        def compute() -> int:
+            calls.append(1)
+            return len(calls)
+        self.assertEqual(self.schema.derived('key', compute), 1)
+        self.assertEqual(self.schema.derived('key', compute), 1)
+        self.assertEqual(self.schema.derived('other', compute), 2)
+
+    @unittest.skipIf(cerberus is None, 'cerberus is not installed')
+    def test_validator(self) -> None:
+        validator = cerberus.Validator(self.schema)
+        self.assertFalse(validator.validate({'test1': 'unknown'}))
+        self.assertIn('test1', validator.errors)
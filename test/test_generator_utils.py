@@ -1,11 +1,23 @@
+import gc
 import os
+import sys
+import copy
+import weakref
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 import shutil
 import unittest
 from pathlib import Path
 from types import ModuleType
 
-from cerberus_docs import import_module, extract_schemas, generate_docs
+from cerberus_docs import (
+    import_module, extract_schemas, extract_schemas_by_name, generate_docs, render_document, AllowedAppendix,
+    ExampleGenerator
+)
+from cerberus_docs.utils.generator import render_docs, iter_package_modules
+from cerberus_docs.classes.schema_stats import SchemaStats
 from cerberus_docs.classes.types import SchemaMap
+from test.__mocks__.mock_schema import mock_schema
 
 
 class TestGeneratorUtils(unittest.TestCase):
@@ -31,6 +43,63 @@ class TestGeneratorUtils(unittest.TestCase):
         self.assertEqual(len(schema_map['MockFileChild']), 1)
         self.assertEqual(len(schema_map.keys()), 2)
 
+    def test_extract_schemas_by_name(self) -> None:
+        module_name = 'test.__mocks__.mock_folder_1.mock_file_1'
+        with self.subTest('imports the module by name'):
+            schema_map: SchemaMap = extract_schemas_by_name(module_name)
+            self.assertEqual(sorted(schema_map), ['MockFileChild', 'MockFileParent'])
+        with self.subTest('reuses imported modules'):
+            module = sys.modules[module_name]
+            extract_schemas_by_name(module_name)
+            self.assertIs(sys.modules[module_name], module)
+        with self.subTest('skips imported classes'):
+            self.assertEqual(extract_schemas_by_name('test.__mocks__.mock_folder_1'), {})
+
+    def test_iter_package_modules(self) -> None:
+        with self.subTest('package'):
+            module_names = list(iter_package_modules('test.__mocks__'))
+            self.assertEqual(module_names[0], 'test.__mocks__')
+            self.assertIn('test.__mocks__.mock_folder_1.mock_file_1', module_names)
+            self.assertIn('test.__mocks__.mock_folder_2.mock_file_2', module_names)
+        with self.subTest('module'):
+            self.assertEqual(list(iter_package_modules('test.__mocks__.mock_schema')), ['test.__mocks__.mock_schema'])
+        with self.subTest('zipped package'):
+            zip_path = os.path.join(self.test_folder_path, 'zipped.zip')
+            with zipfile.ZipFile(zip_path, 'w') as zip_file:
+                zip_file.writestr('zipped_package/__init__.py', '')
+                zip_file.writestr(
+                    'zipped_package/models.py',
+                    'from cerberus_docs import CerberusSchema\n\n\n'
+                    'class Zipped:\n    schema = CerberusSchema({"name": {"type": "string"}})\n'
+                )
+            sys.path.insert(0, zip_path)
+            try:
+                module_names = list(iter_package_modules('zipped_package'))
+                self.assertEqual(module_names, ['zipped_package', 'zipped_package.models'])
+                self.assertEqual(list(extract_schemas_by_name('zipped_package.models')), ['Zipped'])
+            finally:
+                sys.path.remove(zip_path)
+                sys.modules.pop('zipped_package.models', None)
+                sys.modules.pop('zipped_package', None)
+        with self.subTest('broken subpackage'):
+            package_dir = os.path.join(self.test_folder_path, 'broken_package')
+            os.makedirs(os.path.join(package_dir, 'broken'))
+            modules = (('__init__.py', ''), ('models.py', ''), ('broken/__init__.py', 'raise ValueError()\n'),
+                       ('broken/models.py', ''))
+            for module, source in modules:
+                with open(os.path.join(package_dir, module), 'w') as module_file:
+                    module_file.write(source)
+            sys.path.insert(0, self.test_folder_path)
+            try:
+                errors = {}
+                module_names = list(iter_package_modules('broken_package', errors))
+                self.assertEqual(module_names, ['broken_package', 'broken_package.models'])
+                self.assertEqual(list(errors), ['broken_package.broken'])
+                self.assertIsInstance(errors['broken_package.broken'], ValueError)
+            finally:
+                sys.path.remove(self.test_folder_path)
+                sys.modules.pop('broken_package', None)
+
     def test_import_module(self) -> None:
         module = import_module(self.file_name, self.file_path)
         self.assertTrue(isinstance(module, ModuleType))
@@ -53,3 +122,88 @@ class TestGeneratorUtils(unittest.TestCase):
 
         with open(child_file_path, 'r') as child_file:
             self.assertEqual(child_file.read(), '\n## MockFileChild\n\n`name`: string, \n\n\n## Example Schema Input\n\n```\nname: str\n```\n')  # noqa: E501
+
+    def test_generate_docs_stream(self) -> None:
+        schema_map: SchemaMap = {'MockClass': [copy.deepcopy(mock_schema), {'name': {'type': 'string'}}]}
+        stream_dir = os.path.join(self.test_folder_path, 'stream')
+        os.mkdir(stream_dir)
+        self.assertEqual(generate_docs(schema_map, self.test_folder_path), ['MockClass_cerberus_doc.md'])
+        self.assertEqual(generate_docs(schema_map, stream_dir, stream=True), ['MockClass_cerberus_doc.md'])
+        with open(os.path.join(self.test_folder_path, 'MockClass_cerberus_doc.md')) as file, \
+                open(os.path.join(stream_dir, 'MockClass_cerberus_doc.md')) as stream_file:
+            self.assertEqual(stream_file.read(), file.read())
+
+    def test_generate_docs_allowed_appendix(self) -> None:
+        countries = [f'C{i}' for i in range(100)]
+        schema_map: SchemaMap = {
+            'Address': [{'country': {'type': 'string', 'allowed': countries}}],
+            'Company': [{'country': {'type': 'string', 'allowed': list(countries)}}],
+        }
+        appendix_name = AllowedAppendix.document_name(countries)
+        expected = ['Address_cerberus_doc.md', appendix_name, 'Company_cerberus_doc.md']
+        stream_dir = os.path.join(self.test_folder_path, 'stream')
+        os.mkdir(stream_dir)
+        for build_dir, stream in [(self.test_folder_path, False), (stream_dir, True)]:
+            with self.subTest(stream=stream):
+                documents = generate_docs(schema_map, build_dir, stream=stream, allowed_appendix=AllowedAppendix(10))
+                self.assertEqual(documents, expected)
+                with open(os.path.join(build_dir, 'Company_cerberus_doc.md')) as file:
+                    self.assertIn(f'one of 100 [allowed values]({appendix_name})', file.read())
+                with open(os.path.join(build_dir, appendix_name)) as file:
+                    self.assertEqual(file.read(), AllowedAppendix.render(countries))
+        with self.subTest('render_docs'):
+            rendered = dict(render_docs(schema_map, allowed_appendix=AllowedAppendix(10)))
+            self.assertEqual(list(rendered), expected)
+            self.assertEqual(rendered[appendix_name], AllowedAppendix.render(countries))
+
+    def test_render_document(self) -> None:
+        schemas = [copy.deepcopy(mock_schema), {'name': {'type': 'string'}}]
+        generate_docs({'MockClass': schemas}, self.test_folder_path)
+        with open(os.path.join(self.test_folder_path, 'MockClass_cerberus_doc.md')) as file:
+            self.assertEqual(render_document('MockClass', schemas), file.read())
+
+    def test_render_document_options(self) -> None:
+        class UnhashableGenerator(ExampleGenerator):
+            __hash__ = None
+
+        schemas = [{'name': {'type': 'string', 'allowed': ['a', 'b']}}]
+        self.assertEqual(
+            render_document('Foo', schemas, example_generator=UnhashableGenerator()), render_document('Foo', schemas)
+        )
+        stats = SchemaStats()
+        stats_ref = weakref.ref(stats)
+        render_document('Foo', schemas, stats=stats)
+        self.assertEqual(len(stats.counters), 1)
+        del stats
+        gc.collect()
+        self.assertIsNone(stats_ref())
+
+    def test_render_document_concurrently(self) -> None:
+        classes = {
+            f'Class{i}': [{
+                'code': {'type': 'string', 'required': True, 'regex': f'[A-Z]{{{i % 5 + 1}}}-[0-9]{{2,4}}'},
+                'count': {'type': 'integer', 'min': i, 'max': 100 + i},
+                'kind': {'type': 'string', 'allowed': [f'kind{j}' for j in range(i % 7 + 1)]},
+                'items': {'type': 'list', 'minlength': i % 3 + 1, 'schema': {'type': 'dict', 'schema': {
+                    'label': {'type': 'string', 'minlength': i % 4 + 1, 'meta': {'description': f'Label {i}'}},
+                }}},
+            }]
+            for i in range(200)
+        }
+        example_generator = ExampleGenerator(seed=1)
+        expected = {
+            class_name: render_document(class_name, schemas, example_generator=ExampleGenerator(seed=1))
+            for class_name, schemas in classes.items()
+        }
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                for _ in range(3):
+                    rendered = executor.map(
+                        lambda item: (item[0], render_document(*item, example_generator=example_generator)),
+                        classes.items()
+                    )
+                    self.assertEqual(dict(rendered), expected)
+        finally:
+            sys.setswitchinterval(switch_interval)
@@ -0,0 +1,184 @@
+import os
+import sys
+import shutil
+import unittest
+
+from cerberus_docs import extract_schemas
+from cerberus_docs.utils.import_stubs import Stub, StubFinder, StubModule, contains_stubs, stubbed_imports
+from cerberus_docs.utils.memory import evicting_modules
+
+
+class TestImportStubsUtils(unittest.TestCase):
+    def setUp(self) -> None:
+        self.current_dir = os.path.dirname(os.path.realpath(__file__))
+        self.test_folder_path = os.path.join(self.current_dir, 'test_dir')
+        os.mkdir(self.test_folder_path)
+        os.mkdir(os.path.join(self.test_folder_path, 'heavy_package'))
+        with open(os.path.join(self.test_folder_path, 'heavy_package', '__init__.py'), 'w') as package_file:
+            package_file.write(
+                'import enum\n\n'
+                "VALUES = ['a', 'b']\n"
+                'FEATURE = False\n\n\n'
+                'class Colors(enum.Enum):\n'
+                "    RED = 'red'\n"
+                "    BLUE = 'blue'\n"
+            )
+        sys.path.insert(0, self.test_folder_path)
+
+    def tearDown(self) -> None:
+        sys.path.remove(self.test_folder_path)
+        sys.modules.pop('heavy_package', None)
+        shutil.rmtree(self.test_folder_path)
+
+    def _write_module(self, source: str) -> str:
+        file_path = os.path.join(self.test_folder_path, 'stubbed_schemas.py')
+        with open(file_path, 'w') as module_file:
+            module_file.write(source)
+        return file_path
+
+    def test_stub(self) -> None:
+        stub = Stub('orm')
+        self.assertIsInstance(stub.declarative_base(), Stub)
+        self.assertIsInstance(stub.Mapped[int] | None, Stub)
+        self.assertEqual(list(stub), [])
+        self.assertEqual(repr(stub.Column), '<stub orm.Column>')
+
+        @stub.register
+        class Model(stub.Base):
+            pass
+        self.assertTrue(isinstance(Model, type))
+        self.assertEqual(Model.__bases__, (object,))
+
+    def test_stub_taints_finder(self) -> None:
+        for convert in (list, str, repr, lambda stub: f'{stub}', lambda stub: '%s' % stub, bool, len, int, float,
+                        hash, lambda stub: stub == 'red', lambda stub: stub != 'red', lambda stub: [0][stub]):
+            finder = StubFinder(['heavy_package'])
+            stub = StubModule('heavy_package', finder).Colors.RED
+            self.assertFalse(finder.tainted)
+            convert(stub)
+            self.assertTrue(finder.tainted)
+
+    def test_stubbed_imports(self) -> None:
+        with evicting_modules(), stubbed_imports(['heavy_package', 'not_installed']):
+            import heavy_package
+            from not_installed.orm import Session
+            self.assertIsInstance(heavy_package, StubModule)
+            self.assertIsInstance(Session, Stub)
+            self.assertIsInstance(sys.modules['not_installed.orm'], StubModule)
+            import json
+            self.assertNotIsInstance(json, StubModule)
+        self.assertNotIn('heavy_package', sys.modules)
+        self.assertNotIn('not_installed', sys.modules)
+        self.assertFalse(any(isinstance(finder, StubFinder) for finder in sys.meta_path))
+
+    def test_is_stubbed(self) -> None:
+        finder = StubFinder()
+        self.assertTrue(finder._is_third_party('yaml'))
+        self.assertFalse(finder.is_stubbed('cerberus'))
+        self.assertFalse(finder.is_stubbed('cerberus_docs.utils'))
+        self.assertFalse(finder.is_stubbed('json'))
+        self.assertFalse(finder.is_stubbed('heavy_package'))
+        self.assertTrue(StubFinder(['heavy_package']).is_stubbed('heavy_package.orm'))
+
+    def test_contains_stubs(self) -> None:
+        self.assertFalse(contains_stubs({'Foo': [{'name': {'type': 'string', 'allowed': ['a']}}]}))
+        self.assertTrue(contains_stubs({'Foo': [{'name': {'type': 'string', 'allowed': Stub('VALUES')}}]}))
+        self.assertTrue(contains_stubs([{'name': {'allowed': (1, Stub('x'))}}]))
+
+    def test_extract_schemas_stubbed(self) -> None:
+        file_path = self._write_module(
+            'import not_installed\n'
+            'from not_installed.orm import Base\n'
+            'from cerberus_docs import CerberusSchema\n\n\n'
+            'class Foo(Base):\n'
+            "    schema = CerberusSchema({'name': {'type': 'string'}})\n"
+        )
+        self.assertRaises(ImportError, extract_schemas, 'stubbed_schemas', file_path)
+        schema_map = extract_schemas('stubbed_schemas', file_path, stub_imports=['not_installed'])
+        self.assertEqual(schema_map, {'Foo': [{'name': {'type': 'string'}}]})
+        self.assertNotIn('not_installed', sys.modules)
+
+    def test_extract_schemas_stubbed_keeps_other_modules(self) -> None:
+        sys.modules.pop('colorsys', None)
+        sys.modules.pop('stubbed_schemas', None)
+        file_path = self._write_module(
+            'import colorsys\n'
+            'import heavy_package\n'
+            'from cerberus_docs import CerberusSchema\n\n\n'
+            'class Foo:\n'
+            "    schema = CerberusSchema({'name': {'type': 'string'}})\n"
+        )
+        schema_map = extract_schemas('stubbed_schemas', file_path, stub_imports=['heavy_package'])
+        self.assertEqual(schema_map, {'Foo': [{'name': {'type': 'string'}}]})
+        self.assertIn('colorsys', sys.modules)
+        self.assertNotIn('heavy_package', sys.modules)
+        self.assertNotIn('stubbed_schemas', sys.modules)
+
+    def test_extract_schemas_retries_with_real_imports(self) -> None:
+        file_path = self._write_module(
+            'import heavy_package\n'
+            'from cerberus_docs import CerberusSchema\n\n\n'
+            'class Foo:\n'
+            "    schema = CerberusSchema({'name': {'type': 'string', 'allowed': heavy_package.VALUES}})\n"
+        )
+        schema_map = extract_schemas('stubbed_schemas', file_path, stub_imports=['heavy_package'])
+        self.assertEqual(schema_map, {'Foo': [{'name': {'type': 'string', 'allowed': ['a', 'b']}}]})
+        self.assertNotIsInstance(sys.modules['heavy_package'], StubModule)
+
+        with self.subTest('enum member default'):
+            file_path = self._write_module(
+                'from heavy_package import Colors\n'
+                'from cerberus_docs import CerberusSchema\n\n\n'
+                'class Foo:\n'
+                "    schema = CerberusSchema({'color': {'type': 'string', 'default': str(Colors.RED.value),\n"
+                "                                       'meta': {'description': f'e.g. {Colors.BLUE.value}'}}})\n"
+            )
+            schema_map = extract_schemas('stubbed_schemas', file_path, stub_imports=['heavy_package'])
+            self.assertEqual(schema_map, {'Foo': [{'color': {
+                'type': 'string', 'default': 'red', 'meta': {'description': 'e.g. blue'}
+            }}]})
+
+        with self.subTest('iterated stub'):
+            file_path = self._write_module(
+                'from heavy_package import Colors\n'
+                'from cerberus_docs import CerberusSchema\n\n\n'
+                'class Foo:\n'
+                "    schema = CerberusSchema({'color': {'type': 'string', 'allowed': [c.value for c in Colors]}})\n"
+            )
+            schema_map = extract_schemas('stubbed_schemas', file_path, stub_imports=['heavy_package'])
+            self.assertEqual(schema_map, {'Foo': [{'color': {'type': 'string', 'allowed': ['red', 'blue']}}]})
+
+        with self.subTest('fails with stubs'):
+            file_path = self._write_module('from heavy_package import VALUES\nassert isinstance(VALUES, list)\n')
+            self.assertEqual(extract_schemas('stubbed_schemas', file_path, stub_imports=['heavy_package']), {})
+
+    def test_extract_schemas_retries_on_stub_branches(self) -> None:
+        with self.subTest('stub in a condition'):
+            sys.modules.pop('heavy_package', None)
+            file_path = self._write_module(
+                'import heavy_package\n'
+                'from cerberus_docs import CerberusSchema\n\n\n'
+                'class Foo:\n'
+                '    if heavy_package.FEATURE:\n'
+                "        schema = CerberusSchema({'name': {'type': 'integer'}})\n"
+                '    else:\n'
+                "        schema = CerberusSchema({'name': {'type': 'string'}})\n"
+            )
+            schema_map = extract_schemas('stubbed_schemas', file_path, stub_imports=['heavy_package'])
+            self.assertEqual(schema_map, {'Foo': [{'name': {'type': 'string'}}]})
+            self.assertNotIsInstance(sys.modules['heavy_package'], StubModule)
+
+        with self.subTest('stub in a comparison'):
+            sys.modules.pop('heavy_package', None)
+            file_path = self._write_module(
+                'from heavy_package import Colors\n'
+                'from cerberus_docs import CerberusSchema\n\n\n'
+                'class Foo:\n'
+                "    if Colors.RED.value == 'red':\n"
+                "        schema = CerberusSchema({'name': {'type': 'string'}})\n"
+                '    else:\n'
+                "        schema = CerberusSchema({'name': {'type': 'integer'}})\n"
+            )
+            schema_map = extract_schemas('stubbed_schemas', file_path, stub_imports=['heavy_package'])
+            self.assertEqual(schema_map, {'Foo': [{'name': {'type': 'string'}}]})
+            self.assertNotIsInstance(sys.modules['heavy_package'], StubModule)
@@ -0,0 +1,74 @@
+import os
+import shutil
+import unittest
+
+from cerberus_docs.classes.link_index import INDEX_DATA_FILE_NAME, LinkIndex, anchor, module_name, nested_sections
+from test.__mocks__.mock_schema import mock_schema
+
+
+class TestLinkIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.current_dir = os.path.dirname(os.path.realpath(__file__))
+        self.test_folder: str = 'test_dir'
+        self.test_folder_path = os.path.join(self.current_dir, self.test_folder)
+        os.mkdir(self.test_folder_path)
+        self.schema_maps = {
+            os.path.join('app', 'models.py'): {'Config': [mock_schema], 'User': [{'name': {'type': 'string'}}]},
+            os.path.join('worker', 'settings.py'): {'Config': [{'queue': {'type': 'string'}}]},
+        }
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.test_folder_path)
+
+    def test_helpers(self) -> None:
+        self.assertEqual(module_name(os.path.join('app', 'models.py')), 'app.models')
+        self.assertEqual(module_name('app.models'), 'app.models')
+        self.assertEqual(anchor('ConfigTest4'), 'configtest4')
+        self.assertEqual(anchor('Example Schema Input'), 'example-schema-input')
+        self.assertEqual(list(nested_sections('Config', mock_schema)), ['ConfigTest4', 'ConfigTest4Test5'])
+
+    def test_document_names(self) -> None:
+        index = LinkIndex()
+        index.add_sources(self.schema_maps)
+        self.assertEqual(index.document_names(os.path.join('app', 'models.py')), {
+            'Config': 'app.models.Config_cerberus_doc.md',
+            'User': 'User_cerberus_doc.md',
+        })
+        self.assertEqual(index.document_names(os.path.join('worker', 'settings.py')), {
+            'Config': 'worker.settings.Config_cerberus_doc.md',
+        })
+
+    def test_render(self) -> None:
+        index = LinkIndex()
+        index.add_sources(self.schema_maps)
+        self.assertEqual(index.render(), (
+            '# Schema index\n'
+            '\n## app.models\n\n'
+            '- [Config](app.models.Config_cerberus_doc.md#config)\n'
+            '  - [ConfigTest4](app.models.Config_cerberus_doc.md#configtest4)\n'
+            '  - [ConfigTest4Test5](app.models.Config_cerberus_doc.md#configtest4test5)\n'
+            '- [User](User_cerberus_doc.md#user)\n'
+            '\n## worker.settings\n\n'
+            '- [Config](worker.settings.Config_cerberus_doc.md#config)\n'
+        ))
+
+    def test_incremental(self) -> None:
+        index = LinkIndex()
+        index.add_sources(self.schema_maps)
+        self.assertEqual(index.rendered_sections, 2)
+        with open(os.path.join(self.test_folder_path, INDEX_DATA_FILE_NAME), 'w') as index_file:
+            index_file.write(index.to_json())
+
+        previous = LinkIndex.read(self.test_folder_path)
+        self.assertEqual(previous.sources, index.sources)
+        self.schema_maps[os.path.join('worker', 'settings.py')]['Job'] = [{'id': {'type': 'integer'}}]
+        updated = LinkIndex(previous)
+        updated.add_sources(self.schema_maps)
+        self.assertEqual(updated.rendered_sections, 1)
+        self.assertIn('- [Job](Job_cerberus_doc.md#job)\n', updated.render())
+
+        with self.subTest('missing or other version'):
+            self.assertIsNone(LinkIndex.read(os.path.join(self.test_folder_path, 'missing')))
+            with open(os.path.join(self.test_folder_path, INDEX_DATA_FILE_NAME), 'w') as index_file:
+                index_file.write('{"version": 0}')
+            self.assertIsNone(LinkIndex.read(self.test_folder_path))
@@ -1,11 +1,18 @@
+import io
 import os
 import copy
+import random
+import re
 import shutil
 import unittest
+import yaml
 from typing import List, Union, Any, Dict
 
-from cerberus_docs import MarkDownUtils, CerberusDocsException
-from cerberus_docs.classes.types import SortedAttribute, Attribute, Schema
+from cerberus_docs import MarkDownUtils, CerberusDocsException, AllowedAppendix
+from cerberus_docs.classes.compact_schema import CompactAttribute
+from cerberus_docs.classes.frozen_schema import freeze
+from cerberus_docs.classes.markdown_utils import anchor
+from cerberus_docs.classes.types import Attribute, Schema
 from test.__mocks__.mock_schema import mock_schema
 
 
@@ -29,16 +36,6 @@ class TestMarkDownUtils(unittest.TestCase):
     def tearDown(self) -> None:
         shutil.rmtree(self.test_folder_path)
 
-    def test_is_last_item(self) -> None:
-        iterator: List[int] = [1, 2, 3]
-        with self.subTest('is last'):
-            i: int = 2
-            self.assertTrue(self.md_utils._is_last_item(i, iterator))
-
-        with self.subTest('is not last'):
-            i: int = 1
-            self.assertFalse(self.md_utils._is_last_item(i, iterator))
-
     def test_append_to_content(self) -> None:
         self.md_utils._append_to_content('Hello ')
         self.md_utils._append_to_content('world!')
@@ -69,6 +66,14 @@ class TestMarkDownUtils(unittest.TestCase):
         with self.subTest('allowed_values is empty'):
             allowed_values: List[Union[str, int]] = []
             self.assertEqual(self.md_utils._generate_allowed(allowed_values), '')
+        with self.subTest('allowed_values above the appendix threshold'):
+            md_utils = MarkDownUtils(file_name='file', allowed_appendix=AllowedAppendix(threshold=2))
+            allowed_values: List[Union[str, int]] = ['1', '2', 3]
+            self.assertEqual(
+                md_utils._generate_allowed(allowed_values),
+                f'one of 3 [allowed values]({AllowedAppendix.document_name(allowed_values)})'
+            )
+            self.assertEqual(md_utils._generate_allowed(['1', '2']), 'one of;\n  - 1\n  - 2')
 
     def test_generate_regex(self) -> None:
         regex: str = '(?<=-)w+'
@@ -80,7 +85,7 @@ class TestMarkDownUtils(unittest.TestCase):
 
     def test_generate_schema(self) -> None:
         class_name: str = 'TestClass'
-        self.assertEqual(self.md_utils._generate_schema(class_name), f'[{class_name}](#{class_name})')
+        self.assertEqual(self.md_utils._generate_schema(class_name), f'[{class_name}](#{class_name.lower()})')
 
     def test_generate_description(self) -> None:
         with self.subTest('Description exists'):
@@ -94,36 +99,58 @@ class TestMarkDownUtils(unittest.TestCase):
             meta_object: Dict = {'label': 'This is a label'}
             self.assertIsNone(self.md_utils._generate_description(meta_object))
 
-    def test_sort_attribute_fields_order(self) -> None:
-        sorted_attribute: SortedAttribute = self.md_utils._sort_attribute_fields_order(self.attribute)
-        sorted_attribute_list = list(sorted_attribute.items())
-        for i, item in enumerate(sorted_attribute_list):
-            key = item[0]
-            self.assertEqual(self.md_utils.validation_rule_priority_list[i], key)
+    def test_format_attribute(self) -> None:
+        with self.subTest('rules in the order of the priority list'):
+            self.assertEqual(
+                self.md_utils._format_attribute(self.attribute, 'TestSchema'),
+                '**[required]** string, must match (?<=-)w+, defaults to {}, [TestSchema](#testschema) '
+                'one of;\n  - 1\n  - 2 \n\n'
+            )
+        with self.subTest('unknown rules are left out'):
+            self.assertEqual(
+                self.md_utils._format_attribute({'nullable': True, 'type': 'string'}, 'TestSchema'), 'string, \n\n'
+            )
+        with self.subTest('custom priority list'):
+            self.md_utils.validation_rule_priority_list = ['type', 'required']
+            self.assertEqual(
+                self.md_utils._format_attribute(self.attribute, 'TestSchema'), 'string, **[required]** \n\n'
+            )
+
+    def test_attribute_rules(self) -> None:
+        self.assertEqual(list(self.md_utils.attribute_rules({'nullable': True, **self.attribute})), [
+            ('required', True), ('type', 'string'), ('regex', '(?<=-)w+'), ('default', {}), ('schema', {}),
+            ('allowed', ['1', '2']),
+        ])
+        with self.subTest('compact attribute'):
+            attribute = CompactAttribute.from_attribute('name', {'nullable': True, **self.attribute})
+            self.assertEqual(list(self.md_utils.attribute_rules(attribute)),
+                             list(self.md_utils.attribute_rules(self.attribute)))
+
+    def test_nested_schema(self) -> None:
+        nested: Schema = {'name': {'type': 'string'}}
+        self.assertIs(self.md_utils.nested_schema({'type': 'dict', 'schema': nested}), nested)
+        self.assertIs(self.md_utils.nested_schema({'type': 'list', 'schema': {'type': 'dict', 'schema': nested}}),
+                      nested)
+        self.assertEqual(self.md_utils.nested_schema({'type': 'list', 'schema': {'type': 'string'}}),
+                         {'_': {'type': 'string'}})
+        self.assertIsNone(self.md_utils.nested_schema({'type': 'dict'}))
+        self.assertIsNone(self.md_utils.nested_schema({'type': 'string', 'schema': nested}))
 
-    def test_get_validation_rule_separator(self) -> None:
+    def test_rule_separator(self) -> None:
         with self.subTest('gets default separator'):
-            self.assertEqual(self.md_utils._get_validation_rule_separator('uknown_field'), ' ')
+            self.assertEqual(self.md_utils.rule_separator('uknown_field'), ' ')
 
         with self.subTest('gets separator'):
-            self.assertEqual(self.md_utils._get_validation_rule_separator('type'), ', ')
+            self.assertEqual(self.md_utils.rule_separator('type'), ', ')
 
-    def test_attribute_to_string(self) -> None:
-        attribute: Attribute = {
-            'required': '**[required]**',
-            'type': 'str',
-            'regex': 'must match (?<=-)w+',
-        }
-        self.assertEqual(self.md_utils._attribute_to_string(attribute), '**[required]** str, must match (?<=-)w+, \n\n')
-
-    def test_generate_schema_example_dict(self) -> None:
+    def test_example_dict(self) -> None:
         with self.subTest('successfully generated dict from schema'):
             schema: Schema = copy.deepcopy(mock_schema)
-            generated_dict = self.md_utils._generate_schema_example_dict(schema)
+            generated_dict = self.md_utils.example_dict(schema)
             expected_dict = {
                 'test1': 'v0',
                 'test2': 'str',
-                'test3': None,
+                'test3': {},
                 'test4': {
                     'test5': [
                         {
@@ -138,7 +165,7 @@ class TestMarkDownUtils(unittest.TestCase):
         with self.subTest('raises CerberusDocsException when type in schema is not supported'):
             schema = copy.deepcopy(mock_schema)
             schema['test2']['type'] = 'should raise exception'
-            self.assertRaises(CerberusDocsException, self.md_utils._generate_schema_example_dict, schema)
+            self.assertRaises(CerberusDocsException, self.md_utils.example_dict, schema)
 
     def test_generate_header(self) -> None:
         title: str = 'TestTitle'
@@ -192,9 +219,9 @@ class TestMarkDownUtils(unittest.TestCase):
             self.md_utils.generate_attributes('TestClass', schema)
             self.assertEqual(
                 self.md_utils.content,
-                '`test1`: **[required]** dict, [TestClassTest1](#TestClassTest1) \n\n'  # noqa: E501
+                '`test1`: **[required]** dict, [TestClassTest1](#testclasstest1) \n\n'  # noqa: E501
                 '\n## TestClassTest1\n\n'
-                '`test2`: **[required]** dict, [TestClassTest1Test2](#TestClassTest1Test2) \n\n'  # noqa: E501
+                '`test2`: **[required]** dict, [TestClassTest1Test2](#testclasstest1test2) \n\n'  # noqa: E501
                 '\n## TestClassTest1Test2\n\n'
                 '`test3`: **[required]** string, \n\n'  # noqa: E501
             )
@@ -226,9 +253,9 @@ class TestMarkDownUtils(unittest.TestCase):
             self.md_utils.generate_attributes('TestClass', schema)
             self.assertEqual(
                 self.md_utils.content,
-                '`test1`: **[required]** dict, [TestClassTest1](#TestClassTest1) \n\n'  # noqa: E501
+                '`test1`: **[required]** dict, [TestClassTest1](#testclasstest1) \n\n'  # noqa: E501
                 '\n## TestClassTest1\n\n'
-                '`test2`: **[required]** list, [TestClassTest1Test2](#TestClassTest1Test2) \n\n'  # noqa: E501
+                '`test2`: **[required]** list, [TestClassTest1Test2](#testclasstest1test2) \n\n'  # noqa: E501
                 '\n## TestClassTest1Test2\n\n'
                 '`test3`: **[required]** string, \n\n'  # noqa: E501
             )
@@ -254,9 +281,9 @@ class TestMarkDownUtils(unittest.TestCase):
             self.md_utils.generate_attributes('TestClass', schema)
             self.assertEqual(
                 self.md_utils.content,
-                '`test1`: **[required]** dict, [TestClassTest1](#TestClassTest1) \n\n'  # noqa: E501
+                '`test1`: **[required]** dict, [TestClassTest1](#testclasstest1) \n\n'  # noqa: E501
                 '\n## TestClassTest1\n\n'
-                '`test2`: **[required]** list, [TestClassTest1Test2](#TestClassTest1Test2) \n\n'  # noqa: E501
+                '`test2`: **[required]** list, [TestClassTest1Test2](#testclasstest1test2) \n\n'  # noqa: E501
                 '\n## TestClassTest1Test2\n\n'
                 '`_`: integer, \n\n'  # noqa: E501
             )
@@ -274,7 +301,7 @@ class TestMarkDownUtils(unittest.TestCase):
             '```\n'
             'test1: v0\n'
             'test2: str\n'
-            'test3: null\n'
+            'test3: {}\n'
             'test4:\n'
             '  test5:\n'
             '  - test6: str\n'
@@ -288,3 +315,118 @@ class TestMarkDownUtils(unittest.TestCase):
         self.md_utils.create_md_file()
         with open(os.path.join(self.test_folder_path, self.file_name), 'r') as file:
             self.assertEqual(file.read(), content)
+
+    def test_iter_attributes(self) -> None:
+        schema: Schema = copy.deepcopy(mock_schema)
+        self.md_utils.generate_attributes('TestClass', schema)
+        self.assertEqual(''.join(self.md_utils.iter_attributes('TestClass', schema)), self.md_utils.content)
+
+    def test_render_attributes_frozen(self) -> None:
+        class UpperCaseTypes(MarkDownUtils):
+            def _generate_type(self, attribute_type: str) -> str:
+                return super()._generate_type(attribute_type).upper()
+
+        schema = freeze({'x': {'type': 'string'}})
+        rendered = self.md_utils.render_attributes('TestClass', schema)
+        self.assertEqual(rendered, ''.join(self.md_utils.iter_attributes('TestClass', schema)))
+        for md_utils in (UpperCaseTypes(self.file_name), MarkDownUtils(self.file_name)):
+            with self.subTest(type(md_utils).__name__):
+                self.assertEqual(
+                    md_utils.render_attributes('TestClass', schema),
+                    ''.join(md_utils.iter_attributes('TestClass', dict(schema)))
+                )
+        self.assertIn('STRING', UpperCaseTypes(self.file_name).render_attributes('TestClass', schema))
+        self.assertEqual(self.md_utils.render_attributes('TestClass', schema), rendered)
+        self.assertEqual(
+            UpperCaseTypes(self.file_name).render_schema_example(schema),
+            MarkDownUtils(self.file_name).render_schema_example(schema)
+        )
+
+    def test_iter_schema_example(self) -> None:
+        long_default = ' '.join(['word'] * 40)
+        schemas: Dict[str, Schema] = {
+            'mock schema': copy.deepcopy(mock_schema),
+            'empty schema': {},
+            'defaults': {
+                'text': {'type': 'string', 'default': long_default},
+                'items': {'type': 'list', 'default': ['a', 'b']},
+                'mapping': {'type': 'dict', 'default': {'key': 'value'}, 'schema': {'key': {'type': 'string'}}},
+                'date': {'type': 'date'},
+            },
+            'nested lists': {
+                'outer': {'type': 'list', 'schema': {'type': 'dict', 'schema': {
+                    'inner': {'type': 'list', 'schema': {'type': 'dict', 'schema': {
+                        'b': {'type': 'integer'},
+                        'a': {'type': 'string', 'default': long_default},
+                    }}},
+                    'flag': {'type': 'boolean'},
+                }}},
+                'scalars': {'type': 'list', 'schema': {'type': 'integer'}},
+            },
+            'keys that need quoting': {
+                key: {'type': 'dict', 'schema': {
+                    key: {'type': 'list', 'schema': {'type': 'dict', 'schema': {
+                        key: {'type': 'string', 'default': 'first\n\nsecond line'},
+                    }}},
+                }}
+                for key in ('null', 'true', '1', 'k:', '- item', '#comment', "it's", 'multi\nline', 'x' * 130, '')
+            },
+        }
+        for name, schema in schemas.items():
+            with self.subTest(name):
+                self.md_utils.generate_schema_example(schema)
+                self.assertEqual(''.join(self.md_utils.iter_schema_example(schema)), self.md_utils.content)
+                self.md_utils.content = ''
+
+    def test_iter_schema_example_matches_yaml_dump(self) -> None:
+        keys = ['a', 'null', 'true', '1', 'k:', '- x', '#c', 'a b', "it's", 'x\ny', ' lead', '', '{x}', '*ref']
+        values = ['str', 'hello: world', 'x\n\ny', 'line\nnext', '', ' ', 'null', ' '.join(['word'] * 30), '\t']
+
+        def random_schema(rng: random.Random, depth: int) -> Schema:
+            schema: Schema = {}
+            for key in rng.sample(keys, rng.randint(1, 4)):
+                kind = rng.random() if depth < 3 else 1
+                if kind < 0.25:
+                    schema[key] = {'type': 'dict', 'schema': random_schema(rng, depth + 1)}
+                elif kind < 0.4:
+                    schema[key] = {'type': 'list', 'minlength': rng.randint(1, 2), 'schema': {
+                        'type': 'dict', 'schema': random_schema(rng, depth + 1)
+                    }}
+                else:
+                    schema[key] = {'type': 'string', 'default': rng.choice(values)}
+            return schema
+
+        for seed in range(300):
+            schema = random_schema(random.Random(seed), 0)
+            self.assertEqual(
+                ''.join(self.md_utils._iter_schema_example_yaml(schema)),
+                yaml.dump(self.md_utils.example_dict(schema)),
+                f'seed {seed}'
+            )
+
+    def test_stream_to(self) -> None:
+        schema: Schema = copy.deepcopy(mock_schema)
+        self.md_utils.generate_header('TestClass', level=2)
+        self.md_utils.generate_attributes('TestClass', schema)
+        self.md_utils.generate_schema_example(schema)
+        file = io.StringIO()
+        self.md_utils.stream_to(file, 'TestClass', schema)
+        self.assertEqual(file.getvalue(), self.md_utils.content)
+
+    def test_links_match_headings(self) -> None:
+        content = self.md_utils.render('TestClass', [mock_schema])
+        headings = {anchor(line.lstrip('#').strip()) for line in content.splitlines() if line.startswith('#')}
+        links = re.findall(r'\]\(#([^)]+)\)', content)
+        self.assertTrue(links)
+        self.assertTrue(set(links) <= headings)
+
+    def test_shared_nested_schema(self) -> None:
+        address: Schema = {'street': {'type': 'string'}}
+        schema: Schema = {
+            'billing': {'type': 'dict', 'schema': address},
+            'shipping': {'type': 'dict', 'schema': address},
+        }
+        content = ''.join(self.md_utils.iter_attributes('Order', schema))
+        self.assertEqual(content.count('## OrderBilling'), 1)
+        self.assertNotIn('## OrderShipping', content)
+        self.assertEqual(content.count('[OrderBilling](#orderbilling)'), 2)
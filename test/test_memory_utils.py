@@ -0,0 +1,64 @@
+import os
+import sys
+import types
+import tempfile
+import sysconfig
+import unittest
+
+from cerberus_docs.utils.memory import evict_modules, evicting_modules, current_rss, peak_rss, format_rss
+
+
+class TestMemoryUtils(unittest.TestCase):
+    def tearDown(self) -> None:
+        for module_name in ['evict_test', 'evict_test.child', 'evict_test_kept', 'evict_test_kept.child',
+                            'evict_test_third_party']:
+            sys.modules.pop(module_name, None)
+
+    def test_evict_modules(self) -> None:
+        with self.subTest('new modules are removed'):
+            before = dict(sys.modules)
+            sys.modules['evict_test'] = types.ModuleType('evict_test')
+            sys.modules['evict_test.child'] = types.ModuleType('evict_test.child')
+            self.assertEqual(sorted(evict_modules(before)), ['evict_test', 'evict_test.child'])
+            self.assertNotIn('evict_test', sys.modules)
+            self.assertNotIn('evict_test.child', sys.modules)
+        with self.subTest('replaced modules are restored'):
+            original = sys.modules['evict_test'] = types.ModuleType('evict_test')
+            before = dict(sys.modules)
+            sys.modules['evict_test'] = types.ModuleType('evict_test')
+            self.assertEqual(evict_modules(before), ['evict_test'])
+            self.assertIs(sys.modules['evict_test'], original)
+        with self.subTest('allow-listed modules are kept'):
+            before = dict(sys.modules)
+            sys.modules['evict_test_kept'] = types.ModuleType('evict_test_kept')
+            sys.modules['evict_test_kept.child'] = types.ModuleType('evict_test_kept.child')
+            self.assertEqual(evict_modules(before, ['evict_test_kept']), [])
+            self.assertIn('evict_test_kept.child', sys.modules)
+
+    def test_evict_modules_in_directory(self) -> None:
+        source_dir = os.path.join(tempfile.gettempdir(), 'evict_test_source')
+        site_packages = sysconfig.get_paths()['purelib']
+        before = dict(sys.modules)
+        sys.modules['evict_test'] = types.ModuleType('evict_test')
+        sys.modules['evict_test'].__file__ = os.path.join(source_dir, 'evict_test.py')
+        sys.modules['evict_test_third_party'] = types.ModuleType('evict_test_third_party')
+        sys.modules['evict_test_third_party'].__file__ = os.path.join(
+            site_packages, 'evict_test_third_party', '__init__.py'
+        )
+        sys.modules['evict_test_kept'] = types.ModuleType('evict_test_kept')
+        self.assertEqual(evict_modules(before, directory=source_dir), ['evict_test'])
+        self.assertIn('evict_test_third_party', sys.modules)
+        self.assertIn('evict_test_kept', sys.modules)
+
+    def test_evicting_modules(self) -> None:
+        sys.modules.pop('test.__mocks__.mock_folder_1.mock_file_1', None)
+        with evicting_modules():
+            import test.__mocks__.mock_folder_1.mock_file_1  # noqa: F401
+            self.assertIn('test.__mocks__.mock_folder_1.mock_file_1', sys.modules)
+        self.assertNotIn('test.__mocks__.mock_folder_1.mock_file_1', sys.modules)
+
+    def test_rss(self) -> None:
+        self.assertGreater(peak_rss() or 1, 0)
+        self.assertGreater(current_rss() or 1, 0)
+        self.assertEqual(format_rss(None), 'unavailable')
+        self.assertEqual(format_rss(3 * 1024 * 1024), '3.0 MiB')
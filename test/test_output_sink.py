@@ -0,0 +1,69 @@
+import os
+import gzip
+import shutil
+import tarfile
+import zipfile
+import unittest
+
+from cerberus_docs import CerberusDocsException
+from cerberus_docs.classes.output_sink import DirectorySink, TarSink, ZipSink, open_output
+
+
+class TestOutputSink(unittest.TestCase):
+    def setUp(self) -> None:
+        self.current_dir = os.path.dirname(os.path.realpath(__file__))
+        self.test_folder: str = 'test_dir'
+        self.test_folder_path = os.path.join(self.current_dir, self.test_folder)
+        os.mkdir(self.test_folder_path)
+        self.documents = {'A_cerberus_doc.md': '\n## A\n\nå\n', 'B_cerberus_doc.md': '\n## B\n'}
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.test_folder_path)
+
+    def _write(self, sink) -> None:
+        for file_name, content in self.documents.items():
+            sink.write(file_name, content)
+        sink.close()
+
+    def test_directory_sink(self) -> None:
+        self._write(DirectorySink(self.test_folder_path))
+        self.assertEqual(sorted(os.listdir(self.test_folder_path)), sorted(self.documents))
+        with open(os.path.join(self.test_folder_path, 'A_cerberus_doc.md'), encoding='utf-8') as file:
+            self.assertEqual(file.read(), self.documents['A_cerberus_doc.md'])
+
+    def test_directory_sink_precompress(self) -> None:
+        self._write(DirectorySink(self.test_folder_path, precompress=True))
+        gzip_path = os.path.join(self.test_folder_path, 'A_cerberus_doc.md.gz')
+        with gzip.open(gzip_path, 'rt', encoding='utf-8') as file:
+            self.assertEqual(file.read(), self.documents['A_cerberus_doc.md'])
+        with self.subTest('compressed output is reproducible'):
+            with open(gzip_path, 'rb') as file:
+                data = file.read()
+            self._write(DirectorySink(self.test_folder_path, precompress=True))
+            with open(gzip_path, 'rb') as file:
+                self.assertEqual(file.read(), data)
+
+    def test_zip_sink(self) -> None:
+        archive_path = os.path.join(self.test_folder_path, 'docs.zip')
+        self._write(ZipSink(archive_path))
+        with zipfile.ZipFile(archive_path) as archive:
+            self.assertEqual(sorted(archive.namelist()), sorted(self.documents))
+            self.assertEqual(archive.read('A_cerberus_doc.md').decode('utf-8'), self.documents['A_cerberus_doc.md'])
+
+    def test_tar_sink(self) -> None:
+        for archive_name in ['docs.tar', 'docs.tar.gz', 'docs.tgz']:
+            with self.subTest(archive_name):
+                archive_path = os.path.join(self.test_folder_path, archive_name)
+                self._write(TarSink(archive_path))
+                with tarfile.open(archive_path) as archive:
+                    self.assertEqual(sorted(archive.getnames()), sorted(self.documents))
+                    content = archive.extractfile('A_cerberus_doc.md').read().decode('utf-8')
+                    self.assertEqual(content, self.documents['A_cerberus_doc.md'])
+
+    def test_open_output(self) -> None:
+        self.assertIsInstance(open_output(self.test_folder_path), DirectorySink)
+        self.assertIsInstance(open_output(self.test_folder_path, 'docs.zip'), ZipSink)
+        self.assertIsInstance(open_output(self.test_folder_path, 'docs.tar.gz'), TarSink)
+        self.assertRaises(CerberusDocsException, open_output, self.test_folder_path, 'docs.rar')
+        self.assertRaises(CerberusDocsException, open_output, self.test_folder_path, 'docs.zip', precompress=True)
+        self.assertFalse(os.path.exists('docs.zip'))
@@ -0,0 +1,153 @@
+import os
+import shutil
+import unittest
+from unittest import mock
+
+from cerberus_docs import SchemaCache
+from cerberus_docs.classes.compact_schema import CompactSchema
+from cerberus_docs.classes.schema_cache import CACHE_HEADER, MemorySchemaCache
+
+
+class TestSchemaCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.current_dir = os.path.dirname(os.path.realpath(__file__))
+        self.test_folder: str = 'test_dir'
+        self.test_folder_path = os.path.join(self.current_dir, self.test_folder)
+        self.cache_dir = os.path.join(self.test_folder_path, 'cache')
+        self.source_path = os.path.join(self.test_folder_path, 'source.py')
+        os.mkdir(self.test_folder_path)
+        with open(self.source_path, 'w') as source:
+            source.write('x = 1\n')
+        self.schema_map = {'Foo': [{'name': {'type': 'string'}}]}
+        self.cache = SchemaCache(self.cache_dir)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.test_folder_path)
+
+    def test_constructor(self) -> None:
+        self.assertTrue(os.path.isdir(self.cache_dir))
+
+    def test_get_missing(self) -> None:
+        self.assertIsNone(self.cache.get(self.source_path))
+
+    def test_put_and_get(self) -> None:
+        self.assertTrue(self.cache.put(self.source_path, self.schema_map))
+        self.assertEqual(self.cache.get(self.source_path), self.schema_map)
+
+    def test_invalidated_by_source_change(self) -> None:
+        self.cache.put(self.source_path, self.schema_map)
+        with open(self.source_path, 'a') as source:
+            source.write('y = 2\n')
+        self.assertIsNone(self.cache.get(self.source_path))
+
+    def test_invalidated_by_dependency_change(self) -> None:
+        dependency_path = os.path.join(self.test_folder_path, 'fragments.py')
+        with open(dependency_path, 'w') as dependency:
+            dependency.write('FIELDS = {}\n')
+        self.cache.put(self.source_path, self.schema_map, [dependency_path])
+        self.assertEqual(self.cache.lookup(self.source_path), (self.schema_map, [dependency_path]))
+        with open(dependency_path, 'a') as dependency:
+            dependency.write("FIELDS['id'] = {'type': 'integer'}\n")
+        self.assertIsNone(self.cache.get(self.source_path))
+        self.assertEqual(list(self.cache.entries()), [(self.source_path, None)])
+        with self.subTest('deleted dependency'):
+            self.cache.put(self.source_path, self.schema_map, [dependency_path])
+            os.remove(dependency_path)
+            self.assertIsNone(self.cache.get(self.source_path))
+
+    def test_put_unpicklable(self) -> None:
+        schema_map = {'Foo': [{'name': {'coerce': lambda value: value}}]}
+        self.assertFalse(self.cache.put(self.source_path, schema_map))
+        self.assertIsNone(self.cache.get(self.source_path))
+
+    def test_ignores_other_format(self) -> None:
+        self.cache.put(self.source_path, self.schema_map)
+        entry_path = self.cache._entry_path(self.source_path)
+        with open(entry_path, 'r+b') as entry_file:
+            entry_file.write(b'XXXX')
+        self.assertIsNone(self.cache.get(self.source_path))
+
+    def test_header(self) -> None:
+        self.cache.put(self.source_path, self.schema_map)
+        with open(self.cache._entry_path(self.source_path), 'rb') as entry_file:
+            self.assertEqual(entry_file.read(len(CACHE_HEADER)), CACHE_HEADER)
+
+    def test_put_write_failure(self) -> None:
+        with mock.patch('os.replace', side_effect=OSError('disk full')):
+            self.assertRaises(OSError, self.cache.put, self.source_path, self.schema_map)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_entries(self) -> None:
+        self.cache.put(self.source_path, self.schema_map)
+        with self.subTest('valid entry'):
+            self.assertEqual(list(self.cache.entries()), [(self.source_path, self.schema_map)])
+            self.assertEqual(list(self.cache.entries(self.test_folder_path)), [(self.source_path, self.schema_map)])
+        with self.subTest('outside the source directory'):
+            self.assertEqual(list(self.cache.entries(self.cache_dir)), [])
+            self.assertEqual(list(self.cache.entries(self.test_folder_path + '_other')), [])
+        with self.subTest('changed entry'):
+            with open(self.source_path, 'a') as source:
+                source.write('y = 2\n')
+            self.assertEqual(list(self.cache.entries()), [(self.source_path, None)])
+        with self.subTest('deleted source'):
+            os.remove(self.source_path)
+            self.assertEqual(list(self.cache.entries()), [])
+
+
+class TestMemorySchemaCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.current_dir = os.path.dirname(os.path.realpath(__file__))
+        self.test_folder_path = os.path.join(self.current_dir, 'test_dir')
+        self.source_path = os.path.join(self.test_folder_path, 'source.py')
+        os.mkdir(self.test_folder_path)
+        with open(self.source_path, 'w') as source:
+            source.write('x = 1\n')
+        self.schema_map = {'Foo': [{'name': {'type': 'string'}}]}
+        self.cache = MemorySchemaCache()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.test_folder_path)
+
+    def test_put_and_get(self) -> None:
+        self.assertIsNone(self.cache.get(self.source_path))
+        self.cache.put(self.source_path, self.schema_map)
+        self.assertEqual(self.cache.get(self.source_path), self.schema_map)
+        self.assertEqual(len(self.cache), 1)
+
+    def test_entries_are_compact_copies(self) -> None:
+        address = {'street': {'type': 'string'}}
+        schema_map = {'Order': [{'billing': {'type': 'dict', 'schema': address},
+                                 'shipping': {'type': 'dict', 'schema': address}}]}
+        self.cache.put(self.source_path, schema_map)
+        self.assertIsInstance(self.cache._entries[self.source_path][1]['Order'][0], CompactSchema)
+        cached = self.cache.get(self.source_path)
+        self.assertEqual(cached, schema_map)
+        self.assertIs(cached['Order'][0]['billing']['schema'], cached['Order'][0]['shipping']['schema'])
+        cached['Order'][0]['billing']['type'] = 'list'
+        address['street']['type'] = 'integer'
+        self.assertEqual(self.cache.get(self.source_path)['Order'][0]['billing'], {
+            'type': 'dict', 'schema': {'street': {'type': 'string'}}
+        })
+
+    def test_invalidated_by_source_change(self) -> None:
+        self.cache.put(self.source_path, self.schema_map)
+        with open(self.source_path, 'a') as source:
+            source.write('y = 2\n')
+        self.assertIsNone(self.cache.get(self.source_path))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_invalidated_by_dependency_change(self) -> None:
+        dependency_path = os.path.join(self.test_folder_path, 'fragments.py')
+        with open(dependency_path, 'w') as dependency:
+            dependency.write('FIELDS = {}\n')
+        self.cache.put(self.source_path, self.schema_map, [dependency_path])
+        self.assertEqual(self.cache.get(self.source_path), self.schema_map)
+        with open(dependency_path, 'a') as dependency:
+            dependency.write("FIELDS['id'] = {'type': 'integer'}\n")
+        self.assertIsNone(self.cache.get(self.source_path))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_clear(self) -> None:
+        self.cache.put(self.source_path, self.schema_map)
+        self.cache.clear()
+        self.assertIsNone(self.cache.get(self.source_path))
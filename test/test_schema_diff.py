@@ -0,0 +1,106 @@
+import copy
+import json
+import unittest
+from unittest import mock
+
+from cerberus_docs.classes.schema_snapshot import SchemaSnapshot
+from cerberus_docs.utils import schema_diff
+from cerberus_docs.utils.schema_diff import SubtreeHasher, diff_snapshots, format_diff_markdown, format_diff_json
+
+
+def create_snapshot(classes) -> SchemaSnapshot:
+    snapshot = SchemaSnapshot()
+    snapshot.add(classes)
+    return snapshot
+
+
+class TestSchemaDiff(unittest.TestCase):
+    def setUp(self) -> None:
+        self.classes = {
+            'Address': [{
+                'street': {'type': 'string', 'required': True},
+                'country': {'type': 'string', 'allowed': ['NL', 'SE']},
+                'geo': {'type': 'dict', 'schema': {'lat': {'type': 'float'}, 'lng': {'type': 'float'}}},
+                'lines': {'type': 'list', 'schema': {'type': 'dict', 'schema': {'text': {'type': 'string'}}}},
+            }],
+            'Removed': [{'name': {'type': 'string'}}],
+        }
+        self.old = create_snapshot(self.classes)
+
+    def test_subtree_hasher(self) -> None:
+        hasher = SubtreeHasher()
+        self.assertTrue(hasher.equal({'a': [1, {'b': None}], 'c': 'd'}, {'c': 'd', 'a': [1, {'b': None}]}))
+        self.assertEqual(self.old.hashes['Address'], hasher.hash(self.old.schemas('Address')).hex())
+        self.assertFalse(hasher.equal([1, 2], [2, 1]))
+        self.assertFalse(hasher.equal({'a': 1}, {'a': '1'}))
+        self.assertFalse(hasher.equal({'a': [1]}, {'a': 1}))
+
+    def test_diff_snapshots_equal(self) -> None:
+        new = create_snapshot(self.classes)
+        self.assertEqual(diff_snapshots(self.old, new), [])
+
+    def test_diff_snapshots(self) -> None:
+        new = create_snapshot({
+            'Address': [{
+                'street': {'type': 'string', 'required': False},
+                'country': {'type': 'string', 'allowed': ['NL', 'SE', 'DK']},
+                'geo': {'type': 'dict', 'schema': {'lat': {'type': 'float'}, 'lng': {'type': 'number'}}},
+                'lines': {'type': 'list', 'schema': {'type': 'dict', 'schema': {'text': {'type': 'string'}}}},
+                'zip': {'type': 'string'},
+            }],
+            'Added': [{'name': {'type': 'string'}}],
+        })
+        changes = diff_snapshots(self.old, new)
+        self.assertEqual(
+            [(change['change'], change['class'], change['path'], change['rule']) for change in changes],
+            [
+                ('added', 'Added', '', None),
+                ('changed', 'Address', 'country', 'allowed'),
+                ('changed', 'Address', 'geo.lng', 'type'),
+                ('changed', 'Address', 'street', 'required'),
+                ('added', 'Address', 'zip', None),
+                ('removed', 'Removed', '', None),
+            ]
+        )
+        self.assertEqual(changes[1]['old'], ['NL', 'SE'])
+        self.assertEqual(changes[1]['new'], ['NL', 'SE', 'DK'])
+
+    def test_diff_snapshots_nested_list(self) -> None:
+        classes = copy.deepcopy(self.classes)
+        classes['Address'][0]['lines']['schema']['schema']['text']['maxlength'] = 80
+        new = create_snapshot(classes)
+        changes = diff_snapshots(self.old, new)
+        self.assertEqual([(change['path'], change['rule']) for change in changes], [('lines[].text', 'maxlength')])
+
+    def test_diff_snapshots_multiple_schemas(self) -> None:
+        old = create_snapshot({'Foo': [{'a': {'type': 'string'}}, {'b': {'type': 'string'}}]})
+        new = create_snapshot({'Foo': [{'a': {'type': 'string'}}]})
+        changes = diff_snapshots(old, new)
+        self.assertEqual([(change['change'], change['path']) for change in changes], [('removed', '[1]')])
+        new = create_snapshot({'Foo': [{'a': {'type': 'string'}}, {'b': {'type': 'integer'}}]})
+        self.assertEqual([change['path'] for change in diff_snapshots(old, new)], ['[1].b'])
+
+    def test_diff_snapshots_skips_equal_subtrees(self) -> None:
+        classes = copy.deepcopy(self.classes)
+        classes['Address'][0]['street']['required'] = False
+        new = create_snapshot(classes)
+        with mock.patch.object(schema_diff, '_diff_attribute', wraps=schema_diff._diff_attribute) as diff_attribute:
+            diff_snapshots(self.old, new)
+        self.assertEqual([call[0][2] for call in diff_attribute.call_args_list], ['street'])
+
+    def test_format_diff(self) -> None:
+        address = dict(self.classes['Address'][0], zip={'type': 'string'})
+        address['street'] = {'type': 'string', 'required': False}
+        new = create_snapshot({'Address': [address]})
+        changes = diff_snapshots(self.old, new)
+        with self.subTest('markdown'):
+            self.assertEqual(format_diff_markdown(changes), (
+                '\n## Address\n\n'
+                '- changed rule `required` of `street`: `true` to `false`\n'
+                '- added attribute `zip`\n'
+                '\n## Removed\n\n'
+                '- removed class\n'
+            ))
+            self.assertEqual(format_diff_markdown([]), 'No schema changes.\n')
+        with self.subTest('json'):
+            self.assertEqual(json.loads(format_diff_json(changes))['changes'], changes)
@@ -0,0 +1,57 @@
+import os
+import json
+import shutil
+import unittest
+
+from cerberus_docs import CerberusDocsException
+from cerberus_docs.classes.schema_snapshot import SchemaSnapshot, SNAPSHOT_FILE_NAME, SNAPSHOT_FORMAT_VERSION
+
+
+def check_even(field, value, error) -> None:
+    pass
+
+
+class TestSchemaSnapshot(unittest.TestCase):
+    def setUp(self) -> None:
+        self.current_dir = os.path.dirname(os.path.realpath(__file__))
+        self.test_folder: str = 'test_dir'
+        self.test_folder_path = os.path.join(self.current_dir, self.test_folder)
+        os.mkdir(self.test_folder_path)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.test_folder_path)
+
+    def test_add(self) -> None:
+        snapshot = SchemaSnapshot()
+        snapshot.add({'Foo': [{'number': {'type': 'integer', 'check_with': check_even, 'allowed': (1, 2)}}]})
+        self.assertEqual(snapshot.schemas('Foo'), [{'number': {
+            'type': 'integer', 'check_with': 'test.test_schema_snapshot.check_even', 'allowed': [1, 2]
+        }}])
+        self.assertEqual(list(snapshot.hashes), ['Foo'])
+
+    def test_add_qualified(self) -> None:
+        snapshot = SchemaSnapshot()
+        snapshot.add({'User': [{'name': {'type': 'string'}}]}, 'models.user')
+        snapshot.add({'User': [{'id': {'type': 'integer'}}]}, 'api.user')
+        self.assertEqual(sorted(snapshot.hashes), ['api.user.User', 'models.user.User'])
+        self.assertEqual(snapshot.schemas('models.user.User'), [{'name': {'type': 'string'}}])
+        self.assertEqual(snapshot.schemas('api.user.User'), [{'id': {'type': 'integer'}}])
+
+    def test_write_read(self) -> None:
+        snapshot = SchemaSnapshot()
+        snapshot.add({'Foo': [{'name': {'type': 'string'}}], 'Bar': [{}]})
+        snapshot_path = snapshot.write(self.test_folder_path)
+        self.assertEqual(snapshot_path, os.path.join(self.test_folder_path, SNAPSHOT_FILE_NAME))
+        with self.subTest('from build directory'):
+            read_snapshot = SchemaSnapshot.read(self.test_folder_path)
+            self.assertEqual(read_snapshot.hashes, snapshot.hashes)
+            self.assertEqual(read_snapshot.schemas('Foo'), [{'name': {'type': 'string'}}])
+            self.assertEqual(read_snapshot.schemas('Bar'), [{}])
+        with self.subTest('from snapshot file'):
+            self.assertEqual(SchemaSnapshot.read(snapshot_path).hashes, snapshot.hashes)
+        with self.subTest('missing snapshot'):
+            self.assertRaises(CerberusDocsException, SchemaSnapshot.read, os.path.join(self.test_folder_path, 'x'))
+        with self.subTest('unsupported version'):
+            with open(snapshot_path, 'w') as snapshot_file:
+                snapshot_file.write(json.dumps({'version': SNAPSHOT_FORMAT_VERSION + 1}) + '\n')
+            self.assertRaises(CerberusDocsException, SchemaSnapshot.read, snapshot_path)
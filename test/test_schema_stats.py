@@ -0,0 +1,68 @@
+import os
+import csv
+import json
+import shutil
+import unittest
+
+from cerberus_docs import MarkDownUtils, CerberusDocsException
+from cerberus_docs.classes.schema_stats import STATS_FIELDS, SchemaCounters, SchemaStats
+from test.__mocks__.mock_schema import mock_schema
+
+
+class TestSchemaStats(unittest.TestCase):
+    def setUp(self) -> None:
+        self.current_dir = os.path.dirname(os.path.realpath(__file__))
+        self.test_folder: str = 'test_dir'
+        self.test_folder_path = os.path.join(self.current_dir, self.test_folder)
+        os.mkdir(self.test_folder_path)
+        self.stats = SchemaStats()
+        self.md_utils = MarkDownUtils('', stats=self.stats)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.test_folder_path)
+
+    def test_render_counts(self) -> None:
+        small_schema = {'name': {'type': 'string'}}
+        content = self.md_utils.render('Foo', [mock_schema, small_schema])
+        self.assertEqual(content, MarkDownUtils('').render('Foo', [mock_schema, small_schema]))
+
+        first, second = self.stats.counters
+        self.assertEqual((first.class_name, first.schema_index), ('Foo', 0))
+        self.assertEqual(first.attributes, 7)
+        self.assertEqual(first.max_depth, 3)
+        self.assertEqual(first.nested_sections, 2)
+        self.assertEqual(first.allowed_values, 2)
+        self.assertEqual(first.max_allowed, 2)
+        self.assertGreater(first.attributes_seconds, 0)
+        self.assertGreater(first.example_seconds, 0)
+        self.assertEqual((second.attributes, second.max_depth, second.nested_sections), (1, 1, 0))
+        self.assertEqual(first.rendered_bytes + second.rendered_bytes, len(content.encode('utf-8')))
+
+    def test_rows(self) -> None:
+        self.md_utils.render('Small', [{'name': {'type': 'string'}}])
+        self.md_utils.render('Large', [mock_schema])
+        self.assertEqual([row['class'] for row in self.stats.rows()], ['Large', 'Small'])
+        self.assertEqual([row['class'] for row in self.stats.rows('class')], ['Large', 'Small'])
+        self.assertEqual(list(self.stats.rows()[0]), list(STATS_FIELDS))
+        with self.subTest('unknown field'):
+            with self.assertRaises(CerberusDocsException) as context:
+                self.stats.rows('size')
+            self.assertIn('Unknown stats field size', context.exception.message)
+
+    def test_write(self) -> None:
+        counters = SchemaCounters('Foo', 0)
+        counters.count_attribute({'type': 'string', 'allowed': ['a', 'b', 'c']}, 2)
+        self.stats.add(counters)
+
+        csv_path = os.path.join(self.test_folder_path, 'stats.csv')
+        self.stats.write(csv_path)
+        with open(csv_path, newline='') as csv_file:
+            rows = list(csv.DictReader(csv_file))
+        self.assertEqual(rows[0]['class'], 'Foo')
+        self.assertEqual(rows[0]['max_depth'], '2')
+        self.assertEqual(rows[0]['max_allowed'], '3')
+
+        json_path = os.path.join(self.test_folder_path, 'stats.json')
+        self.stats.write(json_path)
+        with open(json_path) as json_file:
+            self.assertEqual(json.load(json_file)['schemas'], [counters.to_dict()])
@@ -0,0 +1,136 @@
+import os
+import shutil
+import sqlite3
+import unittest
+
+from cerberus_docs import CerberusDocsException
+from cerberus_docs.classes.link_index import nested_sections
+from cerberus_docs.classes.search_index import SearchIndex
+from test.__mocks__.mock_schema import mock_schema
+
+
+class TestSearchIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.current_dir = os.path.dirname(os.path.realpath(__file__))
+        self.test_folder: str = 'test_dir'
+        self.test_folder_path = os.path.join(self.current_dir, self.test_folder)
+        self.database_path = os.path.join(self.test_folder_path, 'search.db')
+        os.mkdir(self.test_folder_path)
+        self.orders = {'Order': [{
+            'customer_id': {'type': 'integer', 'required': True, 'meta': {'description': 'Customer placing the order'}},
+            'status': {'type': 'string', 'allowed': ['open', 'paid']},
+        }]}
+        self.customers = {'Customer': [mock_schema]}
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.test_folder_path)
+
+    def _build(self, schema_maps) -> SearchIndex:
+        search_index = SearchIndex(self.database_path)
+        for source_name, schema_map in schema_maps.items():
+            search_index.add(source_name, schema_map, {class_name: f'{class_name}.md' for class_name in schema_map})
+        search_index.close()
+        return search_index
+
+    def _query(self, sql: str):
+        connection = sqlite3.connect(self.database_path)
+        try:
+            return connection.execute(sql).fetchall()
+        finally:
+            connection.close()
+
+    def test_rows(self) -> None:
+        rows = SearchIndex.rows('customers.py', self.customers, {'Customer': 'Customer.md'})
+        self.assertEqual([(row[1], row[4]) for row in rows], [
+            ('class', ''),
+            ('attribute', 'test1'),
+            ('attribute', 'test2'),
+            ('attribute', 'test3'),
+            ('attribute', 'test4'),
+            ('schema', 'test4'),
+            ('attribute', 'test4.test5'),
+            ('schema', 'test4.test5'),
+            ('attribute', 'test4.test5[].test6'),
+            ('attribute', 'test4.test5[].test7'),
+        ])
+        self.assertEqual(rows[0], (
+            'customers.py', 'class', 'Customer', 0, '', 'Customer', None, None, None, None, None, 'Customer.md'
+        ))
+        self.assertEqual(rows[1], (
+            'customers.py', 'attribute', 'Customer', 0, 'test1', None, 'string', 1, '["v0", "v1"]', None,
+            'This is a description for test1', 'Customer.md'
+        ))
+        self.assertEqual(
+            [row[5] for row in rows if row[1] == 'schema'], list(nested_sections('Customer', mock_schema))
+        )
+
+        with self.subTest('shared nested schema'):
+            address = {'street': {'type': 'string'}}
+            rows = SearchIndex.rows('orders.py', {'Order': [{
+                'billing': {'type': 'dict', 'schema': address},
+                'shipping': {'type': 'dict', 'schema': address},
+            }]}, {'Order': 'Order.md'})
+            self.assertEqual([(row[4], row[5]) for row in rows if row[1] == 'schema'], [
+                ('billing', 'OrderBilling'), ('shipping', 'OrderBilling')
+            ])
+            self.assertIn('shipping.street', [row[4] for row in rows])
+
+    def test_search(self) -> None:
+        self._build({'orders.py': self.orders, 'customers.py': self.customers})
+        results = SearchIndex.search(self.database_path, 'customer_id')
+        self.assertEqual([(result['class'], result['path']) for result in results], [('Order', 'customer_id')])
+        self.assertEqual(results[0]['kind'], 'attribute')
+        self.assertEqual(results[0]['document'], 'Order.md')
+        self.assertEqual(results[0]['required'], 1)
+        self.assertEqual(
+            [result['path'] for result in SearchIndex.search(self.database_path, 'description:test5')], ['test4.test5']
+        )
+        self.assertEqual(
+            [(result['kind'], result['path']) for result in SearchIndex.search(self.database_path, 'title:Customer')],
+            [('class', '')]
+        )
+        self.assertEqual(
+            [(result['kind'], result['path']) for result in SearchIndex.search(self.database_path, 'CustomerTest4')],
+            [('schema', 'test4')]
+        )
+        with self.assertRaises(CerberusDocsException):
+            SearchIndex.search(self.database_path, 'unknown_column:x')
+        missing_path = os.path.join(self.test_folder_path, 'missing.sqlite3')
+        with self.assertRaisesRegex(CerberusDocsException, 'not found'):
+            SearchIndex.search(missing_path, 'customer_id')
+        self.assertFalse(os.path.exists(missing_path))
+
+    def test_incremental(self) -> None:
+        self.assertEqual(self._build({'orders.py': self.orders, 'customers.py': self.customers}).updated_sources, 2)
+        self.assertEqual(self._build({'orders.py': self.orders, 'customers.py': self.customers}).updated_sources, 0)
+
+        self.orders['Order'][0]['total'] = {'type': 'float'}
+        self.assertEqual(self._build({'orders.py': self.orders, 'customers.py': self.customers}).updated_sources, 1)
+        self.assertEqual(len(SearchIndex.search(self.database_path, 'total')), 1)
+
+        with self.subTest('removed sources'):
+            self._build({'orders.py': self.orders})
+            self.assertEqual(self._query('SELECT DISTINCT source FROM entries'), [('orders.py',)])
+            self.assertEqual(self._query('SELECT count(*) FROM entries_fts'), [(4,)])
+
+    def test_abort(self) -> None:
+        search_index = SearchIndex(self.database_path)
+        search_index.add('orders.py', self.orders, {'Order': 'Order.md'})
+        search_index.abort()
+        self.assertFalse(os.path.exists(self.database_path))
+
+        with self.subTest('existing database keeps the previous build'):
+            self._build({'orders.py': self.orders})
+            search_index = SearchIndex(self.database_path)
+            search_index.add('customers.py', self.customers, {'Customer': 'Customer.md'})
+            search_index.abort()
+            self.assertEqual(self._query('SELECT DISTINCT source FROM entries'), [('orders.py',)])
+
+        with self.subTest('unsupported version'):
+            os.remove(self.database_path)
+            connection = sqlite3.connect(self.database_path)
+            connection.executescript('CREATE TABLE search_version (version INTEGER NOT NULL);'
+                                     'INSERT INTO search_version VALUES (1);')
+            connection.close()
+            self.assertRaises(CerberusDocsException, SearchIndex, self.database_path)
+            self.assertTrue(os.path.exists(self.database_path))
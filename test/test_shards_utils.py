@@ -0,0 +1,106 @@
+import os
+import shutil
+import unittest
+
+from cerberus_docs import CerberusDocsException
+from cerberus_docs.classes.allowed_appendix import ALLOWED_APPENDIX_PREFIX
+from cerberus_docs.classes.build_manifest import BuildManifest
+from cerberus_docs.classes.schema_snapshot import SchemaSnapshot
+from cerberus_docs.utils.shards import shard_index, parse_shard, merge_shards
+
+
+class TestShardsUtils(unittest.TestCase):
+    def setUp(self) -> None:
+        self.current_dir = os.path.dirname(os.path.realpath(__file__))
+        self.test_folder: str = 'test_dir'
+        self.test_folder_path = os.path.join(self.current_dir, self.test_folder)
+        os.mkdir(self.test_folder_path)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.test_folder_path)
+
+    def _create_shard(self, name: str, shard, documents) -> str:
+        shard_dir = os.path.join(self.test_folder_path, name)
+        os.mkdir(shard_dir)
+        manifest = BuildManifest(shard)
+        for document in documents:
+            with open(os.path.join(shard_dir, document), 'w') as document_file:
+                document_file.write(f'{name} {document}')
+            manifest.add_source(f'{name}/{document}.py', [document], [document])
+        manifest.write(shard_dir)
+        return shard_dir
+
+    def test_shard_index(self) -> None:
+        with self.subTest('is stable'):
+            self.assertEqual(shard_index('pkg/module.py', 4), shard_index('pkg/module.py', 4))
+            self.assertEqual(shard_index(os.path.join('pkg', 'module.py'), 4), shard_index('pkg/module.py', 4))
+        with self.subTest('is balanced'):
+            counts = [0] * 4
+            for i in range(4000):
+                counts[shard_index(f'pkg/module_{i}.py', 4)] += 1
+            self.assertTrue(all(800 < count < 1200 for count in counts))
+
+    def test_parse_shard(self) -> None:
+        self.assertEqual(parse_shard('1/3'), (1, 3))
+        for value in ['3/3', '-1/3', '1', 'a/b', '0/0']:
+            with self.subTest(value):
+                self.assertRaises(ValueError, parse_shard, value)
+
+    def test_merge_shards(self) -> None:
+        shard_0 = self._create_shard('shard_0', (0, 2), ['A.md', 'B.md'])
+        shard_1 = self._create_shard('shard_1', (1, 2), ['C.md'])
+        build_dir = os.path.join(self.test_folder_path, 'build')
+        merged = merge_shards([shard_1, shard_0], build_dir)
+        self.assertIsNone(merged.shard)
+        self.assertEqual(merged.documents, ['A.md', 'B.md', 'C.md'])
+        self.assertEqual(BuildManifest.read(build_dir).to_dict(), merged.to_dict())
+        with open(os.path.join(build_dir, 'C.md')) as document_file:
+            self.assertEqual(document_file.read(), 'shard_1 C.md')
+
+    def test_merge_shards_snapshots(self) -> None:
+        shard_dirs = []
+        for index, module in enumerate(['a', 'b']):
+            shard_dirs.append(self._create_shard(f'shard_{index}', (index, 2), [f'{module}.A.md']))
+            snapshot = SchemaSnapshot()
+            snapshot.add({'A': [{'name': {'type': 'string'}}]}, module)
+            snapshot.write(shard_dirs[-1])
+        build_dir = os.path.join(self.test_folder_path, 'build')
+        merge_shards(shard_dirs, build_dir)
+        self.assertEqual(sorted(SchemaSnapshot.read(build_dir).hashes), ['a.A', 'b.A'])
+
+    def test_merge_shards_collision(self) -> None:
+        shard_0 = self._create_shard('shard_0', (0, 2), ['A.md'])
+        shard_1 = self._create_shard('shard_1', (1, 2), ['A.md'])
+        build_dir = os.path.join(self.test_folder_path, 'build')
+        with self.assertRaises(CerberusDocsException) as context:
+            merge_shards([shard_0, shard_1], build_dir)
+        self.assertIn('A.md', context.exception.message)
+        self.assertFalse(os.path.exists(build_dir))
+
+    def test_merge_shards_collision_in_shard(self) -> None:
+        shard_0 = self._create_shard('shard_0', (0, 2), ['A.md'])
+        shard_1 = self._create_shard('shard_1', (1, 2), ['B.md'])
+        manifest = BuildManifest.read(shard_1)
+        manifest.add_source('shard_1/other.py', ['B'], ['B.md'])
+        manifest.write(shard_1)
+        build_dir = os.path.join(self.test_folder_path, 'build')
+        with self.assertRaises(CerberusDocsException) as context:
+            merge_shards([shard_0, shard_1], build_dir)
+        self.assertIn('B.md is generated by shard_1/B.md.py', context.exception.message)
+        self.assertIn('shard_1/other.py', context.exception.message)
+        self.assertFalse(os.path.exists(build_dir))
+
+    def test_merge_shards_shared_appendix(self) -> None:
+        appendix = f'{ALLOWED_APPENDIX_PREFIX}0123.md'
+        shard_0 = self._create_shard('shard_0', (0, 2), ['A.md', appendix])
+        shard_1 = self._create_shard('shard_1', (1, 2), ['B.md', appendix])
+        build_dir = os.path.join(self.test_folder_path, 'build')
+        self.assertEqual(merge_shards([shard_0, shard_1], build_dir).documents, ['A.md', 'B.md', appendix])
+
+    def test_merge_shards_incomplete(self) -> None:
+        with self.subTest('missing shard'):
+            shard_0 = self._create_shard('shard_0', (0, 2), ['A.md'])
+            self.assertRaises(CerberusDocsException, merge_shards, [shard_0], self.test_folder_path)
+        with self.subTest('different shard counts'):
+            shard_1 = self._create_shard('shard_1', (1, 3), ['B.md'])
+            self.assertRaises(CerberusDocsException, merge_shards, [shard_0, shard_1], self.test_folder_path)
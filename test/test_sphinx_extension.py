@@ -0,0 +1,105 @@
+import os
+import io
+import copy
+import shutil
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from test.__mocks__.mock_schema import mock_schema
+
+try:
+    from docutils import nodes
+    from docutils.core import publish_doctree
+    from sphinx.application import Sphinx
+    from cerberus_docs import sphinx_extension
+except ImportError:  # pragma: no cover
+    Sphinx = None
+
+MOCK_MODULE = 'test.__mocks__.mock_folder_1.mock_file_1'
+
+
+@unittest.skipIf(Sphinx is None, 'sphinx is not installed')
+class TestSphinxExtension(unittest.TestCase):
+    def setUp(self) -> None:
+        self.current_dir = os.path.dirname(os.path.realpath(__file__))
+        self.test_folder: str = 'test_dir'
+        self.test_folder_path = os.path.join(self.current_dir, self.test_folder)
+        self.source_dir = os.path.join(self.test_folder_path, 'source')
+        self.build_dir = os.path.join(self.test_folder_path, 'build')
+        os.makedirs(self.source_dir)
+        with open(os.path.join(self.source_dir, 'conf.py'), 'w') as conf:
+            conf.write("extensions = ['cerberus_docs.sphinx_extension']\n")
+        with open(os.path.join(self.source_dir, 'index.rst'), 'w') as index:
+            index.write(f'Schemas\n=======\n\n.. cerberus-schema:: {MOCK_MODULE}.MockFileParent\n')
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.test_folder_path)
+
+    def _build(self) -> Sphinx:
+        app = Sphinx(
+            self.source_dir,
+            self.source_dir,
+            self.build_dir,
+            os.path.join(self.build_dir, '.doctrees'),
+            'text',
+            status=io.StringIO(),
+            warning=io.StringIO(),
+        )
+        app.build()
+        return app
+
+    def test_setup(self) -> None:
+        app = mock.Mock()
+        metadata = sphinx_extension.setup(app)
+        self.assertTrue(metadata['parallel_read_safe'])
+        self.assertTrue(metadata['parallel_write_safe'])
+        app.add_directive.assert_called_once_with('cerberus-schema', sphinx_extension.CerberusSchemaDirective)
+
+    def test_directive(self) -> None:
+        app = self._build()
+        self.assertEqual(app.statuscode, 0)
+        with open(os.path.join(self.build_dir, 'index.txt')) as output:
+            content = output.read()
+        self.assertIn('MockFileParent', content)
+        self.assertIn('name: str', content)
+        self.assertIn(MOCK_MODULE, app.env.cerberus_docs_schemas)
+
+    def test_get_module_schemas(self) -> None:
+        env = SimpleNamespace()
+        source_path, schema_map = sphinx_extension.get_module_schemas(env, MOCK_MODULE)
+        self.assertTrue(source_path.endswith('mock_file_1.py'))
+        self.assertEqual(list(schema_map), ['MockFileChild', 'MockFileParent'])
+        with self.subTest('unchanged module is served from the environment'):
+            with mock.patch.object(sphinx_extension, 'extract_module_schemas') as extract_module_schemas:
+                self.assertEqual(sphinx_extension.get_module_schemas(env, MOCK_MODULE)[1], schema_map)
+                extract_module_schemas.assert_not_called()
+        with self.subTest('changed module is extracted again'):
+            env.cerberus_docs_schemas[MOCK_MODULE] = (0.0, {})
+            self.assertEqual(sphinx_extension.get_module_schemas(env, MOCK_MODULE)[1], schema_map)
+
+    def test_merge_env_schemas(self) -> None:
+        env = SimpleNamespace(cerberus_docs_schemas={'a': (1.0, {})})
+        other = SimpleNamespace(cerberus_docs_schemas={'b': (2.0, {})})
+        sphinx_extension.merge_env_schemas(mock.Mock(), env, set(), other)
+        self.assertEqual(env.cerberus_docs_schemas, {'a': (1.0, {}), 'b': (2.0, {})})
+
+    def test_literal(self) -> None:
+        for value in ['plain', '^\\w+$', 'a`b', '\\d+`', 'x``y', ' a', 'a ', '', 'a\nb', 3]:
+            with self.subTest(value=value):
+                text = f'x {sphinx_extension._literal(value)} y'
+                document = publish_doctree(text, settings_overrides={'report_level': 5})
+                # findall replaces traverse from docutils 0.18 on.
+                findall = getattr(document, 'findall', document.traverse)
+                self.assertEqual(list(findall(nodes.system_message)), [])
+                (literal,) = findall(nodes.literal)
+                expected = str(value)
+                if expected != expected.strip() or not expected or not expected.isprintable():
+                    expected = repr(value)
+                self.assertEqual(literal.astext(), expected)
+
+    def test_schema_to_rst(self) -> None:
+        lines = sphinx_extension.schema_to_rst('Test', copy.deepcopy(mock_schema), 'pkg.module')
+        self.assertIn('.. rubric:: TestTest4Test5', lines)
+        self.assertIn('   **[required]** string, one of ``v0``, ``v1``', lines)
+        self.assertIn('   **[optional]** dict, `TestTest4 <pkg.module.TestTest4_>`_', lines)